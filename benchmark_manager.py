@@ -408,9 +408,7 @@ class BenchmarkManager:
         try:
             result = self._profit_calc.calculate_profit(coin, hashrate, power_watts)
             if result:
-                gross = result.get("profit_usd_day", 0.0)
-                electricity = result.get("electricity_cost_day", 0.0)
-                return gross, gross - electricity
+                return result.usd_profit_24h, result.usd_profit_24h - result.power_cost_24h
         except Exception as e:
             logger.debug(f"Profit Berechnung Fehler: {e}")
         
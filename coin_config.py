@@ -472,6 +472,15 @@ ALGORITHM_CONFIGS = {
 }
 
 
+# Flache Sicht für heiße Pfade: coin -> (pool_url, pool_name, miner, algorithm)
+# Einmal beim Import berechnet (bester Pool / bevorzugter Miner = jeweils erster Eintrag)
+COIN_FAST_CONFIG = {
+    coin: (cfg['pools'][0]['url'], cfg['pools'][0]['name'],
+           cfg['miners'][0] if cfg.get('miners') else 'trex', cfg.get('algorithm', ''))
+    for coin, cfg in COIN_CONFIGS.items() if cfg.get('pools')
+}
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -37,6 +37,13 @@ from pathlib import Path
 from urllib.parse import urlencode
 from datetime import datetime
 
+# orjson für schnelleres Parsen von wallets.json (optional)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # Konfigurationsdatei
@@ -942,29 +949,26 @@ class ExchangeManager:
         
         # NEU: Aus wallets.json laden (wichtig für Gate.io/CoinEx Wallets!)
         try:
-            import json
-            from pathlib import Path
             wallets_file = Path("wallets.json")
             if wallets_file.exists():
-                with open(wallets_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    wallets_data = data.get("wallets", {})
-                    wallet_sources = data.get("wallet_sources", {})
-                    
-                    if coin in wallets_data:
-                        # Wallet aus wallets.json erstellen
-                        source = wallet_sources.get(coin, "Manual")
-                        wallet_obj = WalletAddress(
-                            coin=coin,
-                            network=coin,
-                            address=wallets_data[coin],
-                            memo="",
-                            exchange=source,
-                            last_updated=datetime.now().isoformat()
-                        )
-                        self.wallets[coin] = wallet_obj
-                        logger.info(f"Wallet für {coin} aus wallets.json geladen ({source})")
-                        return wallet_obj
+                data = _json_loads(wallets_file.read_bytes())
+                wallets_data = data.get("wallets", {})
+                wallet_sources = data.get("wallet_sources", {})
+                
+                if coin in wallets_data:
+                    # Wallet aus wallets.json erstellen
+                    source = wallet_sources.get(coin, "Manual")
+                    wallet_obj = WalletAddress(
+                        coin=coin,
+                        network=coin,
+                        address=wallets_data[coin],
+                        memo="",
+                        exchange=source,
+                        last_updated=datetime.now().isoformat()
+                    )
+                    self.wallets[coin] = wallet_obj
+                    logger.info(f"Wallet für {coin} aus wallets.json geladen ({source})")
+                    return wallet_obj
         except Exception as e:
             logger.debug(f"wallets.json Fallback: {e}")
         
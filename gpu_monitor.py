@@ -646,6 +646,13 @@ class GPUMonitor:
         with self._lock:
             return self._current_data.copy() if self._current_data else {}
     
+    def get_latest_power_total(self) -> float:
+        """Gesamte GPU-Leistung (W) der letzten Abfrage - bereits beim Sammeln summiert"""
+        with self._lock:
+            if not self._current_data:
+                return 0.0
+            return self._current_data['totals']['power_watts']
+    
     def get_history(self) -> List[Dict[str, Any]]:
         """Gibt die Historie zurück"""
         with self._lock:
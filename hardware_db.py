@@ -166,6 +166,9 @@ class HardwareDatabase:
         # hashrate.no API Referenz
         self.hashrate_api = None
         
+        # Daten-Version (wird bei Erkennung/Sync erhöht, für Caches in der GUI)
+        self._version = 0
+        
         # Laden
         self._load_database()
     
@@ -201,6 +204,7 @@ class HardwareDatabase:
                 logger.info(f"Neue CPU erkannt: {cpu.name}")
             self.cpus[cpu_id] = cpu
         
+        self._version += 1
         self._save_database()
         return gpus, cpus
     
@@ -389,6 +393,7 @@ class HardwareDatabase:
         self.new_coins.extend(new_coins)
         
         self.last_full_sync = datetime.now()
+        self._version += 1
         self._save_database()
         
         logger.info(f"Sync abgeschlossen: {results['gpus_synced']} GPUs, {results['coins_found']} Coins")
@@ -537,10 +542,18 @@ class HardwareDatabase:
                 return gpu
         return None
     
+    def version(self) -> int:
+        """Gibt die aktuelle Daten-Version zurück (ändert sich bei Erkennung/Sync)"""
+        return self._version
+    
     def get_all_gpus(self) -> List[GPUData]:
         """Gibt alle GPUs zurück"""
         return list(self.gpus.values())
     
+    def get_mining_gpus(self, min_vram_mb: int = 2048) -> List[GPUData]:
+        """Gibt nur mining-fähige GPUs zurück (mindestens min_vram_mb VRAM, keine iGPUs)"""
+        return [gpu for gpu in self.gpus.values() if gpu.vram_mb >= min_vram_mb]
+    
     def get_all_cpus(self) -> List[CPUData]:
         """Gibt alle CPUs zurück"""
         return list(self.cpus.values())
@@ -562,6 +562,7 @@ class MinerProcess:
         
         self._process: Optional[subprocess.Popen] = None
         self._output_thread: Optional[threading.Thread] = None
+        self._exit_thread: Optional[threading.Thread] = None
         self._running = False
         
         # Callbacks
@@ -569,6 +570,7 @@ class MinerProcess:
         self.on_hashrate: Optional[Callable[[Dict[int, float]], None]] = None
         self.on_error: Optional[Callable[[str], None]] = None
         self.on_stopped: Optional[Callable[[], None]] = None
+        self.on_crashed: Optional[Callable[[int], None]] = None  # Exit-Code, nur bei unerwartetem Ende
         
         # Regex für Hashrate-Extraktion aus Log
         self._hashrate_patterns = {
@@ -633,6 +635,15 @@ class MinerProcess:
                 )
                 self._output_thread.start()
             
+            # Prozessende sofort erkennen (blockiert in wait(), kein Polling)
+            self._exit_thread = threading.Thread(
+                target=self._wait_for_exit,
+                args=(self._process,),
+                daemon=True,
+                name=f"MinerExit-{self.miner_type.value}"
+            )
+            self._exit_thread.start()
+            
             logger.info(f"Miner gestartet: PID {self._process.pid}")
             return True
             
@@ -642,12 +653,15 @@ class MinerProcess:
                 self.on_error(str(e))
             return False
     
-    def stop(self, timeout: float = 10.0) -> bool:
+    def stop(self, timeout: float = 10.0, grace: float = 0.5) -> bool:
         """
         Stoppt den Miner.
         
+        Erst sanft beenden, nach `grace` Sekunden erzwingen.
+        
         Args:
             timeout: Timeout in Sekunden
+            grace: Wartezeit bis zum erzwungenen Beenden
             
         Returns:
             True wenn sauber beendet
@@ -660,29 +674,27 @@ class MinerProcess:
         try:
             pid = self._process.pid
             
-            # Auf Windows: taskkill mit Prozessbaum (/T) und Force (/F)
+            # Auf Windows: taskkill mit Prozessbaum (/T), erst ohne Force
             if os.name == 'nt':
-                try:
-                    subprocess.run(
-                        ['taskkill', '/F', '/T', '/PID', str(pid)],
-                        capture_output=True,
-                        timeout=10
-                    )
-                    logger.info(f"Miner-Prozess {pid} mit taskkill beendet")
-                except Exception as e:
-                    logger.warning(f"taskkill fehlgeschlagen: {e}, versuche terminate()")
-                    self._process.terminate()
+                self._taskkill(pid)
             else:
-                # Auf Linux: Sanft beenden
+                # Auf Linux: Sanft beenden (SIGTERM)
                 self._process.terminate()
             
             try:
-                self._process.wait(timeout=timeout)
+                self._process.wait(timeout=grace)
                 logger.info("Miner sauber beendet")
             except subprocess.TimeoutExpired:
                 # Erzwingen
-                self._process.kill()
-                self._process.wait()
+                if os.name == 'nt':
+                    self._taskkill(pid, force=True)
+                else:
+                    self._process.kill()
+                try:
+                    self._process.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self._process.wait()
                 logger.warning("Miner musste gekillt werden")
             
             self._process = None
@@ -696,6 +708,21 @@ class MinerProcess:
             logger.error(f"Fehler beim Stoppen: {e}")
             return False
     
+    def _taskkill(self, pid: int, force: bool = False):
+        """Beendet den Prozessbaum per taskkill (Windows), bei Fehler terminate()/kill()"""
+        args = ['taskkill', '/T', '/PID', str(pid)]
+        if force:
+            args.insert(1, '/F')
+        try:
+            subprocess.run(args, capture_output=True, timeout=10)
+            logger.info(f"Miner-Prozess {pid} mit taskkill beendet{' (erzwungen)' if force else ''}")
+        except Exception as e:
+            logger.warning(f"taskkill fehlgeschlagen: {e}, versuche {'kill' if force else 'terminate'}()")
+            if force:
+                self._process.kill()
+            else:
+                self._process.terminate()
+    
     def _read_output(self):
         """Liest die Miner-Ausgabe in einem Thread"""
         if not self._process or not self._process.stdout:
@@ -726,16 +753,21 @@ class MinerProcess:
         except Exception as e:
             if self._running:
                 logger.error(f"Output-Fehler: {e}")
+    
+    def _wait_for_exit(self, process: subprocess.Popen):
+        """Wartet in einem Thread auf das Prozessende und meldet unerwartetes Beenden"""
+        returncode = process.wait()
         
-        # Prozess beendet
-        if self._running:
+        # stop() setzt _running vorher zurück - dann war das Ende gewollt
+        if self._running and process is self._process:
             self._running = False
-            logger.warning("Miner unerwartet beendet")
-            if self.on_stopped:
-                try:
-                    self.on_stopped()
-                except Exception:
-                    pass
+            logger.warning(f"Miner unerwartet beendet (Exit-Code {returncode})")
+            for callback, args in ((self.on_stopped, ()), (self.on_crashed, (returncode,))):
+                if callback:
+                    try:
+                        callback(*args)
+                    except Exception:
+                        pass  # GUI könnte geschlossen sein
     
     def _extract_hashrate(self, line: str):
         """Extrahiert Hashrate aus einer Log-Zeile"""
@@ -807,6 +839,7 @@ class MinerManager:
         # Callbacks
         self.on_stats_update: Optional[Callable[[MinerStats], None]] = None
         self.on_log: Optional[Callable[[str], None]] = None
+        self.on_miner_crashed: Optional[Callable[[MinerType, int], None]] = None  # aus Hintergrund-Thread!
     
     def get_available_miners(self) -> List[MinerType]:
         """Gibt eine Liste der verfügbaren Miner zurück"""
@@ -995,6 +1028,8 @@ class MinerManager:
         # Miner starten
         self._current_miner = MinerProcess(miner_type, str(exe_path))
         self._current_miner.on_output = self._handle_log
+        self._current_miner.on_crashed = (
+            lambda code, miner=self._current_miner: self._handle_crash(miner, code))
         self._current_type = miner_type
         
         if self._current_miner.start(args):
@@ -1037,6 +1072,11 @@ class MinerManager:
         if self.on_log:
             self.on_log(line)
     
+    def _handle_crash(self, miner: MinerProcess, returncode: int):
+        """Leitet den Absturz des aktuellen Miners weiter (ältere, bereits ersetzte Miner ignorieren)"""
+        if miner is self._current_miner and self.on_miner_crashed:
+            self.on_miner_crashed(miner.miner_type, returncode)
+    
     def kill_all_miners(self):
         """Beendet alle bekannten Miner-Prozesse (Windows)"""
         if os.name != 'nt':
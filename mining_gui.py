@@ -18,9 +18,17 @@ Features:
 
 import sys
 import os
+import json
+import html
 import time
 import logging
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import product
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 
 # PySide6 Imports
@@ -32,9 +40,13 @@ try:
         QDoubleSpinBox, QCheckBox, QGroupBox, QSplitter,
         QTextEdit, QProgressBar, QSlider, QFrame, QMessageBox,
         QFileDialog, QStatusBar, QMenuBar, QMenu, QToolBar,
-        QHeaderView, QAbstractItemView, QSizePolicy, QButtonGroup
+        QHeaderView, QAbstractItemView, QSizePolicy, QButtonGroup, QTableView,
+        QStyledItemDelegate, QStyleOptionViewItem, QStyle, QStyleOptionButton
+    )
+    from PySide6.QtCore import (
+        Qt, QTimer, QThread, Signal, QObject, QSize, QMetaObject, Slot,
+        QAbstractTableModel, QModelIndex, QSignalBlocker, QEvent, QFileSystemWatcher
     )
-    from PySide6.QtCore import Qt, QTimer, QThread, Signal, QObject, QSize, QMetaObject, Slot
     from PySide6.QtGui import QAction, QIcon, QFont, QColor, QPalette, QPixmap
     PYSIDE_AVAILABLE = True
 except ImportError:
@@ -85,7 +97,7 @@ except ImportError:
 # Wallet und Profit (neu)
 try:
     from wallet_manager import WalletManager, get_wallet_manager
-    from profit_calculator import ProfitCalculator, get_profit_calculator
+    from profit_calculator import ProfitCalculator, ProfitResult, get_profit_calculator
     PROFIT_AVAILABLE = True
 except ImportError:
     PROFIT_AVAILABLE = False
@@ -143,6 +155,29 @@ except ImportError as e:
     print(f"⚠️ Memory Manager nicht verfügbar: {e}")
     MEMORY_MANAGER_AVAILABLE = False
 
+# Pool-/Miner-Zuordnung für Auto-Profit (optional)
+try:
+    from auto_profit_switcher import BEST_POOLS, ALGO_MINER_MAP
+    AUTO_PROFIT_SWITCHER_AVAILABLE = True
+except ImportError:
+    BEST_POOLS, ALGO_MINER_MAP = {}, {}
+    AUTO_PROFIT_SWITCHER_AVAILABLE = False
+
+# Coin-Konfiguration (Fallback-Wallets, Pool/Miner je Coin) für Auto-Switch (optional)
+try:
+    from coin_config import COIN_CONFIGS, COIN_FAST_CONFIG
+    COIN_CONFIG_AVAILABLE = True
+except ImportError:
+    COIN_CONFIGS, COIN_FAST_CONFIG = {}, {}
+    COIN_CONFIG_AVAILABLE = False
+
+# orjson für schnelleres Parsen von wallets.json (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -197,11 +232,355 @@ HASHRATE_UNITS = {
     'equihash192': 'Sol/s',
 }
 
+# Flight-Sheet/Auto-Switch Minername -> MinerType (unbekannt -> T-Rex)
+_MINER_TYPE_MAP = {
+    "trex": MinerType.TREX,
+    "nbminer": MinerType.NBMINER,
+    "phoenixminer": MinerType.PHOENIXMINER,
+    "gminer": MinerType.GMINER,
+    "lolminer": MinerType.LOLMINER,
+    "rigel": MinerType.RIGEL,
+    "bzminer": MinerType.BZMINER,
+    "teamredminer": MinerType.TEAMREDMINER,
+    "srbminer": MinerType.SRBMINER,
+    "xmrig": MinerType.XMRIG,  # CPU Miner für XMR
+}
+
+# Auto-Switch Minernamen normalisieren ("T-Rex", "Team Red Miner" -> "trex", "teamredminer")
+_MINER_NAME_DELETE = str.maketrans('', '', '- ')
+
+@lru_cache(maxsize=128)
 def get_hashrate_unit(coin_or_algo: str) -> str:
-    """Gibt die richtige Hashrate-Einheit für einen Coin/Algorithmus zurück"""
+    """Gibt die richtige Hashrate-Einheit für einen Coin/Algorithmus zurück (pro Coin gecacht)"""
     return HASHRATE_UNITS.get(coin_or_algo.upper(), HASHRATE_UNITS.get(coin_or_algo.lower(), 'MH/s'))
 
 
+# Gebühren-Info (typische Withdrawal Fees - Gate.io oft günstiger für größere Coins)
+# Diese werden für die automatische Favorit-Auswahl genutzt
+# Gate.io bevorzugt (bessere Liquidität, oft niedrigere Gebühren)
+_GATEIO_PREFERRED = frozenset({
+    'ETH', 'BTC', 'LTC', 'BCH', 'DOGE', 'DASH', 'ZEC',
+    'XMR', 'KAS', 'FLUX', 'ERG', 'RVN', 'ETC', 'ALPH',
+    'GRIN', 'BEAM', 'FIRO', 'CFX', 'KDA', 'DNX', 'XNA',
+    'IRON', 'CLORE', 'DGB', 'ARRR', 'QTC', 'CKB',
+})
+# CoinEx bevorzugt (einzige Option oder bessere Konditionen)
+_COINEX_PREFERRED = frozenset({
+    'ALEO', 'NEXA', 'RTM', 'ZEPH', 'EPIC', 'DERO',
+    'NEOX', 'MONA', 'VTC', 'HNS', 'KMD', 'QUAI',
+})
+
+
+def _default_favorite(has_coinex: bool, has_gateio: bool,
+                      gateio_preferred: bool, coinex_preferred: bool) -> tuple:
+    """Automatische Favorit-Wahl (ohne Benutzer-Wahl) als (börse, grund)"""
+    if has_gateio and not has_coinex:
+        return "Gate.io", "Nur dort verfügbar"
+    if has_coinex and not has_gateio:
+        return "CoinEx", "Nur dort verfügbar"
+    if gateio_preferred:
+        return "Gate.io", "Bessere Liquidität"
+    if coinex_preferred:
+        return "CoinEx", "Niedrigere Gebühren"
+    if has_gateio:
+        return "Gate.io", "Standard (bessere Liquidität)"
+    if has_coinex:
+        return "CoinEx", "Standard"
+    return "-", "Keine Börse"
+
+
+# Alle 16 Kombinationen vorberechnet:
+# (has_coinex, has_gateio, in _GATEIO_PREFERRED, in _COINEX_PREFERRED) -> (börse, grund)
+_FAVORITE_TABLE = {key: _default_favorite(*key) for key in product((False, True), repeat=4)}
+
+
+# Pfade relativ zum Skript - konstant für die ganze Laufzeit, daher einmal berechnet
+_MODULE_DIR = Path(__file__).resolve().parent
+_DEFAULT_WALLETS_JSON = _MODULE_DIR / 'wallets.json'
+_DEFAULT_MINERS_DIR = _MODULE_DIR / 'miners'
+
+
+@lru_cache(maxsize=1)
+def _resolve_miners_dir() -> Path:
+    """Miner-Verzeichnis: erst im aktuellen Ordner, dann neben dem Skript, dann eine Ebene höher"""
+    for miners_path in (Path("miners"), _DEFAULT_MINERS_DIR, _MODULE_DIR.parent / "miners"):
+        if miners_path.exists():
+            return miners_path
+    return _MODULE_DIR.parent / "miners"
+
+
+# Platzhalter-Adressen aus der Vorlage ("DEINE_RVN_ADRESSE", "RXyz...") - als Tupel für startswith/endswith
+_PLACEHOLDER_PREFIXES = ("DEINE_",)
+_PLACEHOLDER_SUFFIXES = ("...",)
+
+
+def _is_valid_wallet_address(addr: str) -> bool:
+    """Echte Adresse: länger als 10 Zeichen und kein Platzhalter"""
+    return (len(addr) > 10
+            and not addr.startswith(_PLACEHOLDER_PREFIXES)
+            and not addr.endswith(_PLACEHOLDER_SUFFIXES))
+
+
+def _wallet_address(value: Any) -> str:
+    """
+    Adresse aus einem wallets.json-Eintrag
+    
+    Einfaches Format: "RVN": "adresse"
+    Dict Format: "RVN": {"address": "...", ...}
+    Gibt "" zurück wenn keine Adresse als String vorliegt.
+    """
+    addr = value.get('address', '') if isinstance(value, dict) else value
+    return addr if isinstance(addr, str) else ""
+
+
+def _read_available_wallets(wallet_file: Path) -> Dict[str, str]:
+    """
+    Liest die gültigen Wallets aus wallets.json (threadsicher, für ApiWorker)
+    
+    Returns:
+        {COIN: adresse} ohne Platzhalter
+    """
+    valid_wallets = {}
+    
+    # Aus wallets.json laden (EINZIGE QUELLE!)
+    try:
+        # Als bytes lesen - UTF-8 dekodiert der Parser selbst
+        data = _json_loads(wallet_file.read_bytes())
+        
+        # Wallets extrahieren und dabei gleich Ungültige/Platzhalter verwerfen
+        raw_wallets = data.get('wallets', {})
+        
+        for coin, value in raw_wallets.items():
+            addr = _wallet_address(value)
+            if _is_valid_wallet_address(addr):
+                valid_wallets[coin.upper()] = addr
+        
+        logger.debug(f"wallets.json: {len(valid_wallets)} Wallets geladen")
+        
+    except Exception as e:
+        logger.error(f"wallets.json Fehler: {e}")
+    
+    if valid_wallets:
+        logger.info(f"Verfügbare Wallets: {len(valid_wallets)} ({', '.join(sorted(valid_wallets.keys())[:10])}...)")
+    else:
+        logger.warning("Keine gültigen Wallets gefunden! Führe SYNC_COINEX.bat aus.")
+    
+    return valid_wallets
+
+
+# JSON (de)serialisierung - orjson wenn installiert, sonst stdlib json
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialisiert direkt zu UTF-8 bytes (kompakt, mit pretty=True eingerückt)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, indent=2 if pretty else None,
+                      separators=None if pretty else (',', ':'),
+                      ensure_ascii=False).encode('utf-8')
+
+
+# Cache für wallets.json - wird nur neu geparst wenn sich mtime/Größe der Datei ändern
+# 'watched': ein QFileSystemWatcher meldet Änderungen (siehe MiningMainWindow._reload_wallets_cache),
+# dann entfällt auch der stat()-Aufruf pro Zugriff
+_wallets_cache: Dict[str, Any] = {'key': None, 'data': None, 'views': {}, 'watched': False}
+
+def _load_wallets_json() -> Dict[str, Any]:
+    """
+    Lädt wallets.json (gecacht über mtime + Dateigröße)
+    
+    Das zurückgegebene Dict ist geteilt und darf nicht verändert werden.
+    Gibt {} zurück wenn die Datei nicht existiert.
+    """
+    if _wallets_cache['watched'] and _wallets_cache['data'] is not None:
+        return _wallets_cache['data']
+    
+    wallets_file = Path("wallets.json")
+    try:
+        stat = wallets_file.stat()
+    except OSError:
+        # Datei gelöscht/umbenannt - auch der überwachte Cache muss das sehen
+        _invalidate_wallets_cache()
+        return {}
+    
+    key = (stat.st_mtime_ns, stat.st_size)
+    if _wallets_cache['data'] is None or _wallets_cache['key'] != key:
+        raw = wallets_file.read_bytes()
+        _wallets_cache['data'] = _json_loads(raw)
+        _wallets_cache['key'] = key
+        _wallets_cache['views'] = {}
+    return _wallets_cache['data']
+
+
+def _invalidate_wallets_cache():
+    """Erzwingt beim nächsten _load_wallets_json ein erneutes Parsen"""
+    _wallets_cache['key'] = None
+    _wallets_cache['data'] = None
+    _wallets_cache['views'] = {}
+
+
+def _update_wallets_cache(data: Dict[str, Any]):
+    """Übernimmt gerade geschriebene wallets.json-Daten in den Cache (spart das erneute Parsen)"""
+    try:
+        stat = Path("wallets.json").stat()
+    except OSError:
+        return
+    
+    _wallets_cache['key'] = (stat.st_mtime_ns, stat.st_size)
+    _wallets_cache['data'] = data
+    _wallets_cache['views'] = {}
+
+
+def _write_wallets_json(data: Dict[str, Any], pretty: bool = False):
+    """
+    Schreibt wallets.json atomar (Temp-Datei + fsync + os.replace) und aktualisiert den Cache
+    
+    Kompakt serialisiert; mit pretty=True eingerückt (zum Debuggen).
+    """
+    wallets_file = Path("wallets.json")
+    tmp_file = wallets_file.with_suffix(".json.tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(_json_dumps(data, pretty))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, wallets_file)
+    
+    _update_wallets_cache(data)
+
+
+def _cached_wallets_view(data: Dict[str, Any], name: str, build):
+    """Berechnet eine abgeleitete Sicht auf wallets.json - für die gecachte Datei nur einmal pro Laden"""
+    if data is not _wallets_cache['data']:
+        return build(data)
+    
+    views = _wallets_cache['views']
+    if name not in views:
+        views[name] = build(data)
+    return views[name]
+
+
+def _normalize_wallet_source(source: str) -> str:
+    """Ordnet eine Wallet-Quelle einer Börse zu: 'coinex', 'gateio' oder 'other'"""
+    source_key = source.lower().replace(".", "").replace(" ", "")
+    if "coinex" in source_key:
+        return 'coinex'
+    if "gate" in source_key:
+        return 'gateio'
+    return 'other'
+
+
+def _load_normalized_wallet_sources(data: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    """
+    Gibt {coin: 'coinex'|'gateio'|'other'} zurück
+    
+    Für die gecachte wallets.json wird das Ergebnis nur einmal pro Laden berechnet.
+    """
+    if data is None:
+        data = _load_wallets_json()
+    
+    return _cached_wallets_view(data, 'normalized_sources', lambda d: {
+        coin: _normalize_wallet_source(source)
+        for coin, source in d.get("wallet_sources", {}).items()
+    })
+
+
+def _load_exchange_map(data: Optional[Dict[str, Any]] = None) -> Dict[str, tuple]:
+    """
+    Gibt {coin: (has_coinex, has_gateio)} aus den Wallet-Quellen zurück
+    
+    Für die gecachte wallets.json wird das Ergebnis nur einmal pro Laden berechnet.
+    """
+    if data is None:
+        data = _load_wallets_json()
+    
+    def build(d):
+        exchange_map = {}
+        for coin, source in d.get("wallet_sources", {}).items():
+            source_lower = source.lower().replace(".", "").replace(" ", "")
+            exchange_map[coin] = (source_lower == "coinex", source_lower == "gateio")
+        return exchange_map
+    
+    return _cached_wallets_view(data, 'exchange_map', build)
+
+
+def _shorten_address(address: str) -> str:
+    """Kürzt lange Wallet-Adressen für die Anzeige"""
+    if len(address) > 40:
+        return address[:20] + "..." + address[-15:]
+    return address
+
+
+def _load_wallet_rows(data: Optional[Dict[str, Any]] = None) -> List[tuple]:
+    """
+    Gibt die Wallets als sortierte Zeilen (coin, adresse, kurz-adresse, quelle) zurück
+    
+    Kürzung und Quellen-Zuordnung passieren einmal pro Laden, nicht pro Refresh.
+    """
+    if data is None:
+        data = _load_wallets_json()
+    
+    def build(d):
+        wallet_sources = d.get("wallet_sources", {})
+        return [
+            (coin, address, _shorten_address(address), wallet_sources.get(coin, 'Manual'))
+            for coin, address in sorted(d.get("wallets", {}).items(), key=lambda x: x[0])
+        ]
+    
+    return _cached_wallets_view(data, 'wallet_rows', build)
+
+
+@lru_cache(maxsize=1)
+def _detect_gpu_name() -> str:
+    """Name der ersten GPU über NVML (nur einmal pro Programmlauf abgefragt)"""
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+        try:
+            gpu_name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(0))
+        finally:
+            pynvml.nvmlShutdown()
+        if isinstance(gpu_name, bytes):
+            gpu_name = gpu_name.decode('utf-8')
+        return gpu_name
+    except:
+        return "RTX 3070"  # Default
+
+
+@lru_cache(maxsize=1)
+def _query_nvml_gpus() -> tuple:
+    """NVML-Abfrage für _detect_nvml_gpus - wirft bei Fehlern (Ausnahmen cached lru_cache nicht)"""
+    import pynvml
+    pynvml.nvmlInit()
+    try:
+        gpus = []
+        for i in range(pynvml.nvmlDeviceGetCount()):
+            name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(i))
+            if isinstance(name, bytes):
+                name = name.decode('utf-8')
+            gpus.append((i, name))
+    finally:
+        pynvml.nvmlShutdown()
+    return tuple(gpus)
+
+
+def _detect_nvml_gpus() -> tuple:
+    """
+    Alle NVIDIA GPUs als ((index, name), ...) über NVML
+    
+    Nur ein erfolgreiches Ergebnis wird für den Programmlauf gecacht - nach einem
+    (evtl. vorübergehenden) NVML-Fehler oder ohne GPUs wird beim nächsten Aufruf neu abgefragt.
+    """
+    try:
+        gpus = _query_nvml_gpus()
+    except Exception as e:
+        logger.debug(f"NVML GPU-Erkennung fehlgeschlagen: {e}")
+        return ()
+    if not gpus:
+        _query_nvml_gpus.cache_clear()
+    return gpus
+
+
 class WorkerSignals(QObject):
     """Signals für Worker-Threads"""
     update = Signal(dict)
@@ -252,8 +631,11 @@ class MinerStatsWorker(QThread):
         self._running = True
     
     def run(self):
-        # Kurz warten bis Miner gestartet ist
-        time.sleep(3.0)
+        # Kurz warten bis Miner gestartet ist (unterbrechbar)
+        for _ in range(30):
+            if not self._running:
+                return
+            time.sleep(0.1)
         
         while self._running:
             try:
@@ -270,15 +652,73 @@ class MinerStatsWorker(QThread):
                     break
                 time.sleep(0.1)
     
+    def start(self, *args):
+        """Startet einen neuen Lauf (setzt das Stop-Flag eines vorherigen Laufs zurück)"""
+        self._running = True
+        super().start(*args)
+    
     def stop(self):
         self._running = False
 
 
+class HardwareDBWorker(QThread):
+    """Background-Worker für langsame Hardware-DB Aufrufe (Erkennung, hashrate.no Sync)"""
+    
+    result = Signal(object)
+    error = Signal(str)
+    
+    def __init__(self, func, *args, **kwargs):
+        super().__init__()
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+    
+    def run(self):
+        try:
+            self.result.emit(self._func(*self._args, **self._kwargs))
+        except Exception as e:
+            logger.warning(f"HardwareDBWorker Fehler: {e}")
+            self.error.emit(str(e))
+
+
+class ApiWorker(QThread):
+    """Background-Worker für blockierende Netzwerk-Aufrufe (Börsen-APIs, Profit-Daten)"""
+    
+    result = Signal(str, object)  # (Name, Ergebnis)
+    error = Signal(str, str)      # (Name, Fehlermeldung)
+    
+    def __init__(self, name: str, func, *args, **kwargs):
+        super().__init__()
+        self.name = name
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+    
+    def run(self):
+        try:
+            self.result.emit(self.name, self._func(*self._args, **self._kwargs))
+        except Exception as e:
+            logger.warning(f"ApiWorker Fehler ({self.name}): {e}")
+            self.error.emit(self.name, str(e))
+
+
 class GPUTableWidget(QTableWidget):
     """GPU Status Tabelle mit Auswahl-Checkboxen"""
     
     COLUMNS = ['✓', 'GPU', 'Typ', 'Hashrate', 'Temp', 'Fan', 'Power', 'Core', 'Memory', 'Efficiency']
     
+    # Feste Farben/Schrift einmal erzeugen statt pro Zelle
+    _TYPE_COLORS = {
+        'NVIDIA': QColor('#76B900'),  # NVIDIA Grün
+        'AMD': QColor('#ED1C24'),     # AMD Rot
+        'Intel': QColor('#0071C5'),   # Intel Blau
+    }
+    _COLOR_DEFAULT = QColor(COLORS['text_primary'])
+    _COLOR_HASHRATE = QColor(COLORS['hashrate'])
+    _COLOR_POWER = QColor(COLORS['power'])
+    _COLOR_EFFICIENCY = QColor(COLORS['efficiency'])
+    _FONT_BOLD = QFont('Arial', 10, QFont.Bold)
+    
     gpu_selection_changed = Signal(list)  # Liste der ausgewählten GPU-Indizes
     
     def __init__(self, parent=None):
@@ -335,12 +775,7 @@ class GPUTableWidget(QTableWidget):
             # GPU Typ mit Farbe
             gpu_type = getattr(gpu, 'gpu_type', 'NVIDIA')
             type_item = QTableWidgetItem(gpu_type)
-            type_colors = {
-                'NVIDIA': '#76B900',  # NVIDIA Grün
-                'AMD': '#ED1C24',     # AMD Rot
-                'Intel': '#0071C5',   # Intel Blau
-            }
-            type_item.setForeground(QColor(type_colors.get(gpu_type, COLORS['text_primary'])))
+            type_item.setForeground(self._TYPE_COLORS.get(gpu_type, self._COLOR_DEFAULT))
             self.setItem(row, 2, type_item)
             
             # Hashrate (von Miner API wenn verfügbar)
@@ -349,8 +784,8 @@ class GPUTableWidget(QTableWidget):
                 hashrate = miner_stats.gpus[row].hashrate
             
             hashrate_item = QTableWidgetItem(f"{hashrate:.2f} {hashrate_unit}")
-            hashrate_item.setForeground(QColor(COLORS['hashrate']))
-            hashrate_item.setFont(QFont('Arial', 10, QFont.Bold))
+            hashrate_item.setForeground(self._COLOR_HASHRATE)
+            hashrate_item.setFont(self._FONT_BOLD)
             self.setItem(row, 3, hashrate_item)
             
             # Temperatur mit Farbcodierung
@@ -365,7 +800,7 @@ class GPUTableWidget(QTableWidget):
             
             # Power
             power_item = QTableWidgetItem(f"{gpu.power_watts:.0f}W" if gpu.power_watts > 0 else "--")
-            power_item.setForeground(QColor(COLORS['power']))
+            power_item.setForeground(self._COLOR_POWER)
             self.setItem(row, 6, power_item)
             
             # Core Clock
@@ -379,7 +814,7 @@ class GPUTableWidget(QTableWidget):
             # Efficiency
             efficiency = hashrate / gpu.power_watts if gpu.power_watts > 0 and hashrate > 0 else 0
             eff_item = QTableWidgetItem(f"{efficiency:.3f}" if efficiency > 0 else "--")
-            eff_item.setForeground(QColor(COLORS['efficiency']))
+            eff_item.setForeground(self._COLOR_EFFICIENCY)
             self.setItem(row, 9, eff_item)
     
     def _on_checkbox_changed(self):
@@ -438,8 +873,8 @@ class HashrateChartWidget(QWidget):
             label.setAlignment(Qt.AlignCenter)
             layout.addWidget(label)
     
-    def update_data(self, hashrate: float):
-        """Fügt einen neuen Datenpunkt hinzu"""
+    def update_data(self, hashrate: float, redraw: bool = True):
+        """Fügt einen neuen Datenpunkt hinzu (redraw=False: nur Historie, Neuzeichnen beim Anzeigen)"""
         self.data.append(hashrate)
         self.timestamps.append(time.time())
         
@@ -448,10 +883,20 @@ class HashrateChartWidget(QWidget):
             self.data.pop(0)
             self.timestamps.pop(0)
         
+        if redraw:
+            self.redraw()
+    
+    def redraw(self):
+        """Überträgt die Historie in den Plot"""
         if PYQTGRAPH_AVAILABLE and self.data:
             # X-Achse: Sekunden seit Start
             x = [t - self.timestamps[0] for t in self.timestamps]
             self.curve.setData(x, self.data)
+    
+    def showEvent(self, event):
+        """Beim Sichtbarwerden den im Hintergrund gesammelten Stand zeichnen"""
+        super().showEvent(event)
+        self.redraw()
 
 
 class TemperatureChartWidget(QWidget):
@@ -506,8 +951,8 @@ class TemperatureChartWidget(QWidget):
                 if i not in self.data:
                     self.data[i] = []
     
-    def update_data(self, temperatures: Dict[int, int]):
-        """Aktualisiert Temperaturen für alle GPUs"""
+    def update_data(self, temperatures: Dict[int, int], redraw: bool = True):
+        """Aktualisiert Temperaturen für alle GPUs (redraw=False: nur Historie)"""
         self.timestamps.append(time.time())
         
         for gpu_idx, temp in temperatures.items():
@@ -521,16 +966,32 @@ class TemperatureChartWidget(QWidget):
         if len(self.timestamps) > self.history_size:
             self.timestamps.pop(0)
         
+        if redraw:
+            self.redraw()
+    
+    def redraw(self):
+        """Überträgt die Historie aller GPUs in den Plot"""
         if PYQTGRAPH_AVAILABLE and self.timestamps:
             x = [t - self.timestamps[0] for t in self.timestamps]
             for gpu_idx, curve in self.curves.items():
                 if gpu_idx in self.data and self.data[gpu_idx]:
                     curve.setData(x[:len(self.data[gpu_idx])], self.data[gpu_idx])
+    
+    def showEvent(self, event):
+        """Beim Sichtbarwerden den im Hintergrund gesammelten Stand zeichnen"""
+        super().showEvent(event)
+        self.redraw()
 
 
 class DashboardTab(QWidget):
     """Dashboard Tab - Hauptübersicht"""
     
+    # Rich-Text/Stylesheets einmal vorformatieren - pro Update nur noch die Zahlen einsetzen
+    _SHARES_TEMPLATE = (f"<span style='color:{COLORS['accepted']}'>A: {{}}</span> | "
+                        f"<span style='color:{COLORS['rejected']}'>R: {{}}</span>")
+    _PROFIT_STYLE_ACTIVE = f"font-size: 28px; font-weight: bold; color: {COLORS['accepted']};"
+    _PROFIT_STYLE_IDLE = f"font-size: 28px; font-weight: bold; color: {COLORS['text_secondary']};"
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
@@ -590,12 +1051,18 @@ class DashboardTab(QWidget):
         profit_group = QGroupBox("Profit/Tag")
         profit_layout = QVBoxLayout(profit_group)
         self.profit_label = QLabel("$0.00")
-        self.profit_label.setStyleSheet(f"font-size: 28px; font-weight: bold; color: {COLORS['accepted']};")
+        self.profit_label.setStyleSheet(self._PROFIT_STYLE_ACTIVE)
+        self._profit_active = True  # welches Stylesheet gerade gesetzt ist, siehe set_profit
         self.profit_label.setAlignment(Qt.AlignCenter)
         profit_layout.addWidget(self.profit_label)
         stats_layout.addWidget(profit_group)
         
-        layout.addLayout(stats_layout)
+        # Eigenes Widget für die Stats-Leiste, damit Label-Updates gebündelt werden können
+        # (siehe _batched_updates) ohne die Charts darunter neu zu zeichnen
+        self.stats_bar = QWidget()
+        self.stats_bar.setLayout(stats_layout)
+        stats_layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.stats_bar)
         
         # Splitter für Tabelle und Charts
         splitter = QSplitter(Qt.Horizontal)
@@ -702,29 +1169,54 @@ class DashboardTab(QWidget):
     
     def update_stats(self, hashrate: float, power: float, coin: str, uptime: int, accepted: int, rejected: int, profit_usd: float = 0.0):
         """Aktualisiert die Stats-Anzeigen"""
-        # Dynamische Hashrate-Einheit basierend auf Coin
+        with _batched_updates(self.stats_bar):
+            self.set_hashrate(hashrate, coin)
+            self.set_power(power)
+            self.set_coin(coin)
+            
+            # Uptime formatieren
+            hours = uptime // 3600
+            minutes = (uptime % 3600) // 60
+            seconds = uptime % 60
+            self.uptime_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+            
+            # Shares mit Farben
+            self.set_shares(accepted, rejected)
+            
+            # Profit USD/Tag
+            self.set_profit(profit_usd)
+    
+    @staticmethod
+    def _set_label_text(label: QLabel, text: str):
+        """setText nur bei geändertem Text (Rich-Text wird sonst jedes Mal neu geparst)"""
+        if label.text() != text:
+            label.setText(text)
+    
+    def set_hashrate(self, hashrate: float, coin: str):
+        """Zeigt die Hashrate mit der zum Coin passenden Einheit an"""
         unit = get_hashrate_unit(coin) if coin else 'MH/s'
-        self.hashrate_label.setText(f"{hashrate:.2f} {unit}")
-        self.power_label.setText(f"{power:.0f} W")
-        self.coin_label.setText(coin or "--")
-        
-        # Uptime formatieren
-        hours = uptime // 3600
-        minutes = (uptime % 3600) // 60
-        seconds = uptime % 60
-        self.uptime_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-        
-        # Shares mit Farben
-        self.shares_label.setText(f"<span style='color:{COLORS['accepted']}'>A: {accepted}</span> | "
-                                   f"<span style='color:{COLORS['rejected']}'>R: {rejected}</span>")
-        
-        # Profit USD/Tag
-        if profit_usd > 0:
-            self.profit_label.setText(f"${profit_usd:.2f}")
-            self.profit_label.setStyleSheet(f"font-size: 28px; font-weight: bold; color: {COLORS['accepted']};")
-        else:
-            self.profit_label.setText("$0.00")
-            self.profit_label.setStyleSheet(f"font-size: 28px; font-weight: bold; color: {COLORS['text_secondary']};")
+        self._set_label_text(self.hashrate_label, f"{hashrate:.2f} {unit}")
+    
+    def set_power(self, power: float):
+        """Zeigt die Leistungsaufnahme in Watt an"""
+        self._set_label_text(self.power_label, f"{power:.0f} W")
+    
+    def set_coin(self, coin: str):
+        """Zeigt den aktuellen Coin an ("--" wenn keiner)"""
+        self._set_label_text(self.coin_label, coin or "--")
+    
+    def set_shares(self, accepted: int, rejected: int):
+        """Zeigt Accepted/Rejected Shares farbig an"""
+        self._set_label_text(self.shares_label, self._SHARES_TEMPLATE.format(accepted, rejected))
+    
+    def set_profit(self, profit_usd: float):
+        """Zeigt den Profit in USD/Tag an (grün wenn > 0)"""
+        active = profit_usd > 0
+        self._set_label_text(self.profit_label, f"${profit_usd:.2f}" if active else "$0.00")
+        # Stylesheet nur beim Wechsel aktiv/inaktiv neu setzen (Qt parst es sonst jedes Mal neu)
+        if active != self._profit_active:
+            self._profit_active = active
+            self.profit_label.setStyleSheet(self._PROFIT_STYLE_ACTIVE if active else self._PROFIT_STYLE_IDLE)
 
 
 class FlightSheetsTab(QWidget):
@@ -735,6 +1227,7 @@ class FlightSheetsTab(QWidget):
     def __init__(self, flight_manager: FlightSheetManager, parent=None):
         super().__init__(parent)
         self.flight_manager = flight_manager
+        self._wallet_cache: Dict[str, Optional[str]] = {}  # {coin: wallet} - spart WalletManager-Zugriffe
         self.setup_ui()
         self.load_sheets()
     
@@ -935,6 +1428,7 @@ class FlightSheetsTab(QWidget):
         
         wm = get_wallet_manager()
         if wm.set_wallet(coin, wallet):
+            self._wallet_cache[coin] = wallet
             QMessageBox.information(self, "Gespeichert", f"Wallet für {coin} gespeichert!")
         else:
             QMessageBox.warning(self, "Fehler", "Wallet konnte nicht gespeichert werden!")
@@ -945,8 +1439,12 @@ class FlightSheetsTab(QWidget):
             return
         
         coin = self.coin_combo.currentText()
-        wm = get_wallet_manager()
-        wallet = wm.get_wallet(coin)
+        if coin in self._wallet_cache:
+            wallet = self._wallet_cache[coin]
+        else:
+            wm = get_wallet_manager()
+            wallet = wm.get_wallet(coin)
+            self._wallet_cache[coin] = wallet
         
         if wallet and not wallet.startswith("DEINE_"):
             self.wallet_edit.setText(wallet)
@@ -981,6 +1479,7 @@ class FlightSheetsTab(QWidget):
                 # Auch in Wallet Manager speichern
                 wm = get_wallet_manager()
                 wm.set_wallet(coin, address)
+                self._wallet_cache[coin] = address
                 
                 QMessageBox.information(
                     self, "CoinEx", 
@@ -1031,6 +1530,7 @@ class FlightSheetsTab(QWidget):
                 # Auch in Wallet Manager speichern
                 wm = get_wallet_manager()
                 wm.set_wallet(coin, address)
+                self._wallet_cache[coin] = address
                 
                 QMessageBox.information(
                     self, "Gate.io", 
@@ -1496,17 +1996,30 @@ class LogsTab(QWidget):
         """)
         layout.addWidget(self.log_view)
     
+    @staticmethod
+    def _format_log_line(text: str) -> str:
+        """Farbcodierung einer Log-Zeile (als HTML - Miner-Text escaped, Leerzeichen bleiben erhalten)"""
+        lower = text.lower()
+        if 'error' in lower or 'fail' in lower:
+            color = f"color:{COLORS['error']};"
+        elif 'warn' in lower:
+            color = f"color:{COLORS['warning']};"
+        elif 'accepted' in lower:
+            color = f"color:{COLORS['accepted']};"
+        else:
+            color = ""
+        return f"<span style='white-space:pre;{color}'>{html.escape(text)}</span>"
+    
     def append_log(self, text: str):
         """Fügt Log-Zeile hinzu"""
-        # Farbcodierung
-        if 'error' in text.lower() or 'fail' in text.lower():
-            text = f"<span style='color:{COLORS['error']}'>{text}</span>"
-        elif 'warn' in text.lower():
-            text = f"<span style='color:{COLORS['warning']}'>{text}</span>"
-        elif 'accepted' in text.lower():
-            text = f"<span style='color:{COLORS['accepted']}'>{text}</span>"
+        self.append_logs_batch([text])
+    
+    def append_logs_batch(self, lines: List[str]):
+        """Fügt mehrere Log-Zeilen mit einem append und einem Scroll hinzu"""
+        if not lines:
+            return
         
-        self.log_view.append(text)
+        self.log_view.append("<br>".join(map(self._format_log_line, lines)))
         
         if self.auto_scroll_check.isChecked():
             self.log_view.verticalScrollBar().setValue(
@@ -1525,6 +2038,287 @@ class LogsTab(QWidget):
                 f.write(self.log_view.toPlainText())
 
 
+@contextmanager
+def _bulk_table_update(table: QTableWidget):
+    """
+    Befüllt ein QTableWidget ohne Zwischen-Layouts
+    
+    Während des Blocks sind Repaints und Signale aus und alle Spalten auf
+    Fixed gestellt - die ursprünglichen Resize-Modi werden danach einmal
+    wiederhergestellt.
+    """
+    header = table.horizontalHeader()
+    resize_modes = [header.sectionResizeMode(col) for col in range(header.count())]
+    
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    for col in range(header.count()):
+        header.setSectionResizeMode(col, QHeaderView.Fixed)
+    try:
+        yield table
+    finally:
+        for col, mode in enumerate(resize_modes):
+            header.setSectionResizeMode(col, mode)
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+
+
+@contextmanager
+def _batched_updates(widget: QWidget):
+    """
+    Schaltet Repaints eines Widgets für mehrere Label-Updates ab
+    
+    Beim Wiedereinschalten zeichnet Qt das Widget einmal neu. Ist Updating
+    bereits aus (verschachtelter Aufruf), bleibt der Zustand unangetastet -
+    der äußere Block schaltet wieder ein.
+    """
+    if not widget.updatesEnabled():
+        yield widget
+        return
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+# Vorab erzeugte Vordergrund-Farben für Tabellen-Zellen
+_ACCEPTED_FG = QColor(COLORS['accepted'])
+_GATEIO_FG = QColor("#4CAF50")
+_COINEX_FG = QColor("#2196F3")
+
+# Batch-Extraktion + Format-Strings für die Coins-Tabelle im Hardware Tab
+_COIN_HASHRATE = itemgetter('hashrate', 'hashrate_unit')
+_COIN_OC = itemgetter('core_offset', 'memory_offset', 'power_limit')
+_HASHRATE_FMT = "{:.2f} {}".format
+_OC_FMT = "Core: {:+d}, Mem: {:+d}, PL: {}%".format
+
+
+class HardwareTableModel(QAbstractTableModel):
+    """
+    Tabellen-Model für den Hardware Tab
+    
+    Hält nur die Liste der Zeilen-Objekte (GPUs, CPUs, Coin-Dicts) - die
+    Zellen-Texte werden erst in data() über die Column-Getter erzeugt.
+    Dadurch entstehen beim Refresh keine QTableWidgetItems mehr, gemalt
+    werden nur die sichtbaren Zeilen.
+    """
+    
+    # Liefert alle Paint-Rollen einer Zelle in einem data()-Aufruf (für CachedItemDelegate)
+    MULTIPLE_ROLES = Qt.UserRole + 1
+    
+    def __init__(self, headers: List[str], column_getters: tuple,
+                 foreground_getters: Optional[Dict[int, Any]] = None, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._column_getters = column_getters
+        self._foreground_getters = foreground_getters or {}
+        self._rows: list = []
+    
+    def set_rows(self, rows: list):
+        """Ersetzt alle Zeilen mit einem einzigen Model-Reset"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+    
+    def row_object(self, row: int):
+        """Gibt das Objekt hinter einer Zeile zurück"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if role == Qt.DisplayRole:
+            return self._column_getters[index.column()](self._rows[index.row()])
+        
+        if role == Qt.ForegroundRole:
+            getter = self._foreground_getters.get(index.column())
+            if getter:
+                return getter(self._rows[index.row()])
+        
+        if role == self.MULTIPLE_ROLES:
+            row_obj = self._rows[index.row()]
+            getter = self._foreground_getters.get(index.column())
+            return {
+                Qt.DisplayRole: self._column_getters[index.column()](row_obj),
+                Qt.ForegroundRole: getter(row_obj) if getter else None,
+            }
+        
+        return None
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
+class ColumnarTableModel(QAbstractTableModel):
+    """
+    Tabellen-Model mit spaltenweiser Speicherung (eine Sequenz pro Spalte)
+    
+    Für vorformatierte Tabellen: data() ist nur noch ein Index-Zugriff
+    columns[col][row], ohne Getter oder Dict-Lookups pro Zelle.
+    """
+    
+    MULTIPLE_ROLES = HardwareTableModel.MULTIPLE_ROLES
+    
+    def __init__(self, headers: List[str], parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._columns: List[tuple] = []
+        self._foreground: Dict[int, list] = {}
+        self._row_count = 0
+    
+    def set_columns(self, columns: List[tuple], foreground: Optional[Dict[int, list]] = None):
+        """
+        Ersetzt alle Daten mit einem einzigen Model-Reset
+        
+        Args:
+            columns: Eine Sequenz Anzeige-Texte pro Spalte (alle gleich lang)
+            foreground: Optional {spalte: [QColor|None pro Zeile]}
+        """
+        self.beginResetModel()
+        self._columns = columns
+        self._foreground = foreground or {}
+        self._row_count = len(columns[0]) if columns else 0
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        col = index.column()
+        row = index.row()
+        
+        if role == Qt.DisplayRole:
+            return self._columns[col][row]
+        
+        if role == Qt.ForegroundRole:
+            colors = self._foreground.get(col)
+            return colors[row] if colors else None
+        
+        if role == self.MULTIPLE_ROLES:
+            colors = self._foreground.get(col)
+            return {
+                Qt.DisplayRole: self._columns[col][row],
+                Qt.ForegroundRole: colors[row] if colors else None,
+            }
+        
+        return None
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
+class RowTupleModel(QAbstractTableModel):
+    """
+    Tabellen-Model über einer Liste vorbereiteter Zeilen-Tupel
+    
+    Pro Rolle gibt es optionale Spalten-Getter {rolle: {spalte: getter(zeile)}},
+    die erst in data() aufgerufen werden - also nur für sichtbare Zellen.
+    """
+    
+    def __init__(self, headers: List[str], role_getters: Dict[Any, Dict[int, Any]], parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._role_getters = {int(role): getters for role, getters in role_getters.items()}
+        self._rows: List[tuple] = []
+    
+    def set_rows(self, rows: List[tuple]):
+        """Ersetzt alle Zeilen mit einem einzigen Model-Reset"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+    
+    def set_row(self, row: int, values: tuple):
+        """Ersetzt eine einzelne Zeile (nur diese wird neu gezeichnet)"""
+        self._rows[row] = values
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._headers) - 1))
+    
+    def row_values(self, row: int) -> Optional[tuple]:
+        """Gibt das Tupel hinter einer Zeile zurück"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        getters = self._role_getters.get(int(role))
+        if getters:
+            getter = getters.get(index.column())
+            if getter:
+                return getter(self._rows[index.row()])
+        return None
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
+class CachedItemDelegate(QStyledItemDelegate):
+    """
+    Item-Delegate mit Zellen-Cache für HardwareTableModel
+    
+    Holt alle Paint-Rollen einer Zelle mit einem einzigen data()-Aufruf
+    (MULTIPLE_ROLES) und merkt sie sich bis zum nächsten Model-Reset,
+    statt bei jedem Repaint jede Rolle einzeln abzufragen.
+    """
+    
+    def __init__(self, model: QAbstractTableModel, parent=None):
+        super().__init__(parent)
+        self._cache: Dict[tuple, dict] = {}
+        model.modelReset.connect(self.clear_cache)
+    
+    def clear_cache(self):
+        """Verwirft alle gecachten Zellen"""
+        self._cache.clear()
+    
+    def initStyleOption(self, option, index):
+        key = (index.row(), index.column())
+        roles = self._cache.get(key)
+        if roles is None:
+            roles = index.data(HardwareTableModel.MULTIPLE_ROLES) or {}
+            self._cache[key] = roles
+        
+        option.index = index
+        text = roles.get(Qt.DisplayRole)
+        if text is not None:
+            option.text = text
+            option.features |= QStyleOptionViewItem.HasDisplay
+        
+        foreground = roles.get(Qt.ForegroundRole)
+        if foreground is not None:
+            option.palette.setColor(QPalette.Text, foreground)
+        
+        option.displayAlignment = Qt.AlignLeft | Qt.AlignVCenter
+
+
 class HardwareTab(QWidget):
     """
     Hardware Tab - Zeigt alle erkannten GPUs/CPUs und hashrate.no Daten
@@ -1538,16 +2332,83 @@ class HardwareTab(QWidget):
     
     sync_completed = Signal(dict)
     
+    # Mindest-VRAM für Mining (darunter: iGPUs)
+    MIN_MINING_VRAM_MB = 2048
+    
+    # Max. gecachte Beste-Coins-Abfragen (LRU)
+    COIN_CACHE_SIZE = 32
+    
+    # Spalten-Definitionen (Header, Getter) für die Table-Models
+    GPU_COLUMNS = (
+        ("GPU", attrgetter('name')),
+        ("Vendor", attrgetter('vendor')),
+        ("VRAM", lambda gpu: f"{gpu.vram_mb} MB"),
+        ("TDP", lambda gpu: f"{gpu.tdp_watts} W"),
+        ("Algorithmen", lambda gpu: str(len(gpu.supported_algorithms))),
+        ("Letzter Sync", lambda gpu: gpu.last_sync or "Nie"),
+        ("Aktionen", lambda gpu: "📋 Details"),
+    )
+    GPU_DETAILS_COLUMN = 6
+    
+    CPU_COLUMNS = (
+        ("CPU", attrgetter('name')),
+        ("Vendor", attrgetter('vendor')),
+        ("Cores/Threads", lambda cpu: f"{cpu.cores}/{cpu.threads}"),
+        ("Boost Clock", lambda cpu: f"{cpu.boost_clock_mhz} MHz"),
+        # CPU Mining: RandomX für Monero/Zephyr
+        ("Algorithmen", lambda cpu: ", ".join(cpu.supported_algorithms) if cpu.supported_algorithms else "randomx"),
+    )
+    
+    # Coin-Spalten werden in on_gpu_selected vorformatiert und spaltenweise abgelegt
+    COIN_HEADERS = ("Coin", "Algorithmus", "Hashrate", "Power", "Effizienz", "OC-Settings", "Status")
+    COIN_EFFICIENCY_COLUMN = 4
+    
     def __init__(self, hardware_db=None, parent=None):
         super().__init__(parent)
         self.hardware_db = hardware_db
+        
+        # Cache für DB-Abfragen (gültig solange sich die DB-Version nicht ändert)
+        self._cache_version = -1
+        self._cached: Optional[Dict[str, Any]] = None
+        
+        # Laufender Erkennungs-/Sync-Worker
+        self._db_worker: Optional[HardwareDBWorker] = None
+        
+        # Details-Texte pro GPU-Name (ändern sich nur durch Erkennung/Sync)
+        self._details_cache: Dict[tuple, str] = {}  # (name, pci_bus) -> Details-Text
+        
+        # LRU-Cache für get_best_coins_for_gpu: {(gpu_name, db_version): coins}
+        self._coin_cache: OrderedDict = OrderedDict()
+        
         self.setup_ui()
     
     def set_hardware_db(self, db):
         """Setzt die Hardware-Datenbank"""
         self.hardware_db = db
+        self._cache_version = -1
+        self._coin_cache.clear()
         self.refresh_data()
     
+    def _get_cached_data(self) -> Dict[str, Any]:
+        """Gibt Stats/GPUs/CPUs aus der DB zurück - neu geladen nur nach Erkennung/Sync"""
+        version = self.hardware_db.version()
+        if self._cached is None or version != self._cache_version:
+            stats = self.hardware_db.get_stats()
+            mining_gpus = self.hardware_db.get_mining_gpus(self.MIN_MINING_VRAM_MB)
+            # iGPU-Namen nur zusammensuchen wenn es welche gibt (einmal pro DB-Version)
+            igpu_names = ""
+            if stats['gpus_count'] > len(mining_gpus):
+                igpu_names = ", ".join(gpu.name for gpu in self.hardware_db.get_all_gpus()
+                                       if gpu.vram_mb < self.MIN_MINING_VRAM_MB)
+            self._cached = {
+                'stats': stats,
+                'mining_gpus': mining_gpus,
+                'igpu_names': igpu_names,
+                'cpus': self.hardware_db.get_all_cpus(),
+            }
+            self._cache_version = version
+        return self._cached
+    
     def setup_ui(self):
         layout = QVBoxLayout(self)
         
@@ -1599,14 +2460,23 @@ class HardwareTab(QWidget):
         gpu_group = QGroupBox("🎮 Erkannte GPUs")
         gpu_layout = QVBoxLayout(gpu_group)
         
-        self.gpu_table = QTableWidget()
-        self.gpu_table.setColumnCount(7)
-        self.gpu_table.setHorizontalHeaderLabels([
-            "GPU", "Vendor", "VRAM", "TDP", "Algorithmen", "Letzter Sync", "Aktionen"
-        ])
+        self.gpu_model = HardwareTableModel(
+            [header for header, _ in self.GPU_COLUMNS],
+            tuple(getter for _, getter in self.GPU_COLUMNS),
+            parent=self
+        )
+        self.gpu_table = QTableView()
+        self.gpu_table.setModel(self.gpu_model)
+        self.gpu_table.setItemDelegate(CachedItemDelegate(self.gpu_model, self.gpu_table))
         self.gpu_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.gpu_table.verticalHeader().setVisible(False)
         self.gpu_table.setAlternatingRowColors(True)
         self.gpu_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.gpu_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Details per Klick auf die Aktionen-Spalte oder Kontextmenü (statt Button pro Zeile)
+        self.gpu_table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.gpu_table.customContextMenuRequested.connect(self._show_gpu_context_menu)
+        self.gpu_table.clicked.connect(self._on_gpu_cell_clicked)
         gpu_layout.addWidget(self.gpu_table)
         
         layout.addWidget(gpu_group)
@@ -1615,13 +2485,18 @@ class HardwareTab(QWidget):
         cpu_group = QGroupBox("💻 Erkannte CPUs")
         cpu_layout = QVBoxLayout(cpu_group)
         
-        self.cpu_table = QTableWidget()
-        self.cpu_table.setColumnCount(5)
-        self.cpu_table.setHorizontalHeaderLabels([
-            "CPU", "Vendor", "Cores/Threads", "Boost Clock", "Algorithmen"
-        ])
+        self.cpu_model = HardwareTableModel(
+            [header for header, _ in self.CPU_COLUMNS],
+            tuple(getter for _, getter in self.CPU_COLUMNS),
+            parent=self
+        )
+        self.cpu_table = QTableView()
+        self.cpu_table.setModel(self.cpu_model)
+        self.cpu_table.setItemDelegate(CachedItemDelegate(self.cpu_model, self.cpu_table))
         self.cpu_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.cpu_table.verticalHeader().setVisible(False)
         self.cpu_table.setAlternatingRowColors(True)
+        self.cpu_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         cpu_layout.addWidget(self.cpu_table)
         
         layout.addWidget(cpu_group)
@@ -1640,13 +2515,14 @@ class HardwareTab(QWidget):
         coins_layout.addLayout(select_layout)
         
         # Coins Tabelle
-        self.coins_table = QTableWidget()
-        self.coins_table.setColumnCount(7)
-        self.coins_table.setHorizontalHeaderLabels([
-            "Coin", "Algorithmus", "Hashrate", "Power", "Effizienz", "OC-Settings", "Status"
-        ])
+        self.coins_model = ColumnarTableModel(self.COIN_HEADERS, parent=self)
+        self.coins_table = QTableView()
+        self.coins_table.setModel(self.coins_model)
+        self.coins_table.setItemDelegate(CachedItemDelegate(self.coins_model, self.coins_table))
         self.coins_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.coins_table.verticalHeader().setVisible(False)
         self.coins_table.setAlternatingRowColors(True)
+        self.coins_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         coins_layout.addWidget(self.coins_table)
         
         layout.addWidget(coins_group)
@@ -1659,60 +2535,42 @@ class HardwareTab(QWidget):
         if not self.hardware_db:
             return
         
-        # Statistiken
-        stats = self.hardware_db.get_stats()
-        self.gpus_count_label.setText(str(stats['gpus_count']))
-        self.cpus_count_label.setText(str(stats['cpus_count']))
-        self.benchmarks_label.setText(str(stats['total_benchmarks']))
-        self.last_sync_label.setText(stats['last_sync'])
-        
-        # GPU Tabelle - filtere mining-fähige GPUs (>= 2GB VRAM)
-        all_gpus = self.hardware_db.get_all_gpus()
-        mining_gpus = [gpu for gpu in all_gpus if gpu.vram_mb >= 2048]  # Min 2GB für Mining
-        igpus = [gpu for gpu in all_gpus if gpu.vram_mb < 2048]  # iGPUs ausfiltern
-        
-        if igpus:
-            igpu_names = ", ".join(g.name for g in igpus)
-            logger.info(f"iGPUs gefunden (nicht mining-fähig): {igpu_names}")
-        
-        self.gpu_table.setRowCount(len(mining_gpus))
-        self.gpu_select_combo.clear()
-        
-        for row, gpu in enumerate(mining_gpus):
-            self.gpu_table.setItem(row, 0, QTableWidgetItem(gpu.name))
-            self.gpu_table.setItem(row, 1, QTableWidgetItem(gpu.vendor))
-            self.gpu_table.setItem(row, 2, QTableWidgetItem(f"{gpu.vram_mb} MB"))
-            self.gpu_table.setItem(row, 3, QTableWidgetItem(f"{gpu.tdp_watts} W"))
-            self.gpu_table.setItem(row, 4, QTableWidgetItem(str(len(gpu.supported_algorithms))))
-            self.gpu_table.setItem(row, 5, QTableWidgetItem(gpu.last_sync or "Nie"))
-            
-            # Details Button
-            details_btn = QPushButton("📋 Details")
-            details_btn.clicked.connect(lambda checked, g=gpu: self.show_gpu_details(g))
-            self.gpu_table.setCellWidget(row, 6, details_btn)
-            
-            # Für Combo
-            self.gpu_select_combo.addItem(gpu.name)
-        
-        # GPU Count aktualisieren (nur mining-fähige)
-        self.gpus_count_label.setText(str(len(mining_gpus)))
-        
-        # CPU Tabelle
-        cpus = self.hardware_db.get_all_cpus()
-        self.cpu_table.setRowCount(len(cpus))
-        
-        for row, cpu in enumerate(cpus):
-            self.cpu_table.setItem(row, 0, QTableWidgetItem(cpu.name))
-            self.cpu_table.setItem(row, 1, QTableWidgetItem(cpu.vendor))
-            self.cpu_table.setItem(row, 2, QTableWidgetItem(f"{cpu.cores}/{cpu.threads}"))
-            self.cpu_table.setItem(row, 3, QTableWidgetItem(f"{cpu.boost_clock_mhz} MHz"))
-            # CPU Mining: RandomX für Monero/Zephyr
-            cpu_algos = cpu.supported_algorithms if cpu.supported_algorithms else ["randomx"]
-            self.cpu_table.setItem(row, 4, QTableWidgetItem(", ".join(cpu_algos) if cpu_algos else "randomx"))
-        
-        # Erste GPU auswählen
-        if mining_gpus:
-            self.on_gpu_selected(mining_gpus[0].name)
+        data = self._get_cached_data()
+        
+        # Alle Tabellen/Labels ohne Zwischen-Repaints aktualisieren
+        self.setUpdatesEnabled(False)
+        try:
+            # Statistiken
+            stats = data['stats']
+            self.gpus_count_label.setText(str(stats['gpus_count']))
+            self.cpus_count_label.setText(str(stats['cpus_count']))
+            self.benchmarks_label.setText(str(stats['total_benchmarks']))
+            self.last_sync_label.setText(stats['last_sync'])
+            
+            # GPU Tabelle - nur mining-fähige GPUs (>= 2GB VRAM), Filter in der DB
+            mining_gpus = data['mining_gpus']
+            
+            if data['igpu_names']:
+                logger.info(f"iGPUs gefunden (nicht mining-fähig): {data['igpu_names']}")
+            
+            self.gpu_model.set_rows(mining_gpus)
+            
+            # Combo ohne currentTextChanged-Kaskade neu füllen (on_gpu_selected wird unten einmal aufgerufen)
+            with QSignalBlocker(self.gpu_select_combo):
+                self.gpu_select_combo.clear()
+                self.gpu_select_combo.addItems([gpu.name for gpu in mining_gpus])
+            
+            # GPU Count aktualisieren (nur mining-fähige)
+            self.gpus_count_label.setText(str(len(mining_gpus)))
+            
+            # CPU Tabelle
+            self.cpu_model.set_rows(data['cpus'])
+            
+            # Erste GPU auswählen
+            if mining_gpus:
+                self.on_gpu_selected(mining_gpus[0].name)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def detect_hardware(self):
         """Erkennt Hardware neu"""
@@ -1720,14 +2578,25 @@ class HardwareTab(QWidget):
             QMessageBox.warning(self, "Fehler", "Hardware-DB nicht verfügbar")
             return
         
+        if self._db_worker and self._db_worker.isRunning():
+            return
+        
         self.detect_btn.setText("⏳ Erkenne...")
         self.detect_btn.setEnabled(False)
-        QApplication.processEvents()
-        
-        gpus, cpus = self.hardware_db.detect_all_hardware()
+        self.sync_btn.setEnabled(False)
         
-        self.detect_btn.setText("🔍 Hardware erkennen")
-        self.detect_btn.setEnabled(True)
+        # Erkennung im Hintergrund - GUI bleibt bedienbar
+        self._db_worker = HardwareDBWorker(self.hardware_db.detect_all_hardware)
+        self._db_worker.result.connect(self._on_detect_done)
+        self._db_worker.error.connect(self._on_db_worker_error)
+        self._db_worker.start()
+    
+    def _on_detect_done(self, result):
+        """Hardware-Erkennung abgeschlossen (läuft im GUI-Thread)"""
+        gpus, cpus = result
+        self._reset_db_buttons()
+        self._details_cache.clear()
+        self._coin_cache.clear()
         
         self.refresh_data()
         
@@ -1742,14 +2611,24 @@ class HardwareTab(QWidget):
             QMessageBox.warning(self, "Fehler", "Hardware-DB nicht verfügbar")
             return
         
+        if self._db_worker and self._db_worker.isRunning():
+            return
+        
         self.sync_btn.setText("⏳ Synchronisiere...")
         self.sync_btn.setEnabled(False)
-        QApplication.processEvents()
-        
-        results = self.hardware_db.sync_with_hashrate_no(force=True)
+        self.detect_btn.setEnabled(False)
         
-        self.sync_btn.setText("🔄 Mit hashrate.no synchronisieren")
-        self.sync_btn.setEnabled(True)
+        # Sync im Hintergrund - GUI bleibt bedienbar
+        self._db_worker = HardwareDBWorker(self.hardware_db.sync_with_hashrate_no, force=True)
+        self._db_worker.result.connect(self._on_sync_done)
+        self._db_worker.error.connect(self._on_db_worker_error)
+        self._db_worker.start()
+    
+    def _on_sync_done(self, results: dict):
+        """hashrate.no Sync abgeschlossen (läuft im GUI-Thread)"""
+        self._reset_db_buttons()
+        self._details_cache.clear()
+        self._coin_cache.clear()
         
         self.refresh_data()
         
@@ -1768,62 +2647,137 @@ class HardwareTab(QWidget):
         
         self.sync_completed.emit(results)
     
+    def _on_db_worker_error(self, error: str):
+        """Fehler im Erkennungs-/Sync-Worker"""
+        self._reset_db_buttons()
+        QMessageBox.warning(self, "Fehler", f"Hardware-DB Fehler: {error}")
+    
+    def _reset_db_buttons(self):
+        """Setzt Erkennungs- und Sync-Button zurück"""
+        self.detect_btn.setText("🔍 Hardware erkennen")
+        self.detect_btn.setEnabled(True)
+        self.sync_btn.setText("🔄 Mit hashrate.no synchronisieren")
+        self.sync_btn.setEnabled(True)
+    
     def on_gpu_selected(self, gpu_name: str):
         """Zeigt beste Coins für ausgewählte GPU"""
         if not self.hardware_db or not gpu_name:
             return
         
         # Beste Coins holen
-        best_coins = self.hardware_db.get_best_coins_for_gpu(gpu_name, top_n=15)
+        best_coins = self._get_best_coins(gpu_name)
+        
+        # Globals für die Schleife lokal binden
+        hashrate_fmt, coin_hashrate = _HASHRATE_FMT, _COIN_HASHRATE
+        oc_fmt, coin_oc = _OC_FMT, _COIN_OC
+        
+        # Alle Spalten-Texte vorab formatieren (Index 7 = rohe Effizienz)
+        rows = [
+            (
+                coin['coin'],
+                coin['algorithm'],
+                hashrate_fmt(*coin_hashrate(coin)),
+                f"{coin['power_watts']:.0f} W",
+                f"{coin['efficiency']:.4f}",
+                oc_fmt(*coin_oc(coin['oc_settings'])),
+                "✅ Verifiziert" if coin.get('verified') else "📊 Daten",
+                coin['efficiency'],
+            )
+            for coin in best_coins
+        ]
         
-        self.coins_table.setRowCount(len(best_coins))
+        # Zeilen einmal in Spalten transponieren - das Model indiziert danach nur noch
+        columns = list(zip(*rows)) if rows else []
+        efficiency_colors = [
+            _ACCEPTED_FG if efficiency > 0.1 else None
+            for efficiency in (columns[7] if columns else ())
+        ]
         
-        for row, coin in enumerate(best_coins):
-            self.coins_table.setItem(row, 0, QTableWidgetItem(coin['coin']))
-            self.coins_table.setItem(row, 1, QTableWidgetItem(coin['algorithm']))
-            self.coins_table.setItem(row, 2, QTableWidgetItem(
-                f"{coin['hashrate']:.2f} {coin['hashrate_unit']}"
-            ))
-            self.coins_table.setItem(row, 3, QTableWidgetItem(f"{coin['power_watts']:.0f} W"))
-            
-            # Effizienz mit Farbe
-            eff_item = QTableWidgetItem(f"{coin['efficiency']:.4f}")
-            if coin['efficiency'] > 0.1:
-                eff_item.setForeground(QColor(COLORS['accepted']))
-            self.coins_table.setItem(row, 4, eff_item)
-            
-            # OC Settings
-            oc = coin['oc_settings']
-            oc_text = f"Core: {oc['core_offset']:+d}, Mem: {oc['memory_offset']:+d}, PL: {oc['power_limit']}%"
-            self.coins_table.setItem(row, 5, QTableWidgetItem(oc_text))
-            
-            # Status
-            status_item = QTableWidgetItem("✅ Verifiziert" if coin.get('verified') else "📊 Daten")
-            self.coins_table.setItem(row, 6, status_item)
+        self.coins_table.setUpdatesEnabled(False)
+        try:
+            self.coins_model.set_columns(
+                columns[:len(self.COIN_HEADERS)],
+                # Effizienz mit Farbe
+                {self.COIN_EFFICIENCY_COLUMN: efficiency_colors}
+            )
+        finally:
+            self.coins_table.setUpdatesEnabled(True)
+    
+    def _get_best_coins(self, gpu_name: str) -> List[Dict]:
+        """Beste Coins für eine GPU - gecacht pro (GPU, DB-Version)"""
+        key = (gpu_name, self.hardware_db.version())
+        best_coins = self._coin_cache.get(key)
+        if best_coins is not None:
+            self._coin_cache.move_to_end(key)
+            return best_coins
+        
+        best_coins = self.hardware_db.get_best_coins_for_gpu(gpu_name, top_n=15)
+        self._coin_cache[key] = best_coins
+        if len(self._coin_cache) > self.COIN_CACHE_SIZE:
+            self._coin_cache.popitem(last=False)
+        return best_coins
+    
+    def _on_gpu_cell_clicked(self, index):
+        """Klick auf die Aktionen-Spalte zeigt GPU-Details"""
+        if index.column() != self.GPU_DETAILS_COLUMN:
+            return
+        
+        gpu = self.gpu_model.row_object(index.row())
+        if gpu:
+            self.show_gpu_details(gpu)
+    
+    def _show_gpu_context_menu(self, pos):
+        """Kontextmenü für GPU-Zeile"""
+        index = self.gpu_table.indexAt(pos)
+        gpu = self.gpu_model.row_object(index.row()) if index.isValid() else None
+        if not gpu:
+            return
+        
+        menu = QMenu(self)
+        details_action = menu.addAction("📋 Details")
+        if menu.exec(self.gpu_table.viewport().mapToGlobal(pos)) == details_action:
+            self.show_gpu_details(gpu)
     
     def show_gpu_details(self, gpu):
         """Zeigt GPU-Details"""
-        msg = f"GPU: {gpu.name}\n"
-        msg += f"=" * 50 + "\n\n"
-        msg += f"Vendor: {gpu.vendor}\n"
-        msg += f"Model: {gpu.model}\n"
-        msg += f"VRAM: {gpu.vram_mb} MB\n"
-        msg += f"TDP: {gpu.tdp_watts} W\n"
-        msg += f"Boost Clock: {gpu.boost_clock_mhz} MHz\n"
-        msg += f"Memory Clock: {gpu.memory_clock_mhz} MHz\n"
-        msg += f"Driver: {gpu.driver_version}\n"
-        msg += f"PCI Bus: {gpu.pci_bus}\n\n"
-        msg += f"Unterstützte Algorithmen: {len(gpu.supported_algorithms)}\n"
-        
-        if gpu.supported_algorithms:
-            msg += f"  {', '.join(gpu.supported_algorithms[:10])}"
-            if len(gpu.supported_algorithms) > 10:
-                msg += f" ... (+{len(gpu.supported_algorithms) - 10})"
-        
-        msg += f"\n\nLetzter Sync: {gpu.last_sync or 'Nie'}"
-        msg += f"\nErkannt: {gpu.detected_at or 'Unbekannt'}"
+        # Nach PCI-Bus unterscheiden - mehrere identische Karten haben denselben Namen
+        key = (gpu.name, gpu.pci_bus)
+        msg = self._details_cache.get(key)
+        if msg is None:
+            msg = self._build_gpu_details(gpu)
+            self._details_cache[key] = msg
         
         QMessageBox.information(self, f"GPU Details: {gpu.name}", msg)
+    
+    def _build_gpu_details(self, gpu) -> str:
+        """Baut den Details-Text für eine GPU"""
+        algos = gpu.supported_algorithms
+        algo_line = ""
+        if algos:
+            algo_line = f"  {', '.join(algos[:10])}"
+            if len(algos) > 10:
+                algo_line += f" ... (+{len(algos) - 10})"
+        
+        parts = [
+            f"GPU: {gpu.name}",
+            "=" * 50,
+            "",
+            f"Vendor: {gpu.vendor}",
+            f"Model: {gpu.model}",
+            f"VRAM: {gpu.vram_mb} MB",
+            f"TDP: {gpu.tdp_watts} W",
+            f"Boost Clock: {gpu.boost_clock_mhz} MHz",
+            f"Memory Clock: {gpu.memory_clock_mhz} MHz",
+            f"Driver: {gpu.driver_version}",
+            f"PCI Bus: {gpu.pci_bus}",
+            "",
+            f"Unterstützte Algorithmen: {len(algos)}",
+            algo_line,
+            "",
+            f"Letzter Sync: {gpu.last_sync or 'Nie'}",
+            f"Erkannt: {gpu.detected_at or 'Unbekannt'}",
+        ]
+        return "\n".join(parts)
 
 
 class SettingsTab(QWidget):
@@ -1919,6 +2873,19 @@ class SettingsTab(QWidget):
         
         layout.addWidget(alert_group)
         
+        # Anzeige
+        display_group = QGroupBox("Anzeige")
+        display_layout = QGridLayout(display_group)
+        
+        display_layout.addWidget(QLabel("Dashboard-Update (s):"), 0, 0)
+        self.ui_poll_spin = QSpinBox()
+        self.ui_poll_spin.setRange(1, 60)
+        self.ui_poll_spin.setValue(5)
+        self.ui_poll_spin.setToolTip("Hashrate, Power, Shares und Profit - die Laufzeit läuft immer im Sekundentakt")
+        display_layout.addWidget(self.ui_poll_spin, 0, 1)
+        
+        layout.addWidget(display_group)
+        
         layout.addStretch()
         
         # Save Button
@@ -1939,6 +2906,7 @@ class SettingsTab(QWidget):
             'temp_warning': self.temp_warn_spin.value(),
             'notifications': self.notifications_check.isChecked(),
             'minimize_to_tray': self.minimize_to_tray_check.isChecked(),
+            'ui_poll_interval': self.ui_poll_spin.value(),
         }
         self.settings_changed.emit(settings)
         QMessageBox.information(self, "Gespeichert", "Einstellungen wurden gespeichert!")
@@ -1949,12 +2917,64 @@ class WalletsTab(QWidget):
     
     wallet_updated = Signal()
     
+    # Feste Farben/Schrift einmal erzeugen statt pro Zelle
+    _COLOR_BLUE = _COINEX_FG
+    _COLOR_GREEN = _GATEIO_FG
+    _COLOR_GRAY = QColor("#666666")
+    _FONT_BOLD = QFont('Arial', 10, QFont.Bold)
+    
+    # Job-Name der vorinstallierten CoinEx API beim Wallet-Laden (Börsen-IDs sind kleingeschrieben)
+    _COINEX_JOB = "CoinEx"
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.exchange_manager = None
+        self.exchange_api_status = self._probe_exchange_apis()
+        
+        # Bevorzugte Börse pro Coin (wird bei Favoriten-/Wallet-Änderungen geleert)
+        self._preferred_cache: Dict[str, str] = {}
+        # Börsen-Zuordnung der zuletzt gezeichneten Coin-Börsen-Tabelle
+        self._cached_exchange_map: Dict[str, tuple] = {}
+        
+        # Favoriten verzögert speichern - schnelle Klicks ergeben nur einen Schreibvorgang
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._do_save_coin_favorites)
+        
+        # Hintergrund-Worker für Börsen-Aufrufe
+        self._add_worker: Optional[ApiWorker] = None
+        self._fetch_workers: List[ApiWorker] = []
+        self._fetch_pending = set()
+        self._fetch_results: Dict[str, Any] = {}
+        
         self.setup_ui()
         self.load_exchange_manager()
     
+    def _probe_exchange_apis(self) -> Dict[str, Optional[bool]]:
+        """
+        Prüft einmalig ob CoinEx/Gate.io APIs verfügbar und konfiguriert sind
+        
+        Returns:
+            {'coinex': ..., 'gateio': ...} mit True = konfiguriert,
+            False = nicht konfiguriert, None = Modul/Config fehlerhaft
+        """
+        status = {}
+        
+        try:
+            from coinex_api import CoinExAPI
+            status['coinex'] = CoinExAPI().is_configured()
+        except:
+            status['coinex'] = None
+        
+        try:
+            from gateio_api import GateIOAPI
+            status['gateio'] = GateIOAPI().is_configured()
+        except:
+            status['gateio'] = None
+        
+        return status
+    
     def load_exchange_manager(self):
         """Lädt den Exchange Manager"""
         try:
@@ -1963,8 +2983,7 @@ class WalletsTab(QWidget):
             self.supported_exchanges = get_supported_exchanges()
             self.mining_coins = get_mining_coins()
             self.exchange_classes = EXCHANGE_CLASSES
-            self.refresh_exchanges_list()
-            self.refresh_wallets_list()
+            self.refresh_all()
         except ImportError as e:
             logger.error(f"Exchange API nicht verfügbar: {e}")
     
@@ -2060,16 +3079,16 @@ class WalletsTab(QWidget):
         coin_header.setStyleSheet("font-size: 13px; font-weight: bold;")
         coin_layout.addWidget(coin_header)
         
-        self.coin_exchange_table = QTableWidget()
-        self.coin_exchange_table.setColumnCount(4)
-        self.coin_exchange_table.setHorizontalHeaderLabels(['Coin', 'CoinEx', 'Gate.io', 'Favorit'])
-        self.coin_exchange_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.coin_exchange_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.coin_exchange_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        self.coin_exchange_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
+        # Model/View: Zellen werden erst beim Zeichnen (nur sichtbare Zeilen) erzeugt
+        self.coin_exchange_model = self._create_coin_exchange_model()
+        self.coin_exchange_table = QTableView()
+        self.coin_exchange_table.setModel(self.coin_exchange_model)
+        header = self.coin_exchange_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)  # Alle Spalten auf einmal
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
         self.coin_exchange_table.verticalHeader().setVisible(False)
         self.coin_exchange_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.coin_exchange_table.cellClicked.connect(self.on_coin_exchange_click)
+        self.coin_exchange_table.clicked.connect(self.on_coin_exchange_click)
         coin_layout.addWidget(self.coin_exchange_table)
         
         splitter.addWidget(coin_widget)
@@ -2086,9 +3105,9 @@ class WalletsTab(QWidget):
         self.wallets_table = QTableWidget()
         self.wallets_table.setColumnCount(3)
         self.wallets_table.setHorizontalHeaderLabels(['Coin', 'Adresse', 'Quelle'])
-        self.wallets_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.wallets_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.wallets_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        header = self.wallets_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
         self.wallets_table.verticalHeader().setVisible(False)
         self.wallets_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         wallet_layout.addWidget(self.wallets_table)
@@ -2134,275 +3153,220 @@ class WalletsTab(QWidget):
         """Zeigt/versteckt das Börse-hinzufügen Formular"""
         self.add_form_widget.setVisible(not self.add_form_widget.isVisible())
     
-    def refresh_exchanges_list(self):
+    def refresh_all(self):
+        """Aktualisiert Börsen, Coin-Zuordnung und Wallets mit einem einzigen wallets.json-Parse"""
+        try:
+            data = _load_wallets_json()
+        except Exception as e:
+            logger.error(f"Fehler beim Laden von wallets.json: {e}")
+            data = {}
+        
+        self.refresh_exchanges_list(data)
+        self.refresh_wallets_list(data)
+    
+    def refresh_exchanges_list(self, data: Optional[Dict[str, Any]] = None):
         """Aktualisiert die Börsen-Liste - zeigt nur aktive Börsen"""
         if not self.exchange_manager:
             return
         
-        # Wallet-Quellen aus wallets.json laden
-        wallet_sources = {}
-        try:
-            import json
-            from pathlib import Path
-            wallets_file = Path("wallets.json")
-            if wallets_file.exists():
-                with open(wallets_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    wallet_sources = data.get("wallet_sources", {})
-        except Exception as e:
-            logger.debug(f"Fehler beim Laden von wallets.json: {e}")
+        if data is None:
+            try:
+                data = _load_wallets_json()
+            except Exception as e:
+                logger.debug(f"Fehler beim Laden von wallets.json: {e}")
+                data = {}
         
-        # Zähle Wallets pro Börse
-        exchange_wallet_counts = {'coinex': 0, 'gateio': 0}
-        for coin, source in wallet_sources.items():
-            source_key = source.lower().replace(".", "").replace(" ", "")
-            if "coinex" in source_key:
-                exchange_wallet_counts['coinex'] += 1
-            elif "gate" in source_key:
-                exchange_wallet_counts['gateio'] += 1
+        # Zähle Wallets pro Börse (Quellen sind beim Laden bereits normalisiert)
+        exchange_wallet_counts = Counter(_load_normalized_wallet_sources(data).values())
         
         # Karten aktualisieren
         coinex_count = exchange_wallet_counts.get('coinex', 0)
         gateio_count = exchange_wallet_counts.get('gateio', 0)
         
-        # CoinEx Karte
-        try:
-            from coinex_api import CoinExAPI
-            coinex = CoinExAPI()
-            if coinex.is_configured():
-                self.coinex_status.setText("🔵 CoinEx ✅")
-                self.coinex_wallets.setText(f"📦 {coinex_count} Wallets")
-            else:
-                self.coinex_status.setText("🔵 CoinEx ⚠️")
-                self.coinex_wallets.setText("Nicht konfiguriert")
-        except:
+        # CoinEx Karte (Status aus dem einmaligen API-Check in __init__)
+        coinex_status = self.exchange_api_status.get('coinex')
+        if coinex_status:
+            self.coinex_status.setText("🔵 CoinEx ✅")
+            self.coinex_wallets.setText(f"📦 {coinex_count} Wallets")
+        elif coinex_status is False:
+            self.coinex_status.setText("🔵 CoinEx ⚠️")
+            self.coinex_wallets.setText("Nicht konfiguriert")
+        else:
             self.coinex_status.setText("🔵 CoinEx ❌")
             self.coinex_wallets.setText("Fehler")
         
         # Gate.io Karte
-        try:
-            from gateio_api import GateIOAPI
-            gateio = GateIOAPI()
-            if gateio.is_configured():
-                self.gateio_status.setText("🟢 Gate.io ✅")
-                self.gateio_wallets.setText(f"📦 {gateio_count} Wallets")
-            else:
-                self.gateio_status.setText("🟢 Gate.io ⚠️")
-                self.gateio_wallets.setText("Nicht konfiguriert")
-        except:
+        gateio_status = self.exchange_api_status.get('gateio')
+        if gateio_status:
+            self.gateio_status.setText("🟢 Gate.io ✅")
+            self.gateio_wallets.setText(f"📦 {gateio_count} Wallets")
+        elif gateio_status is False:
+            self.gateio_status.setText("🟢 Gate.io ⚠️")
+            self.gateio_wallets.setText("Nicht konfiguriert")
+        else:
             self.gateio_status.setText("🟢 Gate.io ❌")
             self.gateio_wallets.setText("Fehler")
         
         # Coin-Exchange-Tabelle auch aktualisieren
-        self.refresh_coin_exchange_table()
+        self.refresh_coin_exchange_table(data)
     
-    def refresh_wallets_list(self):
+    def refresh_wallets_list(self, data: Optional[Dict[str, Any]] = None):
         """Aktualisiert die Wallets-Liste direkt aus wallets.json"""
-        import json
-        from pathlib import Path
-        
         # Wallet-Daten aus wallets.json laden
-        wallets_data = {}
-        wallet_sources = {}
-        try:
-            wallets_file = Path("wallets.json")
-            if wallets_file.exists():
-                with open(wallets_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    wallets_data = data.get("wallets", {})
-                    wallet_sources = data.get("wallet_sources", {})
-        except Exception as e:
-            logger.error(f"Fehler beim Laden von wallets.json: {e}")
-        
-        # Sortierte Liste erstellen
-        wallet_list = sorted(wallets_data.items(), key=lambda x: x[0])
-        self.wallets_table.setRowCount(len(wallet_list))
-        
-        for row, (coin, address) in enumerate(wallet_list):
-            # Coin
-            coin_item = QTableWidgetItem(coin)
-            coin_item.setFont(QFont('Arial', 10, QFont.Bold))
-            self.wallets_table.setItem(row, 0, coin_item)
-            
-            # Adresse (gekürzt)
-            if len(address) > 40:
-                addr_display = address[:20] + "..." + address[-15:]
-            else:
-                addr_display = address
-            addr_item = QTableWidgetItem(addr_display)
-            addr_item.setToolTip(address)  # Volle Adresse als Tooltip
-            self.wallets_table.setItem(row, 1, addr_item)
-            
-            # Quelle aus wallet_sources
-            source = wallet_sources.get(coin, 'Manual')
-            source_item = QTableWidgetItem(source)
-            # Farbe je nach Quelle
-            if source == "Gate.io":
-                source_item.setForeground(QColor("#4CAF50"))  # Grün
-            elif source == "CoinEx":
-                source_item.setForeground(QColor("#2196F3"))  # Blau
-            self.wallets_table.setItem(row, 2, source_item)
+        if data is None:
+            try:
+                data = _load_wallets_json()
+            except Exception as e:
+                logger.error(f"Fehler beim Laden von wallets.json: {e}")
+                data = {}
+        
+        # Sortierte Zeilen (mit gekürzter Adresse) aus dem Cache
+        wallet_list = _load_wallet_rows(data)
+        
+        # Für die Schleife lokal binden
+        TWI = QTableWidgetItem
+        bold_font = self._FONT_BOLD
+        gateio_fg, coinex_fg = self._COLOR_GREEN, self._COLOR_BLUE
+        set_item = self.wallets_table.setItem
+        
+        with _bulk_table_update(self.wallets_table):
+            self.wallets_table.clearContents()
+            self.wallets_table.setRowCount(len(wallet_list))
+            
+            for row, (coin, address, addr_display, source) in enumerate(wallet_list):
+                # Coin
+                coin_item = TWI(coin)
+                coin_item.setFont(bold_font)
+                set_item(row, 0, coin_item)
+                
+                # Adresse (gekürzt)
+                addr_item = TWI(addr_display)
+                addr_item.setToolTip(address)  # Volle Adresse als Tooltip
+                set_item(row, 1, addr_item)
+                
+                # Quelle aus wallet_sources
+                source_item = TWI(source)
+                # Farbe je nach Quelle
+                if source == "Gate.io":
+                    source_item.setForeground(gateio_fg)  # Grün
+                elif source == "CoinEx":
+                    source_item.setForeground(coinex_fg)  # Blau
+                set_item(row, 2, source_item)
     
     def load_coin_favorites(self):
         """Lädt gespeicherte Favoriten aus wallets.json"""
         try:
-            import json
-            from pathlib import Path
-            wallets_file = Path("wallets.json")
-            if wallets_file.exists():
-                with open(wallets_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.coin_favorites = data.get("coin_favorites", {})
+            # Kopie - coin_favorites wird lokal verändert
+            self.coin_favorites = dict(_load_wallets_json().get("coin_favorites", {}))
         except:
             self.coin_favorites = {}
     
     def save_coin_favorites(self):
+        """Plant das Speichern der Favoriten (Timer startet bei jedem Aufruf neu)"""
+        self._save_timer.start()
+    
+    def flush_coin_favorites(self):
+        """Schreibt noch ausstehende Favoriten sofort (z.B. beim Beenden)"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save_coin_favorites()
+    
+    def _do_save_coin_favorites(self):
         """Speichert Favoriten in wallets.json"""
         try:
-            import json
-            from pathlib import Path
-            wallets_file = Path("wallets.json")
+            # Flache Kopie - der gecachte Stand darf nicht verändert werden
+            data = dict(_load_wallets_json())
+            data["coin_favorites"] = dict(self.coin_favorites)
             
-            data = {}
-            if wallets_file.exists():
-                with open(wallets_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            
-            data["coin_favorites"] = self.coin_favorites
-            
-            with open(wallets_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Atomar schreiben, Cache wird direkt mit aktualisiert
+            _write_wallets_json(data)
         except Exception as e:
             logger.error(f"Fehler beim Speichern der Favoriten: {e}")
+        
+        self._preferred_cache.clear()
     
-    def refresh_coin_exchange_table(self):
+    def refresh_coin_exchange_table(self, data: Optional[Dict[str, Any]] = None):
         """Füllt die Coin-Börsen-Zuordnungs-Tabelle"""
-        import json
-        from pathlib import Path
+        # Wallet-Quellen können sich geändert haben
+        self._preferred_cache.clear()
         
         # Wallet-Daten laden
-        wallet_sources = {}
-        wallets_data = {}
-        try:
-            wallets_file = Path("wallets.json")
-            if wallets_file.exists():
-                with open(wallets_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    wallet_sources = data.get("wallet_sources", {})
-                    wallets_data = data.get("wallets", {})
-        except:
-            pass
-        
-        # Coins nach Börsen gruppieren
-        coinex_coins = set()
-        gateio_coins = set()
-        
-        for coin, source in wallet_sources.items():
-            source_lower = source.lower().replace(".", "").replace(" ", "")
-            if source_lower == "coinex":
-                coinex_coins.add(coin)
-            elif source_lower == "gateio":
-                gateio_coins.add(coin)
-        
-        # Alle Coins sammeln
-        all_coins = sorted(set(wallets_data.keys()))
-        
-        # Gebühren-Info (typische Withdrawal Fees - Gate.io oft günstiger für größere Coins)
-        # Diese werden für die automatische Favorit-Auswahl genutzt
-        EXCHANGE_FEES = {
-            # Gate.io bevorzugt (bessere Liquidität, oft niedrigere Gebühren)
-            'gateio_preferred': ['ETH', 'BTC', 'LTC', 'BCH', 'DOGE', 'DASH', 'ZEC', 
-                                 'XMR', 'KAS', 'FLUX', 'ERG', 'RVN', 'ETC', 'ALPH',
-                                 'GRIN', 'BEAM', 'FIRO', 'CFX', 'KDA', 'DNX', 'XNA',
-                                 'IRON', 'CLORE', 'DGB', 'ARRR', 'QTC', 'CKB'],
-            # CoinEx bevorzugt (einzige Option oder bessere Konditionen)
-            'coinex_preferred': ['ALEO', 'NEXA', 'RTM', 'ZEPH', 'EPIC', 'DERO', 
-                                 'NEOX', 'MONA', 'VTC', 'HNS', 'KMD', 'QUAI']
-        }
-        
-        self.coin_exchange_table.setRowCount(len(all_coins))
+        if data is None:
+            try:
+                data = _load_wallets_json()
+            except:
+                data = {}
+        
+        # Coins den Börsen zuordnen: {coin: (has_coinex, has_gateio)} - einmal pro Laden
+        exchange_map = _load_exchange_map(data)
+        # Für Einzel-Updates nach einem Favoriten-Klick merken
+        self._cached_exchange_map = exchange_map
+        
+        # Alle Coins sortiert - einmal pro Laden von wallets.json
+        all_coins = _cached_wallets_view(data, 'sorted_coins', lambda d: sorted(d.get("wallets", {})))
+        
+        build_row = self._build_coin_row
+        self.coin_exchange_model.set_rows([build_row(coin, exchange_map) for coin in all_coins])
+    
+    def _create_coin_exchange_model(self) -> RowTupleModel:
+        """Model der Coin-Börsen-Tabelle, Zeilen: (coin, has_coinex, has_gateio, favorit, grund)"""
+        blue, green, gray = self._COLOR_BLUE, self._COLOR_GREEN, self._COLOR_GRAY
+        bold_font = self._FONT_BOLD
+        favorite_colors = {"Gate.io": green, "CoinEx": blue}
+        center = lambda r: Qt.AlignCenter
+        
+        return RowTupleModel(['Coin', 'CoinEx', 'Gate.io', 'Favorit'], {
+            Qt.DisplayRole: {
+                0: itemgetter(0),
+                1: lambda r: "✅" if r[1] else "❌",
+                2: lambda r: "✅" if r[2] else "❌",
+                3: lambda r: f"⭐ {r[3]}" if r[3] != "-" else "-",
+            },
+            Qt.ForegroundRole: {
+                1: lambda r: blue if r[1] else gray,
+                2: lambda r: green if r[2] else gray,
+                3: lambda r: favorite_colors.get(r[3]),
+            },
+            Qt.FontRole: {0: lambda r: bold_font},
+            Qt.TextAlignmentRole: {1: center, 2: center, 3: center},
+            Qt.ToolTipRole: {3: itemgetter(4)},  # Grund als Tooltip
+            # Verfügbarkeit als bool
+            Qt.UserRole: {1: itemgetter(1), 2: itemgetter(2)},
+        }, self)
+    
+    def _build_coin_row(self, coin: str, exchange_map: Dict[str, tuple]) -> tuple:
+        """Zeile der Coin-Börsen-Tabelle: (coin, has_coinex, has_gateio, favorit, grund)"""
+        # CoinEx / Gate.io verfügbar?
+        has_coinex, has_gateio = exchange_map.get(coin, (False, False))
+        
+        # Favorit bestimmen: Benutzer-Wahl, sonst vorberechnete Tabelle
+        favorite = self.coin_favorites.get(coin)
+        if favorite:
+            reason = "Benutzer-Wahl"
+        else:
+            favorite, reason = _FAVORITE_TABLE[
+                has_coinex, has_gateio, coin in _GATEIO_PREFERRED, coin in _COINEX_PREFERRED
+            ]
         
-        for row, coin in enumerate(all_coins):
-            # Coin-Name
-            coin_item = QTableWidgetItem(coin)
-            coin_item.setFont(QFont('Arial', 10, QFont.Bold))
-            self.coin_exchange_table.setItem(row, 0, coin_item)
-            
-            # CoinEx verfügbar?
-            has_coinex = coin in coinex_coins or wallet_sources.get(coin) == "CoinEx"
-            coinex_item = QTableWidgetItem("✅" if has_coinex else "❌")
-            coinex_item.setTextAlignment(Qt.AlignCenter)
-            if has_coinex:
-                coinex_item.setForeground(QColor("#2196F3"))
-            else:
-                coinex_item.setForeground(QColor("#666666"))
-            self.coin_exchange_table.setItem(row, 1, coinex_item)
-            
-            # Gate.io verfügbar?
-            has_gateio = coin in gateio_coins or wallet_sources.get(coin) == "Gate.io"
-            gateio_item = QTableWidgetItem("✅" if has_gateio else "❌")
-            gateio_item.setTextAlignment(Qt.AlignCenter)
-            if has_gateio:
-                gateio_item.setForeground(QColor("#4CAF50"))
-            else:
-                gateio_item.setForeground(QColor("#666666"))
-            self.coin_exchange_table.setItem(row, 2, gateio_item)
-            
-            # Favorit bestimmen
-            if coin in self.coin_favorites:
-                # Manuell gesetzt
-                favorite = self.coin_favorites[coin]
-                reason = "Benutzer-Wahl"
-            elif has_gateio and not has_coinex:
-                favorite = "Gate.io"
-                reason = "Nur dort verfügbar"
-            elif has_coinex and not has_gateio:
-                favorite = "CoinEx"
-                reason = "Nur dort verfügbar"
-            elif coin in EXCHANGE_FEES['gateio_preferred']:
-                favorite = "Gate.io"
-                reason = "Bessere Liquidität"
-            elif coin in EXCHANGE_FEES['coinex_preferred']:
-                favorite = "CoinEx"
-                reason = "Niedrigere Gebühren"
-            elif has_gateio:
-                favorite = "Gate.io"
-                reason = "Standard (bessere Liquidität)"
-            elif has_coinex:
-                favorite = "CoinEx"
-                reason = "Standard"
-            else:
-                favorite = "-"
-                reason = "Keine Börse"
-            
-            # Favorit anzeigen (mit Grund als Tooltip)
-            fav_text = f"⭐ {favorite}" if favorite != "-" else "-"
-            fav_item = QTableWidgetItem(fav_text)
-            fav_item.setToolTip(reason)  # Grund als Tooltip
-            fav_item.setTextAlignment(Qt.AlignCenter)
-            if favorite == "Gate.io":
-                fav_item.setForeground(QColor("#4CAF50"))
-            elif favorite == "CoinEx":
-                fav_item.setForeground(QColor("#2196F3"))
-            self.coin_exchange_table.setItem(row, 3, fav_item)
-    
-    def on_coin_exchange_click(self, row: int, column: int):
+        return coin, has_coinex, has_gateio, favorite, reason
+    
+    def _render_coin_row(self, row: int, coin: str, exchange_map: Dict[str, tuple]):
+        """Aktualisiert eine einzelne Zeile der Coin-Börsen-Tabelle"""
+        self.coin_exchange_model.set_row(row, self._build_coin_row(coin, exchange_map))
+    
+    def on_coin_exchange_click(self, index: QModelIndex):
         """Klick auf CoinEx oder Gate.io Spalte wechselt den Favorit"""
+        row, column = index.row(), index.column()
         if column not in [1, 2]:  # Nur CoinEx (1) oder Gate.io (2) Spalten
             return
         
-        coin_item = self.coin_exchange_table.item(row, 0)
-        if not coin_item:
+        values = self.coin_exchange_model.row_values(row)
+        if not values:
             return
-        coin = coin_item.text()
-        
-        coinex_item = self.coin_exchange_table.item(row, 1)
-        gateio_item = self.coin_exchange_table.item(row, 2)
-        
-        has_coinex = coinex_item and "✅" in coinex_item.text()
-        has_gateio = gateio_item and "✅" in gateio_item.text()
+        coin, has_coinex, has_gateio = values[:3]
         
         # Neuen Favorit setzen
+        self._preferred_cache.pop(coin, None)
         if column == 1 and has_coinex:
             self.coin_favorites[coin] = "CoinEx"
             logger.info(f"Favorit für {coin} auf CoinEx gesetzt")
@@ -2412,27 +3376,27 @@ class WalletsTab(QWidget):
         else:
             return  # Keine Änderung wenn Börse nicht verfügbar
         
-        # Speichern und Tabelle aktualisieren
+        # Nur diese Zeile neu zeichnen, Speichern wird gebündelt
+        self._render_coin_row(row, coin, self._cached_exchange_map)
         self.save_coin_favorites()
-        self.refresh_coin_exchange_table()
     
     def get_preferred_exchange(self, coin: str) -> str:
-        """Gibt die bevorzugte Börse für einen Coin zurück"""
+        """Gibt die bevorzugte Börse für einen Coin zurück (gecacht)"""
+        preferred = self._preferred_cache.get(coin)
+        if preferred is None:
+            preferred = self._preferred_cache[coin] = self._lookup_preferred_exchange(coin)
+        return preferred
+    
+    def _lookup_preferred_exchange(self, coin: str) -> str:
+        """Ermittelt die bevorzugte Börse: Favorit, sonst Wallet-Quelle, sonst Gate.io"""
         if coin in self.coin_favorites:
             return self.coin_favorites[coin]
         
         # Standard-Logik
-        import json
-        from pathlib import Path
-        
         try:
-            wallets_file = Path("wallets.json")
-            if wallets_file.exists():
-                with open(wallets_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    source = data.get("wallet_sources", {}).get(coin)
-                    if source:
-                        return source
+            source = _load_wallets_json().get("wallet_sources", {}).get(coin)
+            if source:
+                return source
         except:
             pass
         
@@ -2453,27 +3417,48 @@ class WalletsTab(QWidget):
             QMessageBox.warning(self, "Fehler", "API Key und Secret sind erforderlich!")
             return
         
+        if self._add_worker and self._add_worker.isRunning():
+            return
+        
         # Verbindung testen und hinzufügen
         self.add_exchange_btn.setText("⏳ Teste Verbindung...")
         self.add_exchange_btn.setEnabled(False)
-        QApplication.processEvents()
         
-        success, message = self.exchange_manager.add_exchange(
+        # Verbindungstest im Hintergrund - GUI bleibt bedienbar
+        self._add_worker = ApiWorker(
+            exchange_name, self.exchange_manager.add_exchange,
             exchange_name, api_key, api_secret, passphrase
         )
-        
+        self._add_worker.result.connect(self._on_add_exchange_done)
+        self._add_worker.error.connect(self._on_add_exchange_error)
+        self._add_worker.start()
+    
+    def _reset_add_exchange_btn(self):
+        """Setzt den Hinzufügen-Button nach dem Verbindungstest zurück"""
         self.add_exchange_btn.setText("➕ Börse hinzufügen & testen")
         self.add_exchange_btn.setEnabled(True)
+    
+    def _on_add_exchange_done(self, exchange_name: str, result):
+        """Verbindungstest abgeschlossen (läuft im GUI-Thread)"""
+        success, message = result
+        self._reset_add_exchange_btn()
         
         if success:
             QMessageBox.information(self, "Erfolg", message)
             self.api_key_edit.clear()
             self.api_secret_edit.clear()
             self.passphrase_edit.clear()
+            # Neue Credentials - API-Status neu prüfen
+            self.exchange_api_status = self._probe_exchange_apis()
             self.refresh_exchanges_list()
         else:
             QMessageBox.warning(self, "Fehler", message)
     
+    def _on_add_exchange_error(self, exchange_name: str, error: str):
+        """Verbindungstest fehlgeschlagen (läuft im GUI-Thread)"""
+        self._reset_add_exchange_btn()
+        QMessageBox.warning(self, "Fehler", f"Verbindung zu {exchange_name} fehlgeschlagen:\n{error}")
+    
     def remove_exchange(self, exchange_id: str):
         """Entfernt eine Börse"""
         reply = QMessageBox.question(
@@ -2491,54 +3476,103 @@ class WalletsTab(QWidget):
         if not self.exchange_manager:
             return
         
+        if self._fetch_pending:
+            return
+        
         self.fetch_all_btn.setText("⏳ Lade Wallets...")
         self.fetch_all_btn.setEnabled(False)
-        QApplication.processEvents()
         
-        total_count = 0
-        
-        # 1. CoinEx ZUERST (vorinstalliert!)
+        # Alle Börsen parallel im Hintergrund abfragen, zusammengeführt wird
+        # erst wenn alle fertig sind (Reihenfolge: CoinEx zuerst, dann die anderen)
+        jobs = {self._COINEX_JOB: self._fetch_coinex_wallets}
+        for exc_id, exchange in self.exchange_manager.exchanges.items():
+            if exchange.is_configured():
+                jobs[exc_id] = exchange.get_all_addresses
+        
+        self._fetch_results = dict.fromkeys(jobs)
+        self._fetch_pending = set(jobs)
+        self._fetch_workers = []
+        
+        for name, func in jobs.items():
+            worker = ApiWorker(name, func)
+            worker.result.connect(self._on_wallet_fetch_result)
+            worker.error.connect(self._on_wallet_fetch_error)
+            worker.finished.connect(self._on_wallet_fetch_finished)
+            self._fetch_workers.append(worker)
+            worker.start()
+    
+    @staticmethod
+    def _fetch_coinex_wallets() -> Dict[str, Any]:
+        """Holt die Mining-Wallets von CoinEx (läuft im Worker-Thread)"""
         try:
             from coinex_api import CoinExAPI
-            coinex = CoinExAPI()
-            
-            if coinex.is_configured():
-                logger.info("Lade Wallets von CoinEx...")
-                coinex_wallets = coinex.get_all_mining_wallets()
-                
-                for coin, data in coinex_wallets.items():
-                    address = data.get('address', '')
-                    if address:
-                        # WICHTIG: Nur coin als Key, nicht coinex_coin!
-                        from exchange_manager import WalletInfo
-                        wallet = WalletInfo(
-                            coin=coin.upper(),
-                            address=address,
-                            chain=data.get('chain', coin),
-                            memo=data.get('memo', ''),
-                            source='CoinEx',
-                            last_sync=time.strftime('%Y-%m-%d %H:%M:%S')
-                        )
-                        # Speichere mit coin als Key
-                        self.exchange_manager.wallets[coin.upper()] = wallet
-                        total_count += 1
-                
-                logger.info(f"CoinEx: {total_count} Wallets geladen")
-                
-                # WICHTIG: Wallets sofort speichern!
-                self.exchange_manager._save_wallets()
-                
+            from exchange_manager import WalletInfo
         except ImportError:
             logger.debug("CoinEx API nicht verfügbar")
-        except Exception as e:
-            logger.error(f"CoinEx Wallet-Laden Fehler: {e}")
+            return {}
         
-        # 2. Dann andere Börsen
-        try:
-            other_count = self.exchange_manager.fetch_all_wallets()
-            total_count += other_count
-        except Exception as e:
-            logger.error(f"Andere Börsen Fehler: {e}")
+        coinex = CoinExAPI()
+        if not coinex.is_configured():
+            return {}
+        
+        logger.info("Lade Wallets von CoinEx...")
+        wallets = {}
+        
+        for coin, data in coinex.get_all_mining_wallets().items():
+            address = data.get('address', '')
+            if address:
+                # WICHTIG: Nur coin als Key, nicht coinex_coin!
+                wallets[coin.upper()] = WalletInfo(
+                    coin=coin.upper(),
+                    address=address,
+                    chain=data.get('chain', coin),
+                    memo=data.get('memo', ''),
+                    source='CoinEx',
+                    last_sync=time.strftime('%Y-%m-%d %H:%M:%S')
+                )
+        
+        logger.info(f"CoinEx: {len(wallets)} Wallets geladen")
+        return wallets
+    
+    def _on_wallet_fetch_result(self, name: str, result):
+        """Ergebnis einer Börse merken (läuft im GUI-Thread)"""
+        self._fetch_results[name] = result
+    
+    def _on_wallet_fetch_error(self, name: str, error: str):
+        """Fehler einer Börse loggen (läuft im GUI-Thread)"""
+        if name == self._COINEX_JOB:
+            logger.error(f"CoinEx Wallet-Laden Fehler: {error}")
+        else:
+            logger.error(f"Fehler bei {name}: {error}")
+    
+    def _on_wallet_fetch_finished(self):
+        """Ein Worker ist fertig - sobald alle durch sind, Ergebnisse übernehmen"""
+        self._fetch_pending.discard(self.sender().name)
+        if not self._fetch_pending:
+            self._apply_fetched_wallets()
+    
+    def _apply_fetched_wallets(self):
+        """Führt die geladenen Wallets aller Börsen zusammen (läuft im GUI-Thread)"""
+        wallets = self.exchange_manager.wallets
+        results = self._fetch_results
+        self._fetch_results = {}
+        
+        # 1. CoinEx ZUERST (vorinstalliert!) - überschreibt vorhandene Einträge
+        coinex_wallets = results.pop(self._COINEX_JOB, None) or {}
+        wallets.update(coinex_wallets)
+        total_count = len(coinex_wallets)
+        
+        # 2. Dann andere Börsen - nur Coins die noch keine Wallet haben
+        # (Abruf-Fehler einzelner Börsen wurden schon im Worker abgefangen)
+        for addresses in results.values():
+            for addr in addresses or ():
+                if addr.coin not in wallets:
+                    wallets[addr.coin] = addr
+                    total_count += 1
+        
+        # WICHTIG: Einmal am Ende speichern
+        if total_count > 0:
+            self.exchange_manager._save_wallets()
         
         self.fetch_all_btn.setText("🔄 Alle Wallets laden")
         self.fetch_all_btn.setEnabled(True)
@@ -2589,6 +3623,35 @@ class WalletsTab(QWidget):
         self.wallet_updated.emit()
 
 
+class MineButtonDelegate(QStyledItemDelegate):
+    """
+    Zeichnet die Mine-Buttons der Profit-Tabelle
+    
+    Statt pro Zeile ein QPushButton-Widget anzulegen, wird der Button nur
+    gemalt. Ob eine Wallet vorhanden ist steht als bool in Qt.UserRole der
+    Zelle, Klicks laufen über das clicked-Signal der Tabelle.
+    """
+    
+    _COLOR_LOCKED = QColor("#888888")
+    
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = index.data(Qt.DisplayRole) or ""
+        button.state = QStyle.State_Enabled | QStyle.State_Raised
+        button.palette = QPalette(option.palette)
+        if not index.data(Qt.UserRole):
+            button.palette.setColor(QPalette.ButtonText, self._COLOR_LOCKED)
+        
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button, painter, widget)
+    
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        return QSize(size.width() + 24, size.height() + 6)  # Platz für den Button-Rahmen
+
+
 class AutoProfitTab(QWidget):
     """
     Auto-Profit Tab - Automatischer Coin-Wechsel für maximalen Gewinn!
@@ -2602,18 +3665,39 @@ class AutoProfitTab(QWidget):
     
     switch_requested = Signal(dict)  # Signal zum Mining-Wechsel
     
+    # Feste Farben/Schrift einmal erzeugen statt pro Zelle
+    _COLOR_GOLD = QColor("#FFD700")
+    _COLOR_SILVER = QColor("#C0C0C0")
+    _COLOR_BRONZE = QColor("#CD7F32")
+    _COLOR_PROFIT = QColor("#00FF00")
+    _COLOR_GRAY = QColor("#666666")
+    _COLOR_DIMMED = QColor("#888888")  # Grau wenn keine Wallet
+    _RANK_COLORS = (_COLOR_GOLD, _COLOR_SILVER, _COLOR_BRONZE)
+    _FONT_BOLD = QFont('Arial', 10, QFont.Bold)
+    
+    MINE_COLUMN = 6
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.profit_calc = None
         self.auto_switch_enabled = False
         self.current_coin = ""
         self.min_profit_diff = 5.0  # Mindestens 5% mehr für Wechsel
+        self._profit_worker: Optional[ApiWorker] = None
+        self._dashboard = None  # Hauptfenster (gpu_monitor, _current_coin), siehe set_dashboard
+        
+        # wallets.json Pfad einmal bestimmen, geparste Wallets über mtime cachen
+        self._wallet_path = self._resolve_wallet_path()
+        self._available_wallets_cache = (None, {})  # (st_mtime_ns, gültige Wallets)
+        self._wallets_worker: Optional[ApiWorker] = None
+        self._wallets_worker_mtime = None  # mtime der Datei, die gerade geparst wird
         
         # Timer für Updates
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.refresh_profits)
         
         self.setup_ui()
+        self.get_available_wallets()  # Wallets schon im Hintergrund laden
         self.load_profit_calculator()
     
     def set_current_coin(self, coin: str):
@@ -2634,38 +3718,34 @@ class AutoProfitTab(QWidget):
         
         logger.info(f"AutoProfit: Aktueller Coin = {coin}")
     
+    def set_dashboard(self, dashboard):
+        """Setzt das Hauptfenster, von dem GPU-Monitor und aktueller Coin gelesen werden"""
+        self._dashboard = dashboard
+    
+    def _get_dashboard(self):
+        """Hauptfenster - falls nicht gesetzt, einmal unter den Top-Level-Fenstern suchen und merken"""
+        if self._dashboard is None:
+            self._dashboard = _find_main_window()
+        return self._dashboard
+    
     def load_profit_calculator(self):
         """Lädt den Profit Calculator mit GPU-Erkennung"""
         try:
             from profit_calculator import get_profit_calculator
             
-            # GPU-Name aus Parent (MiningDashboard) holen
+            # GPU-Name aus dem Hauptfenster holen
             gpu_name = None
             try:
-                # Versuche GPU-Name aus dem Parent zu bekommen
-                parent = self.parent()
-                while parent:
-                    if hasattr(parent, 'gpu_monitor') and parent.gpu_monitor:
-                        gpus = parent.gpu_monitor.get_gpu_stats()
-                        if gpus:
-                            gpu_name = gpus[0].name
-                            break
-                    parent = parent.parent() if hasattr(parent, 'parent') else None
+                dashboard = self._get_dashboard()
+                if dashboard is not None and getattr(dashboard, 'gpu_monitor', None):
+                    gpus = dashboard.gpu_monitor.get_gpu_stats()
+                    if gpus:
+                        gpu_name = gpus[0].name
             except:
                 pass
             
-            # Fallback: NVML direkt nutzen
-            if not gpu_name:
-                try:
-                    import pynvml
-                    pynvml.nvmlInit()
-                    handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-                    gpu_name = pynvml.nvmlDeviceGetName(handle)
-                    if isinstance(gpu_name, bytes):
-                        gpu_name = gpu_name.decode('utf-8')
-                    pynvml.nvmlShutdown()
-                except:
-                    gpu_name = "RTX 3070"  # Default
+            # Fallback: NVML direkt nutzen (Ergebnis gecacht)
+            gpu_name = gpu_name or _detect_gpu_name()
             
             self.profit_calc = get_profit_calculator(gpu_name)
             logger.info(f"AutoProfit: Calculator geladen für GPU: {gpu_name}")
@@ -2748,20 +3828,19 @@ class AutoProfitTab(QWidget):
         table_header.setStyleSheet("font-size: 14px; font-weight: bold; margin-top: 10px;")
         layout.addWidget(table_header)
         
-        self.coins_table = QTableWidget()
-        self.coins_table.setColumnCount(7)
-        self.coins_table.setHorizontalHeaderLabels([
-            'Rang', 'Coin', 'Algorithmus', '$/Tag', 'Pool', 'Miner', 'Aktion'
-        ])
-        self.coins_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.coins_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.coins_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.coins_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        self.coins_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        self.coins_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeToContents)
-        self.coins_table.horizontalHeader().setSectionResizeMode(6, QHeaderView.ResizeToContents)
+        # Model/View: Zellen werden erst beim Zeichnen (nur sichtbare Zeilen) erzeugt
+        self.coins_model = self._create_coins_model()
+        self.coins_table = QTableView()
+        self.coins_table.setModel(self.coins_model)
+        header = self.coins_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)  # Alle Spalten auf einmal
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
         self.coins_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.coins_table.setAlternatingRowColors(True)
+        self.coins_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Mine-Buttons nur gemalt, Klick wird über clicked verteilt
+        self.coins_table.setItemDelegateForColumn(self.MINE_COLUMN, MineButtonDelegate(self.coins_table))
+        self.coins_table.clicked.connect(self._on_coins_table_clicked)
         layout.addWidget(self.coins_table)
         
         # === BUTTONS ===
@@ -2807,17 +3886,11 @@ class AutoProfitTab(QWidget):
         """Auto-Switch ein/ausschalten"""
         self.auto_switch_enabled = enabled
         if enabled:
-            # Aktuellen Coin vom Parent holen falls nicht gesetzt
+            # Aktuellen Coin vom Hauptfenster holen falls nicht gesetzt
             if not self.current_coin:
-                try:
-                    parent = self.parent()
-                    while parent:
-                        if hasattr(parent, '_current_coin') and parent._current_coin:
-                            self.set_current_coin(parent._current_coin)
-                            break
-                        parent = parent.parent() if hasattr(parent, 'parent') else None
-                except:
-                    pass
+                dashboard_coin = getattr(self._get_dashboard(), '_current_coin', "")
+                if dashboard_coin:
+                    self.set_current_coin(dashboard_coin)
             
             self.update_timer.start(self.interval_spin.value() * 1000)
             logger.info(f"Auto-Switch aktiviert (Aktueller Coin: {self.current_coin or 'keiner'})")
@@ -2838,119 +3911,44 @@ class AutoProfitTab(QWidget):
         if not self.profit_calc:
             return
         
+        if self._profit_worker and self._profit_worker.isRunning():
+            return
+        
         self.refresh_btn.setText("⏳ Lade...")
         self.refresh_btn.setEnabled(False)
-        QApplication.processEvents()
         
+        # Profit-Daten (WhatToMine) im Hintergrund holen - GUI bleibt bedienbar
+        self._profit_worker = ApiWorker("profits", self.profit_calc.get_most_profitable)
+        self._profit_worker.result.connect(self._on_profits_loaded)
+        self._profit_worker.error.connect(self._on_profits_error)
+        self._profit_worker.start()
+    
+    def _on_profits_error(self, name: str, error: str):
+        """Profit-Daten konnten nicht geladen werden (läuft im GUI-Thread)"""
+        logger.error(f"Profit-Update Fehler: {error}")
+        self.refresh_btn.setText("🔄 Jetzt aktualisieren")
+        self.refresh_btn.setEnabled(True)
+    
+    def _on_profits_loaded(self, name: str, most_profitable: List[Dict]):
+        """Füllt die Tabelle mit den geladenen Profit-Daten (läuft im GUI-Thread)"""
         try:
-            # Top Coins holen
-            top_coins = self.profit_calc.get_most_profitable()[:15]
-            
-            # Verfügbare Wallets holen
-            available_wallets = self.get_available_wallets()
-            
-            # Tabelle füllen
-            self.coins_table.setRowCount(len(top_coins))
+            # Top Coins
+            top_coins = most_profitable[:15]
             
-            # Pool-Fetcher für automatische Pools
-            try:
-                from auto_pool_fetcher import get_pool_fetcher, KNOWN_POOLS
-                pool_fetcher = get_pool_fetcher()
-            except ImportError:
-                pool_fetcher = None
-                KNOWN_POOLS = {}
-            
-            from auto_profit_switcher import BEST_POOLS, ALGO_MINER_MAP
-            
-            best_mineable = None  # Bester Coin MIT Wallet
+            # Verfügbare Wallets einmal holen
+            available_wallets = frozenset(self.get_available_wallets())
             
-            for row, coin_data in enumerate(top_coins):
-                coin = coin_data['coin']
-                algo = coin_data['algorithm']
-                profit = coin_data['usd_profit_24h']
-                has_wallet = coin in available_wallets
-                
-                # Bester mineabler Coin merken
-                if has_wallet and best_mineable is None:
-                    best_mineable = coin_data
-                
-                # Rang
-                rang_item = QTableWidgetItem(f"#{row + 1}")
-                rang_item.setTextAlignment(Qt.AlignCenter)
-                if row == 0:
-                    rang_item.setForeground(QColor("#FFD700"))  # Gold
-                elif row == 1:
-                    rang_item.setForeground(QColor("#C0C0C0"))  # Silber
-                elif row == 2:
-                    rang_item.setForeground(QColor("#CD7F32"))  # Bronze
-                self.coins_table.setItem(row, 0, rang_item)
-                
-                # Coin (mit Wallet-Indikator)
-                coin_text = f"✅ {coin}" if has_wallet else f"❌ {coin}"
-                coin_item = QTableWidgetItem(coin_text)
-                coin_item.setFont(QFont('Arial', 10, QFont.Bold))
-                if not has_wallet:
-                    coin_item.setForeground(QColor("#888888"))  # Grau wenn keine Wallet
-                self.coins_table.setItem(row, 1, coin_item)
-                
-                # Algorithmus
-                algo_item = QTableWidgetItem(algo)
-                if not has_wallet:
-                    algo_item.setForeground(QColor("#888888"))
-                self.coins_table.setItem(row, 2, algo_item)
-                
-                # Profit
-                profit_item = QTableWidgetItem(f"${profit:.2f}")
-                profit_item.setForeground(QColor("#00FF00") if has_wallet else QColor("#666666"))
-                profit_item.setFont(QFont('Arial', 10, QFont.Bold))
-                self.coins_table.setItem(row, 3, profit_item)
-                
-                # Bester Pool (Auto-Fetch!)
-                pool_name = "N/A"
-                # 1. Versuche von auto_pool_fetcher
-                if pool_fetcher:
-                    best_pool = pool_fetcher.get_best_pool(coin)
-                    if best_pool:
-                        pool_name = best_pool['name']
-                # 2. Fallback auf BEST_POOLS
-                if pool_name == "N/A":
-                    pools = BEST_POOLS.get(coin, [])
-                    if pools:
-                        pool_name = pools[0].name if hasattr(pools[0], 'name') else str(pools[0])
-                # 3. Fallback auf KNOWN_POOLS
-                if pool_name == "N/A" and coin in KNOWN_POOLS:
-                    pool_name = KNOWN_POOLS[coin][0]['name']
-                
-                pool_item = QTableWidgetItem(pool_name)
-                if not has_wallet:
-                    pool_item.setForeground(QColor("#888888"))
-                self.coins_table.setItem(row, 4, pool_item)
-                
-                # Bester Miner
-                miners = ALGO_MINER_MAP.get(algo, [])
-                miner_name = miners[0] if miners else "N/A"
-                miner_item = QTableWidgetItem(miner_name)
-                if not has_wallet:
-                    miner_item.setForeground(QColor("#888888"))
-                self.coins_table.setItem(row, 5, miner_item)
-                
-                # Mine-Button (nur aktiv wenn Wallet vorhanden)
-                if has_wallet:
-                    mine_btn = QPushButton("⛏️ Mine")
-                    mine_btn.clicked.connect(lambda checked, c=coin: self.start_mining_coin(c))
-                else:
-                    mine_btn = QPushButton("🔒 Wallet")
-                    mine_btn.setToolTip(f"Keine Wallet für {coin} konfiguriert!\nBitte im Wallets Tab hinzufügen.")
-                    mine_btn.setStyleSheet("color: #888888;")
-                    mine_btn.clicked.connect(lambda checked, c=coin: self._show_wallet_hint(c))
-                self.coins_table.setCellWidget(row, 6, mine_btn)
+            # Erst alle Lookups erledigen, dann nur noch Items setzen
+            rows = self._prepare_rows(top_coins, available_wallets)
+            self._render_rows(rows)
             
             # Besten MINEBAREN Coin anzeigen (nicht den absolut besten)
+            best_mineable = next((r for r in rows if r[6]), None)  # Bester Coin MIT Wallet
             if best_mineable:
-                self.best_coin_label.setText(f"✅ {best_mineable['coin']}")
-                self.best_profit_label.setText(f"${best_mineable['usd_profit_24h']:.2f}")
-            elif top_coins:
-                self.best_coin_label.setText(f"❌ {top_coins[0]['coin']}")
+                self.best_coin_label.setText(f"✅ {best_mineable[1]}")
+                self.best_profit_label.setText(f"${best_mineable[3]:.2f}")
+            elif rows:
+                self.best_coin_label.setText(f"❌ {rows[0][1]}")
                 self.best_profit_label.setText(f"(keine Wallet)")
             
             # Auto-Switch prüfen (nur wenn aktiviert)
@@ -2958,7 +3956,6 @@ class AutoProfitTab(QWidget):
                 self.check_auto_switch(top_coins)
             
             # Update Zeit
-            from datetime import datetime
             self.last_update_label.setText(f"Letztes Update: {datetime.now().strftime('%H:%M:%S')}")
             
         except Exception as e:
@@ -2967,6 +3964,108 @@ class AutoProfitTab(QWidget):
         self.refresh_btn.setText("🔄 Jetzt aktualisieren")
         self.refresh_btn.setEnabled(True)
     
+    def _prepare_rows(self, top_coins: List[Dict], available_wallets: frozenset) -> List[tuple]:
+        """
+        Bereitet die Zeilen der Coins-Tabelle vor (alle Lookups inkl. Pool-Fallbacks)
+        
+        Returns:
+            Liste von (rank, coin, algo, profit, pool, miner, has_wallet) Tupeln
+        """
+        # Pool-Fetcher für automatische Pools
+        try:
+            from auto_pool_fetcher import get_pool_fetcher, KNOWN_POOLS
+            pool_fetcher = get_pool_fetcher()
+        except ImportError:
+            pool_fetcher = None
+            KNOWN_POOLS = {}
+        
+        rows = []
+        for rank, coin_data in enumerate(top_coins, 1):
+            coin = coin_data['coin']
+            algo = coin_data['algorithm']
+            
+            # Bester Pool (Auto-Fetch!)
+            pool_name = "N/A"
+            # 1. Versuche von auto_pool_fetcher
+            if pool_fetcher:
+                best_pool = pool_fetcher.get_best_pool(coin)
+                if best_pool:
+                    pool_name = best_pool['name']
+            # 2. Fallback auf BEST_POOLS
+            if pool_name == "N/A":
+                pools = BEST_POOLS.get(coin, [])
+                if pools:
+                    pool_name = pools[0].name if hasattr(pools[0], 'name') else str(pools[0])
+            # 3. Fallback auf KNOWN_POOLS
+            if pool_name == "N/A" and coin in KNOWN_POOLS:
+                pool_name = KNOWN_POOLS[coin][0]['name']
+            
+            # Bester Miner
+            miners = ALGO_MINER_MAP.get(algo, [])
+            miner_name = miners[0] if miners else "N/A"
+            
+            rows.append((rank, coin, algo, coin_data['usd_profit_24h'], pool_name,
+                         miner_name, coin in available_wallets))
+        return rows
+    
+    def _create_coins_model(self) -> RowTupleModel:
+        """Model der Coins-Tabelle über den Tupeln aus _prepare_rows"""
+        rank_colors = self._RANK_COLORS
+        bold_font = self._FONT_BOLD
+        dimmed = self._COLOR_DIMMED
+        profit_fg, gray = self._COLOR_PROFIT, self._COLOR_GRAY
+        # Grau wenn keine Wallet
+        dim_without_wallet = lambda r: None if r[6] else dimmed
+        bold = lambda r: bold_font
+        
+        return RowTupleModel(['Rang', 'Coin', 'Algorithmus', '$/Tag', 'Pool', 'Miner', 'Aktion'], {
+            Qt.DisplayRole: {
+                0: lambda r: f"#{r[0]}",
+                1: lambda r: f"✅ {r[1]}" if r[6] else f"❌ {r[1]}",  # Coin mit Wallet-Indikator
+                2: itemgetter(2),
+                3: lambda r: f"${r[3]:.2f}",
+                4: itemgetter(4),
+                5: itemgetter(5),
+                6: lambda r: "⛏️ Mine" if r[6] else "🔒 Wallet",  # gemalt vom MineButtonDelegate
+            },
+            Qt.ForegroundRole: {
+                0: lambda r: rank_colors[r[0] - 1] if r[0] <= 3 else None,  # Gold/Silber/Bronze
+                1: dim_without_wallet,
+                2: dim_without_wallet,
+                3: lambda r: profit_fg if r[6] else gray,
+                4: dim_without_wallet,
+                5: dim_without_wallet,
+            },
+            Qt.FontRole: {1: bold, 3: bold},
+            Qt.TextAlignmentRole: {0: lambda r: Qt.AlignCenter},
+            Qt.ToolTipRole: {
+                6: lambda r: None if r[6] else
+                   f"Keine Wallet für {r[1]} konfiguriert!\nBitte im Wallets Tab hinzufügen.",
+            },
+            # Reiner Coin-Name bzw. Wallet vorhanden (für Klicks)
+            Qt.UserRole: {1: itemgetter(1), 6: itemgetter(6)},
+        }, self)
+    
+    def _render_rows(self, rows: List[tuple]):
+        """Übergibt die vorbereiteten Zeilen an die Coins-Tabelle (ein Model-Reset)"""
+        self.coins_model.set_rows(rows)
+    
+    def _on_coins_table_clicked(self, index: QModelIndex):
+        """Klick auf einen Mine-Button: Mining starten bzw. Wallet-Hinweis zeigen"""
+        if index.column() != self.MINE_COLUMN:
+            return
+        
+        values = self.coins_model.row_values(index.row())
+        if not values:
+            return
+        
+        coin, has_wallet = values[1], values[6]
+        if has_wallet:
+            # Algorithmus und Profit stehen bereits in der Zeile
+            self.start_mining_coin(coin, {'algorithm': values[2], 'usd_profit_24h': values[3]})
+        else:
+            self._show_wallet_hint(coin)
+    
     def _show_wallet_hint(self, coin: str):
         """Zeigt Hinweis dass Wallet fehlt"""
         QMessageBox.information(
@@ -2980,61 +4079,66 @@ class AutoProfitTab(QWidget):
             f"Tipp: Du kannst auch CoinEx-Adressen automatisch importieren!"
         )
     
+    @staticmethod
+    def _resolve_wallet_path() -> Path:
+        """wallets.json neben dem Skript, sonst im Arbeitsverzeichnis"""
+        wallet_file = _DEFAULT_WALLETS_JSON
+        if not wallet_file.exists():
+            wallet_file = Path('wallets.json')
+        return wallet_file
+    
     def get_available_wallets(self) -> Dict[str, str]:
         """
         Holt alle verfügbaren Wallets.
         
         EINFACHE LOGIK: Nur aus wallets.json laden!
         CoinEx speichert dort automatisch beim Start.
-        """
-        wallets = {}
         
-        # Aus wallets.json laden (EINZIGE QUELLE!)
+        Das Ergebnis wird gecacht, solange sich die mtime der Datei nicht ändert
+        (nicht verändern - wird geteilt). Bei geänderter Datei wird im Hintergrund
+        neu geparst und bis dahin der letzte bekannte Stand geliefert.
+        """
         try:
-            import json
-            import os
-            
-            # Datei finden
-            wallet_file = Path(__file__).parent / 'wallets.json'
-            if not wallet_file.exists():
-                wallet_file = Path('wallets.json')
-            
-            if wallet_file.exists():
-                with open(wallet_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Wallets extrahieren
-                raw_wallets = data.get('wallets', {})
-                
-                for coin, value in raw_wallets.items():
-                    # Einfaches Format: "RVN": "adresse"
-                    if isinstance(value, str) and len(value) > 10:
-                        wallets[coin.upper()] = value
-                    # Dict Format: "RVN": {"address": "...", ...}
-                    elif isinstance(value, dict):
-                        addr = value.get('address', '')
-                        if addr and len(addr) > 10:
-                            wallets[coin.upper()] = addr
-                
-                logger.debug(f"wallets.json: {len(wallets)} Wallets geladen")
-                
-        except Exception as e:
-            logger.error(f"wallets.json Fehler: {e}")
-        
-        # Ungültige filtern
-        valid_wallets = {
-            coin: addr for coin, addr in wallets.items()
-            if addr and len(addr) > 10 
-            and not addr.startswith("DEINE_")
-            and not addr.endswith("...")  # Platzhalter
-        }
-        
-        if valid_wallets:
-            logger.info(f"Verfügbare Wallets: {len(valid_wallets)} ({', '.join(sorted(valid_wallets.keys())[:10])}...)")
-        else:
-            logger.warning("Keine gültigen Wallets gefunden! Führe SYNC_COINEX.bat aus.")
+            mtime_ns = os.stat(self._wallet_path).st_mtime_ns
+        except OSError:
+            # Datei (noch) nicht da - Pfad neu bestimmen
+            self._wallet_path = self._resolve_wallet_path()
+            try:
+                mtime_ns = os.stat(self._wallet_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+        
+        cached_mtime, cached_wallets = self._available_wallets_cache
+        if mtime_ns is not None and mtime_ns == cached_mtime:
+            return cached_wallets
+        
+        if mtime_ns is None:
+            # Keine wallets.json -> keine Wallets
+            if cached_mtime is not None or cached_wallets:
+                logger.warning("Keine gültigen Wallets gefunden! Führe SYNC_COINEX.bat aus.")
+            self._available_wallets_cache = (None, {})
+            return {}
+        
+        # Datei geändert -> im Hintergrund neu parsen, bis dahin den letzten Stand liefern
+        if not (self._wallets_worker and self._wallets_worker.isRunning()):
+            self._wallets_worker_mtime = mtime_ns
+            self._wallets_worker = ApiWorker("wallets", _read_available_wallets, self._wallet_path)
+            self._wallets_worker.result.connect(self._on_wallets_loaded)
+            self._wallets_worker.start()
+        return cached_wallets
+    
+    def _on_wallets_loaded(self, name: str, wallets: Dict[str, str]):
+        """Übernimmt die im Hintergrund geparsten Wallets (läuft im GUI-Thread)"""
+        unchanged = wallets == self._available_wallets_cache[1]
+        self._available_wallets_cache = (self._wallets_worker_mtime, wallets)
+        if unchanged:
+            return
         
-        return valid_wallets
+        # Mine-Buttons der angezeigten Coins an die neuen Wallets anpassen
+        model = self.coins_model
+        rows = [model.row_values(row) for row in range(model.rowCount())]
+        if rows:
+            self._render_rows([values[:6] + (values[1] in wallets,) for values in rows])
     
     def check_auto_switch(self, top_coins: list):
         """Prüft ob automatisch gewechselt werden soll - NUR Coins mit Wallet!"""
@@ -3042,71 +4146,54 @@ class AutoProfitTab(QWidget):
             return
         
         # Verfügbare Wallets holen
-        available_wallets = self.get_available_wallets()
+        wallet_coins = self.get_available_wallets().keys()
         
-        # Nur Coins mit Wallet filtern
-        mineable_coins = [c for c in top_coins if c['coin'] in available_wallets]
+        # Blacklist vom (gemerkten) Hauptfenster holen und fehlgeschlagene Coins überspringen
+        main_window = self._get_dashboard()
+        failed_coins = frozenset(main_window.blacklisted_coins()) if main_window else frozenset()
         
-        if not mineable_coins:
-            logger.warning("Auto-Switch: Keine Coins mit konfigurierter Wallet gefunden!")
-            return
+        def is_mineable(coin: str) -> bool:
+            return coin in wallet_coins and coin not in failed_coins
         
-        # Blacklist vom MainWindow holen und fehlgeschlagene Coins überspringen
-        failed_coins = set()
-        try:
-            parent = self.parent()
-            while parent:
-                if hasattr(parent, '_failed_coins'):
-                    failed_coins = parent._failed_coins
-                    break
-                parent = parent.parent() if hasattr(parent, 'parent') else None
-        except:
-            pass
+        # top_coins ist absteigend nach Profit sortiert -> erster minebarer Coin ist der beste
+        best = next((c for c in top_coins if is_mineable(c['coin'])), None)
         
-        # Fehlgeschlagene Coins aus Liste entfernen
-        if failed_coins:
-            mineable_coins = [c for c in mineable_coins if c['coin'] not in failed_coins]
-            if not mineable_coins:
+        if best is None:
+            if failed_coins and any(c['coin'] in wallet_coins for c in top_coins):
                 logger.warning(f"Auto-Switch: Alle Coins auf Blacklist! ({', '.join(failed_coins)})")
-                return
+            else:
+                logger.warning("Auto-Switch: Keine Coins mit konfigurierter Wallet gefunden!")
+            return
+        if failed_coins:
             logger.debug(f"Auto-Switch: {len(failed_coins)} Coins auf Blacklist übersprungen")
         
-        best = mineable_coins[0]
-        
-        # Wenn kein aktueller Coin, versuche vom Parent zu holen
+        # Wenn kein aktueller Coin, versuche vom Hauptfenster zu holen
         if not self.current_coin:
-            try:
-                parent = self.parent()
-                while parent:
-                    if hasattr(parent, '_current_coin') and parent._current_coin:
-                        self.current_coin = parent._current_coin
-                        self.current_coin_label.setText(parent._current_coin)
-                        break
-                    parent = parent.parent() if hasattr(parent, 'parent') else None
-            except:
-                pass
+            dashboard_coin = getattr(self._get_dashboard(), '_current_coin', "")
+            if dashboard_coin:
+                self.current_coin = dashboard_coin
+                self.current_coin_label.setText(dashboard_coin)
         
         # Immer noch kein Coin? -> Zum besten wechseln!
         if not self.current_coin:
             logger.info(f"Auto-Switch: Kein aktiver Coin, starte {best['coin']}")
-            self.start_mining_coin(best['coin'])
+            self.start_mining_coin(best['coin'], best)
             return
         
         # Wenn bereits bester Coin -> nichts tun
         if self.current_coin == best['coin']:
             return
         
-        # Aktuellen Coin in Liste finden
+        # Profit des aktuellen Coins (0 wenn nicht minebar)
         current_profit = 0
-        for coin_data in mineable_coins:
-            if coin_data['coin'] == self.current_coin:
-                current_profit = coin_data['usd_profit_24h']
-                break
+        if is_mineable(self.current_coin):
+            current_profit = next((c['usd_profit_24h'] for c in top_coins
+                                   if c['coin'] == self.current_coin), 0)
         
         if current_profit <= 0:
             # Aktueller Coin nicht in minebare Liste -> wechseln!
             logger.info(f"Auto-Switch: {self.current_coin} nicht minebar/profitabel, wechsle zu {best['coin']}")
-            self.start_mining_coin(best['coin'])
+            self.start_mining_coin(best['coin'], best)
             return
         
         # Profit-Differenz berechnen
@@ -3114,13 +4201,18 @@ class AutoProfitTab(QWidget):
         
         if diff_percent >= self.min_profit_diff:
             logger.info(f"Auto-Switch: {self.current_coin} -> {best['coin']} (+{diff_percent:.1f}%)")
-            self.start_mining_coin(best['coin'])
+            self.start_mining_coin(best['coin'], best)
     
-    def start_mining_coin(self, coin: str):
-        """Startet Mining für einen Coin"""
+    def start_mining_coin(self, coin: str, coin_data: dict = None):
+        """
+        Startet Mining für einen Coin
+        
+        Args:
+            coin: Coin-Symbol
+            coin_data: Eintrag aus get_most_profitable() mit algorithm/usd_profit_24h -
+                       wenn gesetzt, muss das Ranking nicht neu berechnet werden
+        """
         try:
-            from auto_profit_switcher import BEST_POOLS, ALGO_MINER_MAP
-            
             # Besten Pool und Miner finden
             pools = BEST_POOLS.get(coin, [])
             if not pools:
@@ -3129,15 +4221,12 @@ class AutoProfitTab(QWidget):
             
             pool = pools[0]
             
-            # Algorithmus vom profit_calc holen
-            top_coins = self.profit_calc.get_most_profitable()
-            algo = ""
-            profit = 0
-            for c in top_coins:
-                if c['coin'] == coin:
-                    algo = c['algorithm']
-                    profit = c['usd_profit_24h']
-                    break
+            # Algorithmus und Profit - nur ohne coin_data vom profit_calc holen
+            if coin_data is None:
+                coin_data = next((c for c in self.profit_calc.get_most_profitable()
+                                  if c['coin'] == coin), {})
+            algo = coin_data.get('algorithm', '')
+            profit = coin_data.get('usd_profit_24h', 0)
             
             miners = ALGO_MINER_MAP.get(algo, [])
             miner = miners[0] if miners else "T-Rex"
@@ -3171,7 +4260,7 @@ class AutoProfitTab(QWidget):
         
         top_coins = self.profit_calc.get_most_profitable()
         if top_coins:
-            self.start_mining_coin(top_coins[0]['coin'])
+            self.start_mining_coin(top_coins[0]['coin'], top_coins[0])
     
     def get_top_coins(self) -> list:
         """Gibt die Liste der profitabelsten Coins zurück (für Fallback bei Fehlern)"""
@@ -3181,25 +4270,22 @@ class AutoProfitTab(QWidget):
         top_coins = self.profit_calc.get_most_profitable()[:10]
         result = []
         
+        # Pool und Miner Daten aus coin_config (vorberechnet, ein Lookup pro Coin)
         for coin_data in top_coins:
             coin = coin_data.get('coin', '')
             if not coin:
                 continue
             
-            # Pool und Miner Daten aus coin_config holen
-            from coin_config import COIN_CONFIGS
-            config = COIN_CONFIGS.get(coin, {})
-            
-            pools = config.get('pools', [])
-            pool_url = pools[0]['url'] if pools else f"stratum+tcp://{coin.lower()}.2miners.com:3030"
-            pool_name = pools[0]['name'] if pools else "2miners"
-            
-            miners = config.get('miners', ['trex'])
-            miner = miners[0] if miners else 'trex'
+            fast_config = COIN_FAST_CONFIG.get(coin)
+            if fast_config:
+                pool_url, pool_name, miner, algo = fast_config
+            else:
+                pool_url = f"stratum+tcp://{coin.lower()}.2miners.com:3030"
+                pool_name, miner, algo = "2miners", "trex", coin_data.get('algorithm', '')
             
             result.append({
                 'coin': coin,
-                'algorithm': config.get('algorithm', coin_data.get('algorithm', '')),
+                'algorithm': algo,
                 'pool_url': pool_url,
                 'pool_name': pool_name,
                 'miner': miner,
@@ -3215,9 +4301,19 @@ class AutoProfitTab(QWidget):
         self.current_profit_label.setText(f"${profit:.2f}" if profit > 0 else "$0.00")
 
 
+def _find_main_window() -> Optional['MiningMainWindow']:
+    """Das (einzige) MiningMainWindow unter den Top-Level-Fenstern"""
+    for widget in QApplication.topLevelWidgets():
+        if isinstance(widget, MiningMainWindow):
+            return widget
+    return None
+
+
 class MiningMainWindow(QMainWindow):
     """Hauptfenster der Mining-GUI"""
     
+    miner_crashed = Signal(int)  # Exit-Code - aus dem Exit-Thread des Miners in den GUI-Thread
+    
     def __init__(self):
         super().__init__()
         
@@ -3227,12 +4323,7 @@ class MiningMainWindow(QMainWindow):
         # Manager initialisieren
         self.gpu_monitor = GPUMonitor(poll_interval=1.0)
         # Miner-Verzeichnis: Erst im aktuellen Ordner, dann im übergeordneten
-        miners_path = Path("miners")
-        if not miners_path.exists():
-            miners_path = Path(__file__).parent / "miners"
-        if not miners_path.exists():
-            miners_path = Path(__file__).parent.parent / "miners"
-        self.miner_manager = MinerManager(miners_dir=str(miners_path))
+        self.miner_manager = MinerManager(miners_dir=str(_resolve_miners_dir()))
         self.flight_manager = FlightSheetManager("flight_sheets.json")
         self.oc_manager = OverclockManager(profiles_path="oc_profiles.json")
         self.hashrate_api = HashrateNoAPI()
@@ -3270,11 +4361,39 @@ class MiningMainWindow(QMainWindow):
         self._mining = False
         self._start_time = 0
         self._current_coin = ""
+        self._failed_coins: Dict[str, float] = {}  # Blacklist {Coin: Ablauf (monotonic)}, siehe _try_next_coin
+        self._last_tray_stats = (0.0, 0, 0.0)  # Im Tray angezeigt (hashrate, temp, power), siehe on_gpu_update
+        self._profit_cache: Dict[tuple, tuple] = {}  # key -> (monotonic, Ergebnis), siehe _cached_profit
+        self.tray_icon = None  # wird in setup_tray erstellt
+        self._last_tray_message = ("", "", 0.0)  # (Titel, Text, monotonic), siehe _show_tray_message
+        self._oc_worker: Optional[ApiWorker] = None  # MSI Afterburner Start/OC, siehe apply_flight_sheet
+        self._start_session = 0  # wird von stop_mining erhöht - verwirft ausstehende Starts, siehe _on_msi_ab_applied
+        self._stop_worker: Optional[ApiWorker] = None  # Miner beenden + OC-Reset, siehe stop_mining
+        self._auto_switch_target: Optional[tuple] = None  # (Coin, Miner) vom Auto-Switch, siehe _on_miner_crashed
+        self._cached_stats: Optional[MinerStats] = None  # letzte Stats vom MinerStatsWorker
+        self._gpu_list_cache: tuple = ()  # ((index, name), ...), siehe _detect_all_gpus
+        # Wallet-Quellen in Prioritätsreihenfolge, siehe _get_wallet_for_coin
+        self._wallet_resolvers = (self._wallet_from_exchange, self._wallet_from_json, self._wallet_from_configs)
+        
+        # Börsen-APIs für den Wallet-Sync einmal importieren (None = nicht verfügbar)
+        try:
+            from coinex_api import CoinExAPI, CoinExWalletSync
+            self._CoinExAPI, self._CoinExWalletSync = CoinExAPI, CoinExWalletSync
+        except ImportError as e:
+            logger.debug(f"CoinEx direkt nicht verfügbar: {e}")
+            self._CoinExAPI = self._CoinExWalletSync = None
+        try:
+            from gateio_api import GateIOAPI, GateIOWalletSync
+            self._GateIOAPI, self._GateIOWalletSync = GateIOAPI, GateIOWalletSync
+        except ImportError as e:
+            logger.debug(f"Gate.io nicht verfügbar: {e}")
+            self._GateIOAPI = self._GateIOWalletSync = None
         
         # UI Setup
         self.setup_ui()
         self.setup_tray()
         self.setup_workers()
+        self.setup_wallets_watcher()
         
         # Theme anwenden
         apply_theme(QApplication.instance())
@@ -3298,6 +4417,23 @@ class MiningMainWindow(QMainWindow):
         # Exchange Manager für automatisches Wallet-Loading (verzögert)
         QTimer.singleShot(3000, self.auto_sync_all_exchanges)
     
+    def _refresh_all_views(self):
+        """Aktualisiert Wallets-, Börsen- und Auto-Profit-Tabelle in einem Durchgang (ein Repaint)"""
+        self.setUpdatesEnabled(False)
+        try:
+            if hasattr(self, 'wallets_tab') and self.wallets_tab.exchange_manager:
+                try:
+                    self.wallets_tab.refresh_wallets_list()
+                    self.wallets_tab.refresh_exchanges_list()  # Börsen-Tabelle auch!
+                    logger.info("Wallets-Tab aktualisiert")
+                except Exception as e:
+                    logger.debug(f"Wallets-Tab Update: {e}")
+            
+            if self.auto_profit_tab:
+                self.auto_profit_tab.refresh_profits()
+        finally:
+            self.setUpdatesEnabled(True)
+    
     def auto_sync_all_exchanges(self):
         """Synchronisiert Wallets automatisch von ALLEN Börsen beim Start"""
         try:
@@ -3308,13 +4444,11 @@ class MiningMainWindow(QMainWindow):
             # 1. COINEX
             # ============================================
             try:
-                from coinex_api import CoinExAPI, CoinExWalletSync
-                
-                api = CoinExAPI()
-                if api.is_configured():
+                api = self._CoinExAPI() if self._CoinExAPI else None
+                if api and api.is_configured():
                     logger.info("CoinEx API konfiguriert - lade Wallets direkt...")
                     
-                    sync = CoinExWalletSync(api)
+                    sync = self._CoinExWalletSync(api)
                     new_count, updated_count = sync.sync_from_coinex()
                     
                     total = len(sync.get_all_coinex_wallets())
@@ -3325,8 +4459,6 @@ class MiningMainWindow(QMainWindow):
                         total_new += new_count
                         total_updated += updated_count
                     
-            except ImportError as e:
-                logger.debug(f"CoinEx direkt nicht verfügbar: {e}")
             except Exception as e:
                 logger.warning(f"CoinEx direkt Fehler: {e}")
             
@@ -3334,13 +4466,11 @@ class MiningMainWindow(QMainWindow):
             # 2. GATE.IO
             # ============================================
             try:
-                from gateio_api import GateIOAPI, GateIOWalletSync
-                
-                gateio_api = GateIOAPI()
-                if gateio_api.is_configured():
+                gateio_api = self._GateIOAPI() if self._GateIOAPI else None
+                if gateio_api and gateio_api.is_configured():
                     logger.info("Gate.io API konfiguriert - lade Wallets...")
                     
-                    gateio_sync = GateIOWalletSync(gateio_api)
+                    gateio_sync = self._GateIOWalletSync(gateio_api)
                     result = gateio_sync.sync_all()
                     
                     total = result.get('total', 0)
@@ -3354,8 +4484,6 @@ class MiningMainWindow(QMainWindow):
                         total_new += new_count
                         total_updated += updated_count
                     
-            except ImportError as e:
-                logger.debug(f"Gate.io nicht verfügbar: {e}")
             except Exception as e:
                 logger.warning(f"Gate.io Fehler: {e}")
             
@@ -3365,23 +4493,18 @@ class MiningMainWindow(QMainWindow):
             if total_new > 0 or total_updated > 0:
                 # WICHTIG: Wallets-Tab aktualisieren!
                 try:
-                    if hasattr(self, 'wallets_tab') and self.wallets_tab.exchange_manager:
+                    exchange_manager = self.wallets_tab.exchange_manager if hasattr(self, 'wallets_tab') else None
+                    if exchange_manager:
                         # Wallets neu laden (verschiedene ExchangeManager Versionen)
-                        if hasattr(self.wallets_tab.exchange_manager, '_load_wallets'):
-                            self.wallets_tab.exchange_manager._load_wallets()
-                        elif hasattr(self.wallets_tab.exchange_manager, 'load_wallets'):
-                            self.wallets_tab.exchange_manager.load_wallets()
-                        
-                        # Tabellen aktualisieren
-                        QTimer.singleShot(100, self.wallets_tab.refresh_wallets_list)
-                        QTimer.singleShot(200, self.wallets_tab.refresh_exchanges_list)  # Börsen-Tabelle auch!
-                        logger.info(f"Wallets-Tab aktualisiert")
+                        reload_wallets = (getattr(exchange_manager, '_load_wallets', None)
+                                          or getattr(exchange_manager, 'load_wallets', None))
+                        if reload_wallets is not None:
+                            reload_wallets()
                 except Exception as e:
                     logger.debug(f"Wallets-Tab Update: {e}")
                 
-                # Auto-Profit Tab aktualisieren
-                if hasattr(self, 'auto_profit_tab') and self.auto_profit_tab:
-                    QTimer.singleShot(500, self.auto_profit_tab.refresh_profits)
+                # Wallets-, Börsen- und Auto-Profit-Tabelle gemeinsam aktualisieren
+                QTimer.singleShot(500, self._refresh_all_views)
                 
                 self.status_bar.showMessage(f"Wallets geladen: {total_new} neu, {total_updated} aktualisiert - bereit!", 5000)
                 return
@@ -3412,7 +4535,7 @@ class MiningMainWindow(QMainWindow):
                 self.status_bar.showMessage(f"{total_wallets} Wallets geladen - bereit für Auto-Switch", 5000)
                 
                 # Auto-Profit Tab aktualisieren
-                if hasattr(self, 'auto_profit_tab') and self.auto_profit_tab:
+                if self.auto_profit_tab:
                     self.auto_profit_tab.refresh_profits()
             else:
                 logger.warning("⚠️ Keine Wallets gefunden - Auto-Switch nicht möglich!")
@@ -3428,26 +4551,22 @@ class MiningMainWindow(QMainWindow):
     def _merge_gateio_wallets(self, gateio_wallets: dict):
         """Fügt Gate.io Wallets zu wallets.json hinzu"""
         try:
-            import json
-            from pathlib import Path
-            
-            wallets_file = Path("wallets.json")
-            existing = {}
-            
-            if wallets_file.exists():
-                with open(wallets_file, 'r') as f:
-                    data = json.load(f)
-                    existing = data.get('wallets', {})
+            # Gecachte Daten sind geteilt - Kopie zum Ergänzen
+            existing = dict(_load_wallets_json().get('wallets', {}))
             
             # Gate.io Wallets hinzufügen (überschreibt nicht existierende)
+            added = 0
             for coin, address in gateio_wallets.items():
                 if coin not in existing:
                     existing[coin] = address
+                    added += 1
                     logger.info(f"Gate.io Wallet hinzugefügt: {coin}")
             
-            # Speichern
-            with open(wallets_file, 'w') as f:
-                json.dump({'wallets': existing}, f, indent=2)
+            if not added:
+                return
+            
+            # Atomar speichern (kein abgeschnittenes wallets.json bei Absturz)
+            _write_wallets_json({'wallets': existing}, pretty=True)
             
             logger.info(f"wallets.json aktualisiert: {len(existing)} Wallets")
             
@@ -3500,6 +4619,7 @@ class MiningMainWindow(QMainWindow):
         
         # Auto-Profit Tab (NEU!)
         self.auto_profit_tab = AutoProfitTab()
+        self.auto_profit_tab.set_dashboard(self)
         self.auto_profit_tab.switch_requested.connect(self.on_auto_switch)
         self.tabs.addTab(self.auto_profit_tab, "💰 Auto-Profit")
         
@@ -3548,12 +4668,13 @@ class MiningMainWindow(QMainWindow):
         else:
             self.ai_agent_tab = None
         
-        # CPU Mining Tab (NEU! V12.7)
+        # Tabs ohne Hintergrund-Aufgaben erst beim ersten Öffnen erstellen (schnellerer Start)
+        self._lazy_tabs = {}  # Platzhalter-Widget -> Factory, siehe _maybe_init_tab
+        
+        # CPU Mining Tab (NEU! V12.7) - lazy
+        self.cpu_mining_tab = None
         if CPU_MINING_AVAILABLE:
-            self.cpu_mining_tab = CPUMiningWidget()
-            self.tabs.addTab(self.cpu_mining_tab, "💻 CPU Mining")
-        else:
-            self.cpu_mining_tab = None
+            self._add_lazy_tab("💻 CPU Mining", self._create_cpu_mining_tab)
         
         # Portfolio Tab (NEU! V12.8)
         if PORTFOLIO_AVAILABLE:
@@ -3563,17 +4684,10 @@ class MiningMainWindow(QMainWindow):
         else:
             self.portfolio_tab = None
         
-        # Multi-GPU Mining Tab (NEU! V12.8) - Jede GPU eigener Coin!
+        # Multi-GPU Mining Tab (NEU! V12.8) - Jede GPU eigener Coin! - lazy
+        self.multi_gpu_tab = None
         if MULTI_GPU_AVAILABLE:
-            self.multi_gpu_tab = MultiGPUMiningWidget()
-            self.multi_gpu_tab.mining_started.connect(self.on_multi_gpu_started)
-            self.multi_gpu_tab.mining_stopped.connect(self.on_multi_gpu_stopped)
-            self.multi_gpu_tab.gpu_switched.connect(self.on_gpu_coin_switch)
-            self.tabs.addTab(self.multi_gpu_tab, "🎮 Multi-GPU")
-            # Manager nach GPU-Monitor initialisieren
-            QTimer.singleShot(2000, self.setup_multi_gpu_managers)
-        else:
-            self.multi_gpu_tab = None
+            self._add_lazy_tab("🎮 Multi-GPU", self._create_multi_gpu_tab)
         
         # Memory Manager Tab (NEU! V12.8)
         if MEMORY_MANAGER_AVAILABLE:
@@ -3587,6 +4701,7 @@ class MiningMainWindow(QMainWindow):
         else:
             self.memory_tab = None
         
+        self.tabs.currentChanged.connect(self._maybe_init_tab)
         layout.addWidget(self.tabs)
         
         # Status Bar
@@ -3594,10 +4709,62 @@ class MiningMainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Bereit")
         
-        # Update Timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_ui)
-        self.update_timer.start(1000)
+        # Update Timer: schnell nur für die Laufzeit, langsam für Hashrate/Power/Shares/Profit
+        self._ui_timer_fast = QTimer(interval=1000)
+        self._ui_timer_fast.timeout.connect(self._update_uptime_only)
+        self._ui_timer_fast.start()
+        self._ui_timer_slow = QTimer(interval=self.settings_tab.ui_poll_spin.value() * 1000)
+        self._ui_timer_slow.timeout.connect(self.update_ui)
+        self._ui_timer_slow.start()
+        self.settings_tab.ui_poll_spin.valueChanged.connect(
+            lambda v: self._ui_timer_slow.setInterval(v * 1000))
+        
+        # Strompreis für on_miner_stats zwischenspeichern statt jede Sekunde die SpinBox zu lesen
+        self._electricity_cost = self.settings_tab.electricity_spin.value()
+        self.settings_tab.electricity_spin.valueChanged.connect(
+            lambda v: setattr(self, '_electricity_cost', v))
+    
+    def _add_lazy_tab(self, label: str, factory):
+        """Fügt einen leeren Platzhalter-Tab hinzu, der beim ersten Öffnen durch factory() ersetzt wird"""
+        placeholder = QWidget()
+        self._lazy_tabs[placeholder] = factory
+        self.tabs.addTab(placeholder, label)
+    
+    def _maybe_init_tab(self, index: int):
+        """Ersetzt beim ersten Öffnen den Platzhalter durch das echte Tab-Widget"""
+        placeholder = self.tabs.widget(index)
+        factory = self._lazy_tabs.get(placeholder)
+        if factory is None:
+            return
+        
+        try:
+            widget = factory()
+        except Exception as e:
+            # Factory bleibt registriert - beim nächsten Öffnen des Tabs neuer Versuch
+            logger.error(f"Tab-Initialisierung fehlgeschlagen: {e}")
+            return
+        del self._lazy_tabs[placeholder]
+        
+        label = self.tabs.tabText(index)
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, label)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+    
+    def _create_cpu_mining_tab(self) -> QWidget:
+        """Erstellt den CPU Mining Tab (lazy)"""
+        self.cpu_mining_tab = CPUMiningWidget()
+        return self.cpu_mining_tab
+    
+    def _create_multi_gpu_tab(self) -> QWidget:
+        """Erstellt den Multi-GPU Tab (lazy) und übergibt gleich die Manager"""
+        self.multi_gpu_tab = MultiGPUMiningWidget()
+        self.multi_gpu_tab.mining_started.connect(self.on_multi_gpu_started)
+        self.multi_gpu_tab.mining_stopped.connect(self.on_multi_gpu_stopped)
+        self.multi_gpu_tab.gpu_switched.connect(self.on_gpu_coin_switch)
+        self.setup_multi_gpu_managers()
+        return self.multi_gpu_tab
     
     def setup_tray(self):
         """Erstellt System Tray Icon"""
@@ -3613,17 +4780,21 @@ class MiningMainWindow(QMainWindow):
         self.monitor_worker = MonitorWorker(self.gpu_monitor)
         self.monitor_worker.update.connect(self.on_gpu_update, Qt.QueuedConnection)
         
-        self.miner_stats_worker = MinerStatsWorker(self.miner_manager)
-        self.miner_stats_worker.update.connect(self.on_miner_stats, Qt.QueuedConnection)
+        self.miner_stats_worker = self._create_miner_stats_worker()
+        # Abgelöste Stats-Worker, die noch in einem API-Aufruf stecken (siehe _start_miner_stats_worker)
+        self._retired_stats_workers: List[MinerStatsWorker] = []
         
-        # Log-Buffer für Thread-sichere Log-Ausgabe
-        self._log_buffer = []
+        # Log-Buffer für Thread-sichere Log-Ausgabe (Ringpuffer, begrenzt Speicher wenn UI hängt)
+        self._log_buffer = deque(maxlen=10000)
         self._log_timer = QTimer()
         self._log_timer.timeout.connect(self._flush_logs)
         self._log_timer.start(100)  # Alle 100ms Logs flushen
         
         # Miner Log Callback - wird in separatem Thread aufgerufen!
         self.miner_manager.on_log = self._buffer_log
+        # Absturz-Callback ebenfalls aus einem Thread - per Signal in den GUI-Thread
+        self.miner_manager.on_miner_crashed = lambda miner_type, code: self.miner_crashed.emit(code)
+        self.miner_crashed.connect(self._on_miner_crashed)
         
         # Code Repair Integration (NEU! V12.8)
         if CODE_REPAIR_AVAILABLE:
@@ -3636,17 +4807,26 @@ class MiningMainWindow(QMainWindow):
         except Exception:
             pass
     
+    TRAY_DEDUP_SECONDS = 2.0
+    
+    def _show_tray_message(self, title: str, message: str, icon, msecs: int):
+        """Tray-Meldung anzeigen - identische Meldungen innerhalb von 2s werden verworfen"""
+        now = time.monotonic()
+        last_title, last_message, last_time = self._last_tray_message
+        if (title, message) == (last_title, last_message) and now - last_time < self.TRAY_DEDUP_SECONDS:
+            return
+        self._last_tray_message = (title, message, now)
+        self.tray_icon.showMessage(title, message, icon, msecs)
+    
     def _flush_logs(self):
         """Flusht Log-Buffer ins UI (Main Thread)"""
         if not self._log_buffer:
             return
         
-        # Buffer leeren und Logs anzeigen
-        logs = self._log_buffer[:]
-        self._log_buffer.clear()
-        
-        for line in logs:
-            self.logs_tab.append_log(line)
+        # Buffer leeren und Logs anzeigen - popleft ist thread-safe, keine Kopie nötig.
+        # Nur die beim Start vorhandenen Zeilen, damit ein schreibender Miner den Flush nicht endlos verlängert
+        buffer = self._log_buffer
+        self.logs_tab.append_logs_batch([buffer.popleft() for _ in range(len(buffer))])
     
     def on_gpu_update(self, data: dict):
         """Handler für GPU-Monitor Updates"""
@@ -3657,43 +4837,112 @@ class MiningMainWindow(QMainWindow):
             if gpus:
                 logger.debug(f"GPU Update: {len(gpus)} GPUs erkannt")
             
+            # Dashboard nur neu zeichnen, wenn es tatsächlich zu sehen ist
+            dashboard_active = self._dashboard_active()
+            
             # Tabelle aktualisieren
-            miner_stats = None
-            if self._mining:
-                try:
-                    miner_stats = self.miner_manager.get_current_stats()
-                except Exception:
-                    pass
-            self.dashboard.gpu_table.update_gpus(gpus, miner_stats, self._current_coin)
+            miner_stats = self._cached_stats if self._mining else None
+            if dashboard_active:
+                self.dashboard.gpu_table.update_gpus(gpus, miner_stats, self._current_coin)
             
-            # Charts aktualisieren
-            total_hashrate = sum(gpu.hashrate for gpu in gpus)
+            # Summen, Temperaturen und High-Temp-Check in einem Durchlauf
+            total_hashrate = total_temp = total_power = 0.0
+            temps = {}
+            for gpu in gpus:
+                temperature = gpu.temperature
+                total_hashrate += gpu.hashrate
+                total_temp += temperature
+                total_power += gpu.power_watts
+                temps[gpu.index] = temperature
+                if temperature >= 85:
+                    self.tray_icon.notify_high_temp(gpu.index, temperature)
+            avg_temp = total_temp / len(gpus) if gpus else 0
             if miner_stats:
                 total_hashrate = miner_stats.total_hashrate
             
-            self.dashboard.hashrate_chart.update_data(total_hashrate)
-            
-            temps = {gpu.index: gpu.temperature for gpu in gpus}
-            self.dashboard.temp_chart.update_data(temps)
+            # Charts aktualisieren (Historie immer, Neuzeichnen nur wenn sichtbar)
+            self.dashboard.hashrate_chart.update_data(total_hashrate, redraw=dashboard_active)
+            self.dashboard.temp_chart.update_data(temps, redraw=dashboard_active)
             
-            # Tray aktualisieren
-            avg_temp = sum(gpu.temperature for gpu in gpus) / len(gpus) if gpus else 0
-            total_power = sum(gpu.power_watts for gpu in gpus)
-            self.tray_icon.update_stats(total_hashrate, int(avg_temp), total_power)
-            
-            # High Temp Check
-            for gpu in gpus:
-                if gpu.temperature >= 85:
-                    self.tray_icon.notify_high_temp(gpu.index, gpu.temperature)
+            # Tray nur bei spürbarer Änderung aktualisieren (Tooltip/Icon-Repaint sparen)
+            tray_stats = (total_hashrate, int(avg_temp), total_power)
+            if self._tray_stats_changed(tray_stats):
+                self.tray_icon.update_stats(*tray_stats)
+                self._last_tray_stats = tray_stats
         except Exception as e:
             logger.error(f"Fehler in on_gpu_update: {e}")
     
+    def _tray_stats_changed(self, stats: tuple) -> bool:
+        """Vergleicht (hashrate, temp, power) mit dem zuletzt im Tray angezeigten Stand (±0.5% / ±1°C)"""
+        old_hashrate, old_temp, old_power = self._last_tray_stats
+        hashrate, temp, power = stats
+        return (abs(hashrate - old_hashrate) > max(old_hashrate * 0.005, 1.0)
+                or abs(temp - old_temp) > 1
+                or abs(power - old_power) > max(old_power * 0.005, 1.0))
+    
+    def _dashboard_active(self) -> bool:
+        """True wenn das Dashboard im sichtbaren, nicht minimierten Fenster angezeigt wird"""
+        return (self.isVisible() and not self.isMinimized()
+                and self.tabs.currentWidget() is self.dashboard)
+    
+    def changeEvent(self, event):
+        """Pausiert das periodische UI-Update solange das Fenster minimiert ist"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self._ui_timer_fast.stop()
+                self._ui_timer_slow.stop()
+            elif not self._ui_timer_fast.isActive():
+                self._ui_timer_fast.start()
+                self._ui_timer_slow.start()
+                self._update_uptime_only()
+                self.update_ui()
+                if self._dashboard_active():
+                    self.dashboard.hashrate_chart.redraw()
+                    self.dashboard.temp_chart.redraw()
+    
+    PROFIT_CACHE_TTL = 30.0       # Sekunden, Kurse ändern sich nur im Minutenbereich
+    PROFIT_CACHE_MAX_AGE = 300.0  # ältere Einträge werden verworfen
+    
+    def _cached_profit(self, coin: str, hashrate: float, power_watts: float = 0,
+                       power_cost: float = 0.0) -> Optional['ProfitResult']:
+        """
+        calculate_profit mit TTL-Cache
+        
+        Schlüssel: Hashrate auf 2 signifikante Stellen, Leistung auf 5 W gerundet -
+        Schwankungen im Sekundentakt lösen so keine Neuberechnung aus.
+        """
+        key = (coin, float(f"{hashrate:.2g}"), round(power_watts / 5) * 5, power_cost)
+        now = time.monotonic()
+        
+        cached = self._profit_cache.get(key)
+        if cached and now - cached[0] < self.PROFIT_CACHE_TTL:
+            return cached[1]
+        
+        result = self.profit_calculator.calculate_profit(
+            coin=coin,
+            hashrate=hashrate,
+            power_watts=power_watts,
+            power_cost=power_cost
+        )
+        
+        # Alte Einträge verwerfen (Speicher begrenzen)
+        if len(self._profit_cache) > 32:
+            self._profit_cache = {k: v for k, v in self._profit_cache.items()
+                                  if now - v[0] < self.PROFIT_CACHE_MAX_AGE}
+        self._profit_cache[key] = (now, result)
+        return result
+    
     def on_miner_stats(self, stats: MinerStats):
         """Handler für Miner-Stats Updates"""
         try:
-            if not stats:
+            # Nach stop_mining noch eingereihte Updates verwerfen
+            if not stats or not self._mining:
                 return
             
+            # Letzter Stand für update_ui/on_gpu_update (die fragen die Miner-API nicht selbst ab)
+            self._cached_stats = stats
+            
             uptime = int(time.time() - self._start_time) if self._mining else 0
             
             # Profit berechnen
@@ -3701,27 +4950,24 @@ class MiningMainWindow(QMainWindow):
             if self.profit_calculator and self._current_coin and stats.total_hashrate > 0:
                 try:
                     power_watts = stats.total_power if stats.total_power > 0 else 140  # Fallback
-                    power_cost = self.settings_tab.electricity_spin.value()
+                    power_cost = self._electricity_cost
                     
-                    result = self.profit_calculator.calculate_profit(
-                        coin=self._current_coin,
-                        hashrate=stats.total_hashrate,
-                        power_watts=power_watts,
-                        power_cost=power_cost
+                    result = self._cached_profit(
+                        self._current_coin, stats.total_hashrate, power_watts, power_cost
                     )
                     
                     if result:
-                        profit_usd = result.get('usd_profit_24h', 0.0)
-                        # Debug: Zeige Profit im Log
-                        if uptime % 10 == 0:  # Alle 10 Sekunden
-                            logger.debug(f"Profit result: ${profit_usd:.4f}/Tag (raw: {result})")
+                        profit_usd = result.usd_profit_24h
+                        # Debug: Zeige Profit im Log (alle 10 Sekunden, nur wenn DEBUG aktiv)
+                        if logger.isEnabledFor(logging.DEBUG) and uptime % 10 == 0:
+                            logger.debug("Profit result: $%.4f/Tag (raw: %s)", profit_usd, result)
                     else:
                         logger.warning(f"Kein Profit-Ergebnis für {self._current_coin}")
                         
                 except Exception as e:
                     logger.warning(f"Profit-Berechnung fehlgeschlagen: {e}")
-                    import traceback
-                    logger.debug(traceback.format_exc())
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Profit-Berechnung Traceback", exc_info=True)
             
             # WICHTIG: Immer update_stats aufrufen, auch wenn profit_usd = 0
             self.dashboard.update_stats(
@@ -3735,28 +4981,32 @@ class MiningMainWindow(QMainWindow):
             )
             
             # Debug-Log für GUI-Update
-            if uptime % 30 == 0 and uptime > 0:
+            if uptime % 30 == 0 and uptime > 0 and logger.isEnabledFor(logging.INFO):
                 unit = get_hashrate_unit(self._current_coin) if self._current_coin else 'MH/s'
-                logger.info(f"GUI Update: {stats.total_hashrate:.2f} {unit}, ${profit_usd:.2f}/Tag, A:{stats.total_accepted} R:{stats.total_rejected}")
+                logger.info("GUI Update: %.2f %s, $%.2f/Tag, A:%d R:%d", stats.total_hashrate, unit,
+                            profit_usd, stats.total_accepted, stats.total_rejected)
                 
         except Exception as e:
             logger.error(f"Fehler in on_miner_stats: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("on_miner_stats Traceback", exc_info=True)
     
     def on_miner_log(self, line: str):
         """Handler für Miner-Logs"""
         self.logs_tab.append_log(line)
     
-    def update_ui(self):
-        """Periodisches UI-Update - nutzt GPU-Monitor + Miner Daten für Dashboard"""
+    def _update_uptime_only(self):
+        """Schnelles UI-Update (jede Sekunde) - nur die Laufzeit"""
         if self._mining:
             uptime = int(time.time() - self._start_time)
             hours = uptime // 3600
             minutes = (uptime % 3600) // 60
             seconds = uptime % 60
             self.dashboard.uptime_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-            
+    
+    def update_ui(self):
+        """Langsames UI-Update (ui_poll_interval) - nutzt GPU-Monitor + Miner Daten für Dashboard"""
+        if self._mining:
             # Miner-Stats und GPU-Daten für Dashboard
             try:
                 total_hashrate = 0.0
@@ -3764,54 +5014,40 @@ class MiningMainWindow(QMainWindow):
                 total_accepted = 0
                 total_rejected = 0
                 
-                # 1. Versuche Miner-API Stats
-                if self.miner_manager:
-                    stats = self.miner_manager.get_current_stats()
-                    if stats and stats.total_hashrate > 0:
-                        total_hashrate = stats.total_hashrate
-                        total_power = stats.total_power
-                        total_accepted = stats.total_accepted
-                        total_rejected = stats.total_rejected
+                # 1. Miner-API Stats (zuletzt vom MinerStatsWorker geliefert - kein API-Aufruf im GUI-Thread)
+                stats = self._cached_stats
+                if stats and stats.total_hashrate > 0:
+                    total_hashrate = stats.total_hashrate
+                    total_power = stats.total_power
+                    total_accepted = stats.total_accepted
+                    total_rejected = stats.total_rejected
                 
                 # 2. Fallback: GPU-Monitor Power (falls Miner keine Power liefert)
                 if total_power == 0:
-                    metrics = self.gpu_monitor.get_latest_metrics()
-                    if metrics and metrics.get('gpus'):
-                        for gpu in metrics['gpus']:
-                            if hasattr(gpu, 'power_watts'):
-                                total_power += gpu.power_watts or 0
-                
-                # Dashboard aktualisieren
-                if total_hashrate > 0:
-                    unit = get_hashrate_unit(self._current_coin) if self._current_coin else 'MH/s'
-                    self.dashboard.hashrate_label.setText(f"{total_hashrate:.2f} {unit}")
+                    total_power = self.gpu_monitor.get_latest_power_total()
                 
-                if total_power > 0:
-                    self.dashboard.power_label.setText(f"{total_power:.0f} W")
-                
-                self.dashboard.coin_label.setText(self._current_coin or "--")
-                
-                # Shares aktualisieren
-                self.dashboard.shares_label.setText(
-                    f"<span style='color:{COLORS['accepted']}'>A: {total_accepted}</span> | "
-                    f"<span style='color:{COLORS['rejected']}'>R: {total_rejected}</span>"
-                )
-                
-                # Profit berechnen
-                if self.profit_calculator and self._current_coin and total_hashrate > 0:
-                    try:
-                        result = self.profit_calculator.calculate_profit(
-                            coin=self._current_coin,
-                            hashrate=total_hashrate
-                        )
-                        if result:
-                            profit_usd = result.get('usd_profit_24h', 0.0)
-                            self.dashboard.profit_label.setText(f"${profit_usd:.2f}")
-                            self.dashboard.profit_label.setStyleSheet(
-                                f"font-size: 28px; font-weight: bold; color: {COLORS['accepted']};"
-                            )
-                    except Exception as e:
-                        logger.debug(f"Profit-Calc Fehler: {e}")
+                # Dashboard aktualisieren (Labels nur bei geändertem Text neu setzen,
+                # Repaint der Stats-Leiste einmal am Ende statt pro Label)
+                with _batched_updates(self.dashboard.stats_bar):
+                    if total_hashrate > 0:
+                        self.dashboard.set_hashrate(total_hashrate, self._current_coin)
+                    
+                    if total_power > 0:
+                        self.dashboard.set_power(total_power)
+                    
+                    self.dashboard.set_coin(self._current_coin)
+                    
+                    # Shares aktualisieren
+                    self.dashboard.set_shares(total_accepted, total_rejected)
+                    
+                    # Profit berechnen
+                    if self.profit_calculator and self._current_coin and total_hashrate > 0:
+                        try:
+                            result = self._cached_profit(self._current_coin, total_hashrate)
+                            if result:
+                                self.dashboard.set_profit(result.usd_profit_24h)
+                        except Exception as e:
+                            logger.debug(f"Profit-Calc Fehler: {e}")
                     
             except Exception as e:
                 logger.debug(f"UI-Update Fehler: {e}")
@@ -3844,58 +5080,73 @@ class MiningMainWindow(QMainWindow):
         if not sheet:
             return
         
+        if self._oc_worker and self._oc_worker.isRunning():
+            logger.info("Flight Sheet wird bereits angewendet - warte auf MSI Afterburner")
+            return
+        
+        # Alten Miner/OC-Reset erst abschließen (kill_all_miners würde sonst den neuen Miner treffen)
+        self._wait_for_miner_stop()
+        
         # Overclocking anwenden (MSI Afterburner bevorzugt!)
-        if self.flight_tab.auto_oc_check.isChecked():
-            oc_applied = False
-            
-            # 1. MSI Afterburner automatisch starten und OC anwenden
-            if self.msi_ab_manager and self.msi_ab_manager.is_installed:
-                try:
-                    # Auto-Start wenn nicht läuft
-                    if not self.msi_ab_manager.check_running():
-                        logger.info("MSI Afterburner wird automatisch gestartet...")
-                        self.msi_ab_manager.start_afterburner(minimized=True)
-                        time.sleep(2)  # Warten bis gestartet
-                    
-                    # OC automatisch anwenden
-                    success, msg = self.msi_ab_manager.apply_mining_profile(sheet.coin)
-                    if success:
-                        self.logs_tab.append_log(f"✅ MSI Afterburner: {msg}")
-                        oc_applied = True
-                    else:
-                        logger.warning(f"MSI AB OC fehlgeschlagen: {msg}")
-                except Exception as e:
-                    logger.warning(f"MSI AB Fehler: {e}")
-            
-            # 2. Fallback: NVML (benötigt Admin-Rechte)
-            if not oc_applied and self.oc_manager:
-                try:
-                    self.oc_manager.apply_auto_oc_all(sheet.coin)
-                    self.logs_tab.append_log(f"NVML OC für {sheet.coin} angewendet")
-                except Exception as e:
-                    logger.warning(f"NVML OC fehlgeschlagen: {e}")
+        # 1. MSI Afterburner im Hintergrund starten und OC anwenden - GUI bleibt bedienbar
+        if (self.flight_tab.auto_oc_check.isChecked()
+                and self.msi_ab_manager and self.msi_ab_manager.is_installed):
+            session = self._start_session
+            self._oc_worker = ApiWorker("msi_ab", self._apply_msi_ab_profile, sheet.coin)
+            self._oc_worker.result.connect(
+                lambda name, result, s=sheet: self._on_msi_ab_applied(s, result, session))
+            self._oc_worker.error.connect(
+                lambda name, error, s=sheet: self._on_msi_ab_applied(s, (False, error), session))
+            self._oc_worker.start()
+            return
         
-        # Miner-Typ bestimmen
-        miner_type_map = {
-            "trex": MinerType.TREX,
-            "nbminer": MinerType.NBMINER,
-            "gminer": MinerType.GMINER,
-            "lolminer": MinerType.LOLMINER,
-            "rigel": MinerType.RIGEL,
-            "bzminer": MinerType.BZMINER,
-            "teamredminer": MinerType.TEAMREDMINER,
-            "srbminer": MinerType.SRBMINER,
-            "xmrig": MinerType.XMRIG,  # CPU Miner für XMR
-        }
+        self._apply_flight_sheet_stage2(sheet, oc_applied=False)
+    
+    def _apply_msi_ab_profile(self, coin: str) -> tuple:
+        """Startet MSI Afterburner falls nötig und wendet das Mining-Profil an (läuft im ApiWorker)"""
+        # Auto-Start wenn nicht läuft
+        if not self.msi_ab_manager.check_running():
+            logger.info("MSI Afterburner wird automatisch gestartet...")
+            self.msi_ab_manager.start_afterburner(minimized=True)
+            time.sleep(2)  # Warten bis gestartet (im Worker-Thread, blockiert die GUI nicht)
+        
+        # OC automatisch anwenden
+        return self.msi_ab_manager.apply_mining_profile(coin)
+    
+    def _on_msi_ab_applied(self, sheet, result: tuple, session: int):
+        """MSI Afterburner fertig - Flight Sheet fortsetzen (läuft im GUI-Thread)"""
+        if session != self._start_session:
+            logger.info(f"Flight Sheet {sheet.name} abgebrochen - Mining wurde inzwischen gestoppt")
+            return
+        
+        success, msg = result
+        if success:
+            self.logs_tab.append_log(f"✅ MSI Afterburner: {msg}")
+        else:
+            logger.warning(f"MSI AB OC fehlgeschlagen: {msg}")
+        self._apply_flight_sheet_stage2(sheet, oc_applied=success)
+    
+    def _apply_flight_sheet_stage2(self, sheet, oc_applied: bool):
+        """Zweiter Teil von apply_flight_sheet: NVML-Fallback und Miner-Start"""
+        # 2. Fallback: NVML (benötigt Admin-Rechte)
+        if self.flight_tab.auto_oc_check.isChecked() and not oc_applied and self.oc_manager:
+            try:
+                self.oc_manager.apply_auto_oc_all(sheet.coin)
+                self.logs_tab.append_log(f"NVML OC für {sheet.coin} angewendet")
+            except Exception as e:
+                logger.warning(f"NVML OC fehlgeschlagen: {e}")
         
-        miner_type = miner_type_map.get(sheet.miner.lower(), MinerType.TREX)
+        # Miner-Typ bestimmen
+        miner_name = sheet.miner.lower()
+        miner_type = _MINER_TYPE_MAP.get(miner_name, MinerType.TREX)
         
         # CPU Mining: Kein OC nötig
-        is_cpu_mining = sheet.miner.lower() == "xmrig" or getattr(sheet, 'mining_type', None) == 'cpu'
+        is_cpu_mining = miner_name == "xmrig" or getattr(sheet, 'mining_type', None) == 'cpu'
         if is_cpu_mining:
             self.logs_tab.append_log("💻 CPU Mining - kein GPU OC erforderlich")
         
-        # Miner starten
+        # Miner starten (manuell - kein Auto-Switch-Failover bei Absturz)
+        self._auto_switch_target = None
         extra_args = sheet.extra_args.split() if sheet.extra_args else None
         
         success = self.miner_manager.start_miner(
@@ -3913,7 +5164,7 @@ class MiningMainWindow(QMainWindow):
             self._current_coin = sheet.coin
             
             # Auto-Profit Tab synchronisieren
-            if hasattr(self, 'auto_profit_tab') and self.auto_profit_tab:
+            if self.auto_profit_tab:
                 self.auto_profit_tab.set_current_coin(sheet.coin)
             
             self.dashboard.start_btn.setEnabled(False)
@@ -3922,14 +5173,14 @@ class MiningMainWindow(QMainWindow):
             self.tray_icon.notify_miner_started(sheet.coin, sheet.pool_name or sheet.pool_url)
             
             # Stats Worker starten
-            self.miner_stats_worker.start()
+            self._start_miner_stats_worker()
             
             # AI Agent automatisch starten für Überwachung
-            if AI_AGENT_AVAILABLE and hasattr(self, 'ai_agent_tab') and self.ai_agent_tab:
+            if AI_AGENT_AVAILABLE and self.ai_agent_tab:
                 self.ai_agent_tab.auto_start_monitoring(interval=5.0)
             
             # Portfolio Monitoring automatisch starten (NEU! V12.8)
-            if PORTFOLIO_AVAILABLE and hasattr(self, 'portfolio_tab') and self.portfolio_tab:
+            if PORTFOLIO_AVAILABLE and self.portfolio_tab:
                 self.portfolio_tab.start_monitoring()
             
             self.status_bar.showMessage(f"Mining {sheet.coin} auf {sheet.pool_name}...")
@@ -3937,49 +5188,43 @@ class MiningMainWindow(QMainWindow):
         else:
             QMessageBox.warning(self, "Fehler", "Mining konnte nicht gestartet werden!")
     
-    def stop_mining(self):
-        """Stoppt Mining"""
-        # Miner stoppen
-        self.miner_manager.stop_current()
-        
-        # Sicherheitshalber alle Miner-Prozesse killen
-        self.miner_manager.kill_all_miners()
-        
-        # OC zurücksetzen (GPU auf Standard)
-        try:
-            # MSI Afterburner Reset
-            if self.msi_ab_manager and self.msi_ab_manager.is_installed:
-                success, msg = self.msi_ab_manager.reset_oc()
-                if success:
-                    self.logs_tab.append_log("MSI Afterburner OC zurückgesetzt")
-            
-            # NVML Reset
-            self.oc_manager.reset_all_gpus()
-            self.logs_tab.append_log("GPU Overclocking zurückgesetzt")
-        except Exception as e:
-            logger.warning(f"OC Reset fehlgeschlagen: {e}")
+    def stop_mining(self, wait: bool = False):
+        """
+        Stoppt Mining
         
-        # Stats Worker stoppen (wenn er läuft)
-        try:
-            if self.miner_stats_worker.isRunning():
-                self.miner_stats_worker._running = False
-                self.miner_stats_worker.wait(1000)  # 1 Sekunde warten
-        except Exception:
-            pass
+        Miner beenden und OC-Reset laufen im Hintergrund (taskkill kann unter Windows
+        Sekunden blockieren). wait=True wartet darauf, z.B. vor Beenden/Neustart.
+        """
+        # Stats Worker stoppen (wenn er läuft) - ein noch laufender API-Aufruf
+        # wird beim nächsten Start abgewartet, siehe _start_miner_stats_worker
+        if self.miner_stats_worker.isRunning():
+            self.miner_stats_worker.stop()
+            self.miner_stats_worker.wait(1000)  # 1 Sekunde warten
+        self._cached_stats = None
+        self._auto_switch_target = None
+        
+        # Ausstehenden Flight-Sheet-Start (MSI Afterburner läuft noch) verwerfen
+        self._start_session += 1
+        
+        # Miner stoppen + OC zurücksetzen
+        if not (self._stop_worker and self._stop_worker.isRunning()):
+            self._stop_worker = ApiWorker("stop_miner", self._stop_miner_processes, self._oc_worker)
+            self._stop_worker.result.connect(self._on_miner_stopped)
+            self._stop_worker.start()
         
         # AI Agent Monitoring stoppen
-        if AI_AGENT_AVAILABLE and hasattr(self, 'ai_agent_tab') and self.ai_agent_tab:
+        if AI_AGENT_AVAILABLE and self.ai_agent_tab:
             self.ai_agent_tab.auto_stop_monitoring()
         
         # Portfolio Monitoring stoppen (NEU! V12.8)
-        if PORTFOLIO_AVAILABLE and hasattr(self, 'portfolio_tab') and self.portfolio_tab:
+        if PORTFOLIO_AVAILABLE and self.portfolio_tab:
             self.portfolio_tab.stop_monitoring()
         
         self._mining = False
         self._current_coin = ""
         
         # Auto-Profit Tab synchronisieren
-        if hasattr(self, 'auto_profit_tab') and self.auto_profit_tab:
+        if self.auto_profit_tab:
             self.auto_profit_tab.set_current_coin("")
         
         self.dashboard.start_btn.setEnabled(True)
@@ -3989,6 +5234,69 @@ class MiningMainWindow(QMainWindow):
         
         self.status_bar.showMessage("Mining gestoppt")
         self.logs_tab.append_log("=== Mining gestoppt ===")
+        
+        if wait:
+            self._wait_for_miner_stop()
+    
+    def _create_miner_stats_worker(self) -> MinerStatsWorker:
+        """Erstellt einen MinerStatsWorker mit Verbindung zu on_miner_stats"""
+        worker = MinerStatsWorker(self.miner_manager)
+        worker.update.connect(self.on_miner_stats, Qt.QueuedConnection)
+        return worker
+    
+    def _start_miner_stats_worker(self):
+        """Startet den MinerStatsWorker für eine neue Mining-Session"""
+        # Fertig gewordene Alt-Worker freigeben
+        self._retired_stats_workers = [w for w in self._retired_stats_workers if w.isRunning()]
+        
+        worker = self.miner_stats_worker
+        # start() auf einem laufenden QThread tut nichts - ein alter Lauf (z.B. API-Aufruf
+        # beim Stoppen) muss erst enden, aber die GUI wird dafür nur kurz blockiert
+        worker.stop()
+        if not worker.wait(300):
+            # Alter Lauf steckt noch in einem API-Aufruf: frischen Worker nehmen, der alte
+            # beendet sich von selbst (_running=False) und liefert keine Stats mehr
+            worker.update.disconnect(self.on_miner_stats)
+            self._retired_stats_workers.append(worker)
+            worker = self.miner_stats_worker = self._create_miner_stats_worker()
+        worker.start()
+        logger.info("MinerStatsWorker gestartet für API-Abfrage")
+    
+    def _stop_miner_processes(self, oc_worker: Optional[ApiWorker] = None) -> list:
+        """Beendet den Miner und setzt OC zurück (läuft im ApiWorker) - gibt Log-Meldungen zurück"""
+        messages = []
+        # Ein noch laufendes MSI-AB-Profil würde sonst nach dem Reset gesetzt
+        if oc_worker:
+            oc_worker.wait()
+        self.miner_manager.stop_current()
+        
+        # Sicherheitshalber alle Miner-Prozesse killen
+        self.miner_manager.kill_all_miners()
+        
+        # OC zurücksetzen (GPU auf Standard)
+        try:
+            # MSI Afterburner Reset
+            if self.msi_ab_manager and self.msi_ab_manager.is_installed:
+                success, msg = self.msi_ab_manager.reset_oc()
+                if success:
+                    messages.append("MSI Afterburner OC zurückgesetzt")
+            
+            # NVML Reset
+            self.oc_manager.reset_all_gpus()
+            messages.append("GPU Overclocking zurückgesetzt")
+        except Exception as e:
+            logger.warning(f"OC Reset fehlgeschlagen: {e}")
+        return messages
+    
+    def _on_miner_stopped(self, name: str, messages: list):
+        """Miner-Prozesse beendet und OC zurückgesetzt (GUI-Thread)"""
+        for message in messages:
+            self.logs_tab.append_log(message)
+    
+    def _wait_for_miner_stop(self):
+        """Wartet auf ein laufendes Stoppen im Hintergrund - vor jedem neuen Miner-Start/OC"""
+        if self._stop_worker and self._stop_worker.isRunning():
+            self._stop_worker.wait()
     
     def check_msi_afterburner_auto(self):
         """
@@ -4086,19 +5394,22 @@ class MiningMainWindow(QMainWindow):
         # Temp Warning Threshold
         if self.gpu_monitor:
             self.gpu_monitor.temp_warning = settings.get('temp_warning', 80)
+        
+        # Intervall für Hashrate/Power/Shares/Profit im Dashboard
+        self._ui_timer_slow.setInterval(settings.get('ui_poll_interval', 5) * 1000)
     
     def on_portfolio_alert(self, level: str, message: str):
         """Handler für Portfolio-Alerts (NEU! V12.8)"""
         # Log anzeigen
-        self.logs_tab.append_log(f"💰 [{level.upper()}] {message}")
+        self._buffer_log(f"💰 [{level.upper()}] {message}")
         
         # Bei kritischen Alerts: Status Bar aktualisieren
         if level == "critical":
             self.status_bar.showMessage(f"⚠️ PORTFOLIO: {message}", 10000)
         
         # Tray Notification wenn minimiert
-        if hasattr(self, 'tray_icon') and self.tray_icon and not self.isVisible():
-            self.tray_icon.showMessage(
+        if self.tray_icon and not self.isVisible():
+            self._show_tray_message(
                 f"Portfolio Alert ({level})",
                 message,
                 self.tray_icon.Information,
@@ -4107,7 +5418,7 @@ class MiningMainWindow(QMainWindow):
     
     def setup_multi_gpu_managers(self):
         """Initialisiert Multi-GPU Manager (NEU! V12.8)"""
-        if not MULTI_GPU_AVAILABLE or not hasattr(self, 'multi_gpu_tab') or not self.multi_gpu_tab:
+        if not MULTI_GPU_AVAILABLE or not self.multi_gpu_tab:
             return
         
         try:
@@ -4133,7 +5444,10 @@ class MiningMainWindow(QMainWindow):
             logger.error(f"Multi-GPU Setup Fehler: {e}")
     
     def _detect_all_gpus(self) -> list:
-        """Erkennt alle GPUs und gibt Liste zurück (NEU! V12.8)"""
+        """Erkennt alle GPUs und gibt Liste zurück (NEU! V12.8) - Ergebnis wird für die Laufzeit gecacht"""
+        if self._gpu_list_cache:
+            return list(self._gpu_list_cache)
+        
         gpus = []
         
         try:
@@ -4147,46 +5461,36 @@ class MiningMainWindow(QMainWindow):
         
         # Fallback: NVML direkt
         if not gpus:
-            try:
-                import pynvml
-                pynvml.nvmlInit()
-                count = pynvml.nvmlDeviceGetCount()
-                for i in range(count):
-                    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                    name = pynvml.nvmlDeviceGetName(handle)
-                    if isinstance(name, bytes):
-                        name = name.decode('utf-8')
-                    gpus.append((i, name))
-            except:
-                pass
+            gpus = list(_detect_nvml_gpus())
         
+        self._gpu_list_cache = tuple(gpus)
         return gpus
     
     def on_multi_gpu_started(self):
         """Handler: Multi-GPU Mining gestartet (NEU! V12.8)"""
-        self.logs_tab.append_log("🎮 Multi-GPU Mining gestartet")
+        self._buffer_log("🎮 Multi-GPU Mining gestartet")
         self.status_bar.showMessage("🎮 Multi-GPU Mining aktiv")
         
         # Tray Icon aktualisieren
-        if hasattr(self, 'tray_icon') and self.tray_icon:
+        if self.tray_icon:
             self.tray_icon.set_mining_state(True)
     
     def on_multi_gpu_stopped(self):
         """Handler: Multi-GPU Mining gestoppt (NEU! V12.8)"""
-        self.logs_tab.append_log("🎮 Multi-GPU Mining gestoppt")
+        self._buffer_log("🎮 Multi-GPU Mining gestoppt")
         self.status_bar.showMessage("🎮 Multi-GPU Mining gestoppt")
         
         # Tray Icon aktualisieren
-        if hasattr(self, 'tray_icon') and self.tray_icon:
+        if self.tray_icon:
             self.tray_icon.set_mining_state(False)
     
     def on_gpu_coin_switch(self, gpu_index: int, old_coin: str, new_coin: str):
         """Handler: GPU hat Coin gewechselt (NEU! V12.8)"""
-        self.logs_tab.append_log(f"🔄 GPU {gpu_index}: {old_coin} → {new_coin}")
+        self._buffer_log(f"🔄 GPU {gpu_index}: {old_coin} → {new_coin}")
         
         # Tray Notification
-        if hasattr(self, 'tray_icon') and self.tray_icon:
-            self.tray_icon.showMessage(
+        if self.tray_icon:
+            self._show_tray_message(
                 "Coin-Wechsel",
                 f"GPU {gpu_index}: {old_coin} → {new_coin}",
                 self.tray_icon.Information,
@@ -4195,7 +5499,7 @@ class MiningMainWindow(QMainWindow):
     
     def setup_memory_manager(self):
         """Initialisiert Memory Manager (NEU! V12.8)"""
-        if not MEMORY_MANAGER_AVAILABLE or not hasattr(self, 'memory_tab') or not self.memory_tab:
+        if not MEMORY_MANAGER_AVAILABLE or not self.memory_tab:
             return
         
         try:
@@ -4223,16 +5527,8 @@ class MiningMainWindow(QMainWindow):
         coins = []
         
         try:
-            # Aus Wallets-Config lesen
-            import json
-            from pathlib import Path
-            
-            wallets_file = Path("wallets.json")
-            if wallets_file.exists():
-                with open(wallets_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    wallets = data.get("wallets", {})
-                    coins = list(wallets.keys())
+            # Aus Wallets-Config lesen (gecacht, nur bei geänderter Datei neu geparst)
+            coins = list(_load_wallets_json().get("wallets", {}))
         except:
             pass
         
@@ -4266,7 +5562,7 @@ class MiningMainWindow(QMainWindow):
         self.logs_tab.append_log(f"🔄 PC-Neustart in {seconds} Sekunden geplant")
         
         # Tray Notification
-        if hasattr(self, 'tray_icon') and self.tray_icon:
+        if self.tray_icon:
             self.tray_icon.showMessage(
                 "⚠️ Neustart geplant",
                 f"PC wird in {seconds} Sekunden neu gestartet für Speicher-Optimierung",
@@ -4275,7 +5571,7 @@ class MiningMainWindow(QMainWindow):
             )
         
         # Mining sicher beenden
-        self.stop_mining()
+        self.stop_mining(wait=True)
         
         # Einstellungen speichern
         if hasattr(self.settings_tab, 'save_all_settings'):
@@ -4283,7 +5579,7 @@ class MiningMainWindow(QMainWindow):
     
     def check_memory_before_mining(self) -> bool:
         """Prüft Speicher vor Mining-Start (NEU! V12.8)"""
-        if not MEMORY_MANAGER_AVAILABLE or not hasattr(self, 'memory_tab') or not self.memory_tab:
+        if not MEMORY_MANAGER_AVAILABLE or not self.memory_tab:
             return True
         
         return self.memory_tab.check_before_mining()
@@ -4329,11 +5625,11 @@ class MiningMainWindow(QMainWindow):
         
         # Mining stoppen
         if self._mining:
-            self.stop_mining()
+            self.stop_mining(wait=True)
         
         # Einstellungen speichern
         try:
-            if hasattr(self, 'portfolio_tab') and self.portfolio_tab:
+            if self.portfolio_tab:
                 self.portfolio_tab.stop_monitoring()
         except:
             pass
@@ -4350,9 +5646,41 @@ class MiningMainWindow(QMainWindow):
         # Aktuellen Prozess beenden
         QTimer.singleShot(500, lambda: os._exit(0))
     
+    def setup_wallets_watcher(self):
+        """Überwacht wallets.json - neu geparst wird nur bei Änderungen, nicht pro Zugriff"""
+        self._wallets_file = str(Path("wallets.json").absolute())
+        self._wallets_watcher = QFileSystemWatcher(self)
+        # Verzeichnis mitüberwachen: os.replace (_write_wallets_json, Sync-Tools) ersetzt die
+        # Datei, sie fällt dabei aus der Überwachung und muss neu hinzugefügt werden
+        if not self._wallets_watcher.addPath(os.path.dirname(self._wallets_file)):
+            logger.debug("wallets.json kann nicht überwacht werden - Cache prüft mtime pro Zugriff")
+            return
+        self._wallets_watcher.fileChanged.connect(self._reload_wallets_cache)
+        self._wallets_watcher.directoryChanged.connect(self._reload_wallets_cache)
+        self._reload_wallets_cache()
+        _wallets_cache['watched'] = True
+    
+    def _reload_wallets_cache(self, path: str = ""):
+        """Parst wallets.json nach einer Änderungsmeldung neu (nur wenn sich mtime/Größe geändert haben)"""
+        if os.path.exists(self._wallets_file) and self._wallets_file not in self._wallets_watcher.files():
+            self._wallets_watcher.addPath(self._wallets_file)
+        
+        watched = _wallets_cache['watched']
+        _wallets_cache['watched'] = False  # _load_wallets_json soll mtime/Größe prüfen
+        try:
+            _load_wallets_json()
+        except Exception as e:
+            # z.B. halb geschriebene Datei - beim nächsten Zugriff erneut parsen
+            logger.debug(f"wallets.json neu laden fehlgeschlagen: {e}")
+            _invalidate_wallets_cache()
+        finally:
+            _wallets_cache['watched'] = watched
+    
     def on_wallets_updated(self):
         """Handler wenn Wallets aktualisiert wurden"""
         logger.info("Wallets wurden aktualisiert")
+        # Sicherheitshalber neu parsen, auch wenn mtime/Größe gleich geblieben sind
+        _invalidate_wallets_cache()
         # Flight Sheets Tab könnte aktualisiert werden um neue Wallets anzuzeigen
         self.flight_tab.load_sheets()
     
@@ -4368,44 +5696,11 @@ class MiningMainWindow(QMainWindow):
         # Mining stoppen falls aktiv
         if self._mining:
             self.stop_mining()
-            time.sleep(1)
+        # Auch ein vorher per Button gestartetes Stoppen abschließen, bevor der neue Miner startet
+        self._wait_for_miner_stop()
         
-        # Wallet für diesen Coin suchen
-        wallet = ""
-        
-        # 1. Versuch: Exchange Manager
-        try:
-            if hasattr(self, 'wallets_tab') and self.wallets_tab.exchange_manager:
-                wallet_obj = self.wallets_tab.exchange_manager.get_wallet_address(coin)
-                if wallet_obj:
-                    wallet = wallet_obj.address
-        except:
-            pass
-        
-        # 2. Versuch: Direkt aus wallets.json (wichtig für Gate.io Wallets!)
-        if not wallet:
-            try:
-                import json
-                from pathlib import Path
-                wallets_file = Path("wallets.json")
-                if wallets_file.exists():
-                    with open(wallets_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        wallets_data = data.get("wallets", {})
-                        if coin.upper() in wallets_data:
-                            wallet = wallets_data[coin.upper()]
-                            # Memo von Wallet trennen (falls vorhanden)
-                            if ' ' in wallet:
-                                wallet = wallet.split(' ')[0]
-                            logger.info(f"Wallet für {coin} aus wallets.json geladen: {wallet[:20]}...")
-            except Exception as e:
-                logger.debug(f"wallets.json Fallback: {e}")
-        
-        # 3. Versuch: Wallets aus COIN_CONFIGS
-        if not wallet:
-            from coin_config import COIN_CONFIGS
-            if coin in COIN_CONFIGS:
-                wallet = COIN_CONFIGS[coin].get('wallet', '')
+        # Wallet für diesen Coin suchen (Exchange Manager, wallets.json, COIN_CONFIGS)
+        wallet = self._get_wallet_for_coin(coin)
         
         if not wallet:
             logger.warning(f"Keine Wallet für {coin} gefunden - bitte manuell konfigurieren!")
@@ -4416,34 +5711,13 @@ class MiningMainWindow(QMainWindow):
             )
             return
         
-        # Mining starten
-        self._current_coin = coin
-        self.dashboard.coin_label.setText(coin)
-        
-        # Auto-Profit Tab synchronisieren
-        if hasattr(self, 'auto_profit_tab') and self.auto_profit_tab:
-            self.auto_profit_tab.set_current_coin(coin)
-        
         # Miner-Befehl zusammenbauen
         worker = "Rig_D"
         
         logger.info(f"Auto-Switch Mining: {coin} auf {pool_url} mit {miner}")
         
         # Miner-String zu MinerType konvertieren
-        from miner_api import MinerType
-        miner_type_map = {
-            'trex': MinerType.TREX,
-            't-rex': MinerType.TREX,
-            'lolminer': MinerType.LOLMINER,
-            'nbminer': MinerType.NBMINER,
-            'gminer': MinerType.GMINER,
-            'teamredminer': MinerType.TEAMREDMINER,
-            'phoenixminer': MinerType.PHOENIXMINER,
-            'rigel': MinerType.RIGEL,
-            'srbminer': MinerType.SRBMINER,
-            'xmrig': MinerType.XMRIG,
-        }
-        miner_type = miner_type_map.get(miner.lower().replace('-', '').replace(' ', ''), MinerType.TREX)
+        miner_type = _MINER_TYPE_MAP.get(miner.lower().translate(_MINER_NAME_DELETE), MinerType.TREX)
         
         # Miner starten
         try:
@@ -4470,29 +5744,25 @@ class MiningMainWindow(QMainWindow):
                 self._mining = True
                 self._start_time = time.time()
                 self._current_coin = coin  # WICHTIG: Aktuellen Coin setzen!
-                self.dashboard.start_btn.setEnabled(False)
-                self.dashboard.stop_btn.setEnabled(True)
-                self.status_bar.showMessage(f"Mining {coin} auf {config.get('pool_name', 'Pool')}")
                 
                 # WICHTIG: Stats Worker starten für API-Abfrage!
-                try:
-                    if not self.miner_stats_worker.isRunning():
-                        self.miner_stats_worker._running = True
-                        self.miner_stats_worker.start()
-                        logger.info("MinerStatsWorker gestartet für API-Abfrage")
-                except Exception as e:
-                    logger.warning(f"MinerStatsWorker Start fehlgeschlagen: {e}")
+                self._start_miner_stats_worker()
                 
-                # Auto-Profit Tab aktualisieren
-                if hasattr(self, 'auto_profit_tab'):
-                    self.auto_profit_tab.set_current_coin(coin, config.get('profit_usd', 0))
+                # Dashboard, Statusleiste und Auto-Profit Tab in einem Rutsch (ein Repaint)
+                with _batched_updates(self):
+                    self.dashboard.coin_label.setText(coin)
+                    self.dashboard.start_btn.setEnabled(False)
+                    self.dashboard.stop_btn.setEnabled(True)
+                    self.status_bar.showMessage(f"Mining {coin} auf {config.get('pool_name', 'Pool')}")
+                    if self.auto_profit_tab:
+                        self.auto_profit_tab.set_current_coin(coin, config.get('profit_usd', 0))
                 
                 # Tray Icon aktualisieren
                 self.tray_icon.set_mining_state(True)
                 self.tray_icon.notify_miner_started(coin, config.get('pool_name', 'Pool'))
                 
-                # Nach 5 Sekunden prüfen ob Miner noch läuft (OHNE GUI zu blockieren!)
-                QTimer.singleShot(5000, lambda c=coin, m=miner: self._check_miner_running(c, m))
+                # Absturz meldet der MinerManager sofort (miner_crashed) -> nächster Coin
+                self._auto_switch_target = (coin, miner)
             else:
                 logger.error(f"Miner {miner} konnte nicht gestartet werden")
                 self._try_next_coin(coin, f"Miner {miner} nicht gefunden oder Fehler")
@@ -4501,10 +5771,13 @@ class MiningMainWindow(QMainWindow):
             logger.error(f"Auto-Switch Mining Fehler: {e}")
             self._try_next_coin(coin, str(e))
     
-    def _check_miner_running(self, coin: str, miner: str):
-        """Prüft ob der Miner noch läuft (wird verzögert aufgerufen)"""
-        if not self.miner_manager.is_mining():
-            logger.error(f"Miner {miner} ist nach Start abgestürzt!")
+    def _on_miner_crashed(self, returncode: int):
+        """Miner-Prozess unerwartet beendet - beim Auto-Switch zum nächsten Coin wechseln"""
+        self.logs_tab.append_log(f"❌ Miner unerwartet beendet (Exit-Code {returncode})")
+        if self._auto_switch_target and self._auto_switch_target[0] == self._current_coin:
+            coin, miner = self._auto_switch_target
+            self._auto_switch_target = None
+            logger.error(f"Miner {miner} ist abgestürzt!")
             self._try_next_coin(coin, f"Miner {miner} abgestürzt")
     
     def _try_next_coin(self, failed_coin: str, reason: str):
@@ -4512,22 +5785,21 @@ class MiningMainWindow(QMainWindow):
         logger.warning(f"Coin {failed_coin} fehlgeschlagen: {reason}")
         logger.info("Versuche nächsten profitablen Coin...")
         
-        # Blacklist für fehlgeschlagene Coins (verhindert Endlosschleife)
-        if not hasattr(self, '_failed_coins'):
-            self._failed_coins = set()
-        self._failed_coins.add(failed_coin)
+        # Blacklist für fehlgeschlagene Coins (verhindert Endlosschleife) - Sperre läuft pro Coin ab
+        self._failed_coins[failed_coin] = time.monotonic() + self.FAILED_COIN_COOLDOWN
         
         # Nächsten Coin aus Auto-Profit Tab holen
-        if hasattr(self, 'auto_profit_tab') and self.auto_profit_tab:
+        if self.auto_profit_tab:
             top_coins = self.auto_profit_tab.get_top_coins()
+            # Coins mit Wallet einmal für alle Kandidaten bestimmen statt pro Coin alle Quellen abzufragen
+            wallet_coins = self._available_wallet_coins()
             
             for coin_config in top_coins:
                 next_coin = coin_config.get('coin', '')
                 # Überspringe fehlgeschlagene Coins!
-                if next_coin and next_coin not in self._failed_coins:
+                if next_coin and not self._is_blacklisted(next_coin):
                     # Prüfen ob Wallet vorhanden
-                    wallet = self._get_wallet_for_coin(next_coin)
-                    if wallet:
+                    if next_coin.upper() in wallet_coins:
                         logger.info(f"Wechsle zu nächstem Coin: {next_coin}")
                         self.logs_tab.append_log(f"⚠️ {failed_coin} fehlgeschlagen: {reason}")
                         self.logs_tab.append_log(f"➡️ Wechsle zu {next_coin}")
@@ -4541,60 +5813,71 @@ class MiningMainWindow(QMainWindow):
         # Kein alternativer Coin gefunden
         logger.error("Kein alternativer Coin verfügbar!")
         self.logs_tab.append_log(f"❌ {failed_coin} fehlgeschlagen und kein Backup-Coin verfügbar")
-        self.logs_tab.append_log(f"⏳ Blacklist: {', '.join(self._failed_coins)}")
+        self.logs_tab.append_log(f"⏳ Blacklist: {', '.join(self.blacklisted_coins())}")
         self.status_bar.showMessage("Mining gestoppt - kein Coin verfügbar")
-        
-        # Blacklist nach 5 Minuten zurücksetzen
-        QTimer.singleShot(300000, self._clear_failed_coins)
     
-    def _clear_failed_coins(self):
-        """Setzt die Blacklist zurück"""
-        if hasattr(self, '_failed_coins'):
-            logger.info(f"Blacklist zurückgesetzt (war: {self._failed_coins})")
-            self._failed_coins.clear()
+    FAILED_COIN_COOLDOWN = 300.0  # Sekunden, die ein fehlgeschlagener Coin gesperrt bleibt
+    
+    def _is_blacklisted(self, coin: str) -> bool:
+        """Prüft die Sperre eines Coins - abgelaufene Einträge werden dabei entfernt"""
+        expiry = self._failed_coins.get(coin)
+        if expiry is None:
+            return False
+        if expiry > time.monotonic():
+            return True
+        del self._failed_coins[coin]
+        logger.info(f"{coin} von der Blacklist entfernt")
+        return False
+    
+    def blacklisted_coins(self) -> list:
+        """Alle aktuell gesperrten Coins"""
+        return [coin for coin in list(self._failed_coins) if self._is_blacklisted(coin)]
+    
+    # Fehler einer Wallet-Quelle (Datei/JSON, Börsen-API, fehlende Felder) - alles andere fliegt durch
+    _WALLET_RESOLVER_ERRORS = (OSError, ValueError, KeyError, AttributeError)
     
     def _get_wallet_for_coin(self, coin: str) -> str:
-        """Holt Wallet für einen Coin aus allen Quellen"""
-        wallet = ""
-        
-        # 1. Exchange Manager
-        try:
-            if hasattr(self, 'wallets_tab') and self.wallets_tab.exchange_manager:
-                wallet_obj = self.wallets_tab.exchange_manager.get_wallet_address(coin)
-                if wallet_obj:
-                    wallet = wallet_obj.address
-        except:
-            pass
-        
-        # 2. wallets.json
-        if not wallet:
-            try:
-                import json
-                from pathlib import Path
-                wallets_file = Path("wallets.json")
-                if wallets_file.exists():
-                    with open(wallets_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        wallets_data = data.get("wallets", {})
-                        if coin.upper() in wallets_data:
-                            wallet = wallets_data[coin.upper()]
-            except:
-                pass
-        
-        # 3. COIN_CONFIGS
-        if not wallet:
+        """Holt Wallet für einen Coin aus allen Quellen (erste Quelle mit Treffer gewinnt)"""
+        for resolver in self._wallet_resolvers:
             try:
-                from coin_config import COIN_CONFIGS
-                if coin in COIN_CONFIGS:
-                    wallet = COIN_CONFIGS[coin].get('wallet', '')
-            except:
-                pass
-        
-        # Memo von Wallet trennen (falls vorhanden)
-        if wallet and ' ' in wallet:
-            wallet = wallet.split(' ')[0]
-        
-        return wallet
+                wallet = resolver(coin)
+            except self._WALLET_RESOLVER_ERRORS as e:
+                logger.debug(f"Wallet-Quelle {resolver.__name__} für {coin} fehlgeschlagen: {e}")
+                continue
+            if wallet:
+                # Memo von Wallet trennen (falls vorhanden)
+                return wallet.partition(' ')[0]
+        return ""
+    
+    def _available_wallet_coins(self) -> set:
+        """Alle Coins (groß geschrieben) mit Wallet in einer der Quellen - ohne Börsen-Abfragen"""
+        coins = set()
+        exchange_manager = self.wallets_tab.exchange_manager
+        if exchange_manager:
+            coins.update(coin.upper() for coin, wallet_obj in exchange_manager.wallets.items() if wallet_obj)
+        try:
+            coins.update(coin.upper() for coin, value in _load_wallets_json().get("wallets", {}).items()
+                         if _is_valid_wallet_address(_wallet_address(value)))
+        except self._WALLET_RESOLVER_ERRORS as e:
+            logger.debug(f"wallets.json nicht lesbar: {e}")
+        coins.update(coin.upper() for coin, config in COIN_CONFIGS.items() if config.get('wallet'))
+        return coins
+    
+    def _wallet_from_exchange(self, coin: str) -> str:
+        """Wallet-Quelle 1: Exchange Manager"""
+        exchange_manager = self.wallets_tab.exchange_manager
+        if not exchange_manager:
+            return ""
+        wallet_obj = exchange_manager.get_wallet_address(coin)
+        return wallet_obj.address if wallet_obj else ""
+    
+    def _wallet_from_json(self, coin: str) -> str:
+        """Wallet-Quelle 2: wallets.json (gecacht, wichtig für Gate.io Wallets!)"""
+        return _wallet_address(_load_wallets_json().get("wallets", {}).get(coin.upper(), ""))
+    
+    def _wallet_from_configs(self, coin: str) -> str:
+        """Wallet-Quelle 3: COIN_CONFIGS"""
+        return COIN_CONFIGS[coin].get('wallet', '') if coin in COIN_CONFIGS else ""
     
     def _on_dashboard_oc_changed(self, button):
         """Handler für Dashboard OC-Profile Buttons"""
@@ -4613,7 +5896,7 @@ class MiningMainWindow(QMainWindow):
                 self.status_bar.showMessage(f"OC-Profile '{profile.upper()}' angewendet", 3000)
             
             # Multi-GPU Tab synchronisieren falls vorhanden
-            if hasattr(self, 'multi_gpu_tab') and self.multi_gpu_tab:
+            if self.multi_gpu_tab:
                 # Profile in Cards aktualisieren
                 pass  # Cards haben eigene OC-Buttons
             
@@ -4646,18 +5929,20 @@ class MiningMainWindow(QMainWindow):
     
     def quit_app(self):
         """Beendet Anwendung sauber"""
-        # Mining stoppen
-        self.stop_mining()
+        # Mining stoppen (inkl. noch laufendem MSI-Afterburner-Worker)
+        self.stop_mining(wait=True)
+        if self._oc_worker:
+            self._oc_worker.wait()
         
         # Multi-GPU Mining stoppen (NEU! V12.8)
-        if MULTI_GPU_AVAILABLE and hasattr(self, 'multi_gpu_tab') and self.multi_gpu_tab:
+        if MULTI_GPU_AVAILABLE and self.multi_gpu_tab:
             try:
                 self.multi_gpu_tab.cleanup()
             except:
                 pass
         
         # Portfolio stoppen (NEU! V12.8)
-        if PORTFOLIO_AVAILABLE and hasattr(self, 'portfolio_tab') and self.portfolio_tab:
+        if PORTFOLIO_AVAILABLE and self.portfolio_tab:
             try:
                 self.portfolio_tab.stop_monitoring()
             except:
@@ -4667,12 +5952,18 @@ class MiningMainWindow(QMainWindow):
         if hasattr(self, '_log_timer'):
             self._log_timer.stop()
         
+        # Ausstehende Favoriten noch schreiben
+        if hasattr(self, 'wallets_tab'):
+            self.wallets_tab.flush_coin_favorites()
+        
         # Alle Miner-Prozesse killen (Sicherheit)
         self.miner_manager.kill_all_miners()
         
         # Workers stoppen
         self.monitor_worker.stop()
-        self.miner_stats_worker._running = False
+        self.miner_stats_worker.stop()
+        for worker in self._retired_stats_workers:
+            worker.wait(2000)
         
         # GPU Monitor stoppen
         self.gpu_monitor.stop()
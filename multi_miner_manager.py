@@ -22,12 +22,21 @@ import logging
 import subprocess
 import threading
 import signal
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any, Callable
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
 
+# requests für Miner-API Stats (optional - ohne keine Stats, Mining läuft trotzdem)
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    requests = None
+    REQUESTS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -171,6 +180,11 @@ class MultiMinerManager:
         self._monitor_thread: Optional[threading.Thread] = None
         self._running = False
         
+        # Stats-Abruf: eine HTTP-Session (Keep-Alive) + paralleler Abruf - gehören dem
+        # Monitor-Thread (in _monitor_loop erstellt und geschlossen)
+        self._http = None
+        self._stats_pool: Optional[ThreadPoolExecutor] = None
+        
         # Callbacks
         self.on_miner_started: Optional[Callable[[int, GPUMinerConfig], None]] = None
         self.on_miner_stopped: Optional[Callable[[int, str], None]] = None
@@ -571,14 +585,23 @@ class MultiMinerManager:
     
     def _monitor_loop(self, interval: float):
         """Monitoring-Loop: Prüft Miner-Status und holt Stats"""
-        while self._running:
-            try:
-                self._check_miners()
-                self._fetch_all_stats()
-            except Exception as e:
-                logger.error(f"Monitor-Fehler: {e}")
-            
-            time.sleep(interval)
+        # Lokal merken: nach stop/start-Folge schließt jeder Thread nur seine eigenen Ressourcen
+        http = requests.Session() if REQUESTS_AVAILABLE else None
+        stats_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="MinerStats")
+        self._http, self._stats_pool = http, stats_pool
+        try:
+            while self._running:
+                try:
+                    self._check_miners()
+                    self._fetch_all_stats()
+                except Exception as e:
+                    logger.error(f"Monitor-Fehler: {e}")
+                
+                time.sleep(interval)
+        finally:
+            stats_pool.shutdown(wait=True)
+            if http:
+                http.close()
     
     def _check_miners(self):
         """Prüft ob alle Miner noch laufen"""
@@ -598,35 +621,50 @@ class MultiMinerManager:
     
     def _fetch_all_stats(self):
         """Holt Stats von allen laufenden Minern"""
-        try:
-            import requests
-        except ImportError:
+        if not REQUESTS_AVAILABLE:
             return
         
         with self._lock:
             miners = [(idx, status) for idx, status in self._gpu_miners.items() if status.is_running]
         
+        if not miners:
+            return
+        
+        tasks = []
         for gpu_idx, status in miners:
-            try:
-                api_port = self.get_api_port(gpu_idx)
-                url = f"http://127.0.0.1:{api_port}"
-                
-                # Miner-spezifische API
-                if status.config.miner_type == MinerType.TREX:
-                    url = f"{url}/summary"
-                elif status.config.miner_type == MinerType.LOLMINER:
-                    pass  # Root endpoint
+            api_port = self.get_api_port(gpu_idx)
+            url = f"http://127.0.0.1:{api_port}"
+            
+            # Miner-spezifische API
+            if status.config.miner_type == MinerType.TREX:
+                url = f"{url}/summary"
+            elif status.config.miner_type == MinerType.LOLMINER:
+                pass  # Root endpoint
+            
+            tasks.append((gpu_idx, status, url))
+        
+        # Alle Miner gleichzeitig abfragen - Dauer ~1 Anfrage statt Summe aller Timeouts.
+        # Den ersten erledigt der Monitor-Thread selbst (bei nur einem Miner kein Pool-Thread nötig)
+        first, *rest = tasks
+        futures = [self._stats_pool.submit(self._fetch_one, task) for task in rest]
+        self._fetch_one(first)
+        for future in futures:
+            future.result()
+    
+    def _fetch_one(self, task: Tuple[int, GPUMinerStatus, str]):
+        """Holt Stats eines Miners (Monitor-Thread oder Stats-Pool)"""
+        gpu_idx, status, url = task
+        try:
+            response = self._http.get(url, timeout=2)
+            if response.status_code == 200:
+                data = response.json()
+                self._parse_stats(gpu_idx, status, data)
                 
-                response = requests.get(url, timeout=2)
-                if response.status_code == 200:
-                    data = response.json()
-                    self._parse_stats(gpu_idx, status, data)
+                if self.on_stats_update:
+                    self.on_stats_update(gpu_idx, status)
                     
-                    if self.on_stats_update:
-                        self.on_stats_update(gpu_idx, status)
-                        
-            except Exception as e:
-                logger.debug(f"GPU {gpu_idx}: Stats-Abruf fehlgeschlagen: {e}")
+        except Exception as e:
+            logger.debug(f"GPU {gpu_idx}: Stats-Abruf fehlgeschlagen: {e}")
     
     def _parse_stats(self, gpu_idx: int, status: GPUMinerStatus, data: dict):
         """Parst Miner-API Response"""
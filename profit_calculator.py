@@ -11,7 +11,7 @@ import json
 import logging
 import requests
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -42,6 +42,14 @@ class CoinProfit:
     last_update: datetime
 
 
+class ProfitResult(NamedTuple):
+    """Ergebnis von calculate_profit - Attributzugriff statt Dict-Lookup im GUI-Takt"""
+    usd_profit_24h: float  # = Revenue (KEIN Stromabzug!)
+    usd_revenue_24h: float
+    power_cost_24h: float  # nur Info
+    raw: Optional[Dict] = None  # restliche Details (algorithm, hashrate, btc_price, ...)
+
+
 class ProfitCalculator:
     """Berechnet Mining-Profit für verschiedene Coins - GPU-SPEZIFISCH!"""
     
@@ -307,7 +315,7 @@ class ProfitCalculator:
         return 97000  # Fallback
     
     def calculate_profit(self, coin: str, hashrate: float = None, power_watts: float = 0, 
-                        power_cost: float = 0.0) -> Optional[Dict]:
+                        power_cost: float = 0.0) -> Optional[ProfitResult]:
         """
         Berechnet Revenue für einen Coin - OHNE Stromkosten!
         
@@ -315,10 +323,10 @@ class ProfitCalculator:
             coin: Coin-Ticker (z.B. "RVN")
             hashrate: Hashrate (None = GPU-spezifisch aus Datenbank)
             power_watts: Stromverbrauch (nur für Info, NICHT abgezogen)
-            power_cost: IGNORIERT - Wir zeigen NUR Revenue!
+            power_cost: Strompreis $/kWh - nur für power_cost_24h, NICHT abgezogen!
         
         Returns:
-            Dict mit revenue pro Tag (KEIN Stromabzug!)
+            ProfitResult mit Revenue pro Tag (KEIN Stromabzug!), Details in .raw
         """
         # Daten abrufen wenn nötig
         if self._should_refresh():
@@ -397,22 +405,26 @@ class ProfitCalculator:
         
         # Stromverbrauch nur für Info (NICHT abgezogen!)
         kwh_per_day = (power_watts * 24) / 1000
+        usd_revenue_24h = round(usd_revenue_24h, 4)
         
         # NUR Revenue zeigen - KEIN Stromabzug!
-        return {
-            "coin": coin.upper(),
-            "algorithm": algo,
-            "hashrate": hashrate,
-            "hashrate_unit": gpu_stats["unit"] if gpu_stats else "MH/s",
-            "power_watts": power_watts,
-            "btc_revenue_24h": btc_revenue_24h,
-            "usd_revenue_24h": round(usd_revenue_24h, 4),
-            "kwh_per_day": round(kwh_per_day, 2),
-            "usd_profit_24h": round(usd_revenue_24h, 4),  # = Revenue (KEIN Stromabzug!)
-            "exchange_rate": coin_data.get("exchange_rate", 0),
-            "btc_price": btc_price,
-            "difficulty": coin_data.get("difficulty", 0),
-        }
+        return ProfitResult(
+            usd_profit_24h=usd_revenue_24h,
+            usd_revenue_24h=usd_revenue_24h,
+            power_cost_24h=round(kwh_per_day * power_cost, 4),
+            raw={
+                "coin": coin.upper(),
+                "algorithm": algo,
+                "hashrate": hashrate,
+                "hashrate_unit": gpu_stats["unit"] if gpu_stats else "MH/s",
+                "power_watts": power_watts,
+                "btc_revenue_24h": btc_revenue_24h,
+                "kwh_per_day": round(kwh_per_day, 2),
+                "exchange_rate": coin_data.get("exchange_rate", 0),
+                "btc_price": btc_price,
+                "difficulty": coin_data.get("difficulty", 0),
+            },
+        )
     
     def get_most_profitable(self, coins: List[str] = None,
                                limit: int = 20) -> List[Dict]:
@@ -569,9 +581,9 @@ if __name__ == "__main__":
     print("\n=== RVN REVENUE ===")
     result = calc.calculate_profit("RVN")
     if result:
-        print(f"  Revenue: ${result['usd_revenue_24h']:.4f}/Tag")
-        print(f"  Stromkosten: ${result['power_cost_24h']:.4f}/Tag")
-        print(f"  Profit: ${result['usd_profit_24h']:.4f}/Tag")
+        print(f"  Revenue: ${result.usd_revenue_24h:.4f}/Tag")
+        print(f"  Stromkosten: ${result.power_cost_24h:.4f}/Tag")
+        print(f"  Profit: ${result.usd_profit_24h:.4f}/Tag")
     
     # Test: Profitabelste Coins
     print("\n=== TOP 5 PROFITABEL ===")